@@ -15,10 +15,14 @@ Run with: python examples/database_demo.py
 """
 
 import asyncio
+import builtins
+import functools
+import io
 import os
 import sys
 import tempfile
 from pathlib import Path
+from typing import TextIO
 
 # Add parent directory to path to import src modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -29,49 +33,46 @@ from src.database.base import (
     NodeNotFoundError,
     ValidationError
 )
+from src.utils import async_rmtree
 
 
-async def demo_networkx_adapter():
+async def demo_networkx_adapter(out: TextIO, data_file: str):
     """Demonstrate NetworkX adapter capabilities."""
+    print = functools.partial(builtins.print, file=out)
     print("\n" + "="*50)
     print("🔗 NetworkX Adapter Demo")
     print("="*50)
     
-    # Create temporary file path (but not the file itself)
-    temp_dir = tempfile.mkdtemp()
-    data_file = os.path.join(temp_dir, 'demo_graph.json')
+    # Configure NetworkX adapter
+    config = {
+        "data_file": data_file,
+        "auto_save": True,
+        "auto_save_debounce_ms": 50,
+        "backup_count": 2
+    }
+    
+    db = create_database("networkx", config)
+    await db.connect()
     
     try:
-        # Configure NetworkX adapter
-        config = {
-            "data_file": data_file,
-            "auto_save": True,
-            "backup_count": 2
-        }
+        print(f"✅ Connected to NetworkX database at: {data_file}")
         
-        db = create_database("networkx", config)
-        await db.connect()
+        # Test health check
+        healthy = await db.health_check()
+        print(f"📊 Health check: {'PASS' if healthy else 'FAIL'}")
         
-        try:
-            print(f"✅ Connected to NetworkX database at: {data_file}")
-            
-            # Test health check
-            healthy = await db.health_check()
-            print(f"📊 Health check: {'PASS' if healthy else 'FAIL'}")
-            
-            # Create nodes
-            print("\n📝 Creating nodes...")
-            
-            rule_id = await db.create_node("Rule", {
+        # Create nodes
+        print("\n📝 Creating nodes...")
+        
+        rule_id, learnt_id = await db.create_nodes([
+            ("Rule", {
                 "name": "react_performance",
                 "category": "frontend",
                 "content": "Use React.memo() for expensive components",
                 "priority": "high",
                 "tags": ["react", "performance", "optimization"]
-            })
-            print(f"   Created Rule: {rule_id}")
-            
-            learnt_id = await db.create_node("Learnt", {
+            }),
+            ("Learnt", {
                 "problem": "Slow React app with many re-renders",
                 "solution": "Wrapped expensive components with React.memo",
                 "context": "E-commerce product listing page",
@@ -79,75 +80,70 @@ async def demo_networkx_adapter():
                 "confidence": 0.95,
                 "performance_gain": "60% render time reduction"
             })
-            print(f"   Created Learnt: {learnt_id}")
-            
-            # Create relationship
-            print("\n🔗 Creating relationships...")
-            rel_id = await db.create_relationship(
-                rule_id, learnt_id,
-                "VALIDATES",
-                {
-                    "strength": 0.9,
-                    "evidence": "Real-world performance improvement",
-                    "date_validated": "2025-01-18"
-                }
-            )
-            print(f"   Created relationship: {rel_id}")
-            
-            # Query operations
-            print("\n🔍 Querying data...")
-            
-            # Get specific node
-            retrieved_rule = await db.get_node(rule_id)
-            print(f"   Retrieved rule: {retrieved_rule['name']}")
-            
-            # Get nodes by label
-            all_rules = await db.get_nodes_by_label("Rule")
-            print(f"   Total rules: {len(all_rules)}")
-            
-            # Get nodes with filters
-            frontend_rules = await db.get_nodes_by_label("Rule", 
-                filters={"category": "frontend"}
-            )
-            print(f"   Frontend rules: {len(frontend_rules)}")
-            
-            # Get relationships
-            relationships = await db.get_relationships(rule_id)
-            print(f"   Rule relationships: {len(relationships)}")
-            
-            # Update node
-            print("\n✏️  Updating node...")
-            updated = await db.update_node(rule_id, {
-                "last_verified": "2025-01-18",
-                "usage_count": 42
-            })
-            print(f"   Update successful: {updated}")
-            
-            # NetworkX-specific feature
-            if hasattr(db, 'get_graph_stats'):
-                stats = db.get_graph_stats()
-                print(f"\n📈 Graph statistics:")
-                print(f"   Nodes: {stats['node_count']}")
-                print(f"   Edges: {stats['edge_count']}")
-                print(f"   Connected: {stats['is_connected']}")
-                print(f"   Avg degree: {stats['average_degree']:.2f}")
-            
-            print("\n✅ NetworkX demo completed successfully!")
-            
-        finally:
-            await db.disconnect()
-            
+        ])
+        print(f"   Created Rule: {rule_id}")
+        print(f"   Created Learnt: {learnt_id}")
+        
+        # Create relationship
+        print("\n🔗 Creating relationships...")
+        rel_id = await db.create_relationship(
+            rule_id, learnt_id,
+            "VALIDATES",
+            {
+                "strength": 0.9,
+                "evidence": "Real-world performance improvement",
+                "date_validated": "2025-01-18"
+            }
+        )
+        print(f"   Created relationship: {rel_id}")
+        
+        # Query operations
+        print("\n🔍 Querying data...")
+        
+        # Get specific node
+        retrieved_rule = await db.get_node(rule_id)
+        print(f"   Retrieved rule: {retrieved_rule['name']}")
+        
+        # Get nodes by label
+        all_rules = await db.get_nodes_by_label("Rule")
+        print(f"   Total rules: {len(all_rules)}")
+        
+        # Get nodes with filters
+        frontend_rules = await db.get_nodes_by_label("Rule", 
+            filters={"category": "frontend"}
+        )
+        print(f"   Frontend rules: {len(frontend_rules)}")
+        
+        # Get relationships
+        relationships = await db.get_relationships(rule_id)
+        print(f"   Rule relationships: {len(relationships)}")
+        
+        # Update node
+        print("\n✏️  Updating node...")
+        updated = await db.update_node(rule_id, {
+            "last_verified": "2025-01-18",
+            "usage_count": 42
+        })
+        print(f"   Update successful: {updated}")
+        
+        # NetworkX-specific feature
+        if hasattr(db, 'get_graph_stats'):
+            stats = db.get_graph_stats()
+            print(f"\n📈 Graph statistics:")
+            print(f"   Nodes: {stats['node_count']}")
+            print(f"   Edges: {stats['edge_count']}")
+            print(f"   Connected: {stats['is_connected']}")
+            print(f"   Avg degree: {stats['average_degree']:.2f}")
+        
+        print("\n✅ NetworkX demo completed successfully!")
+        
     finally:
-        # Clean up temporary directory
-        try:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except Exception:
-            pass
+        await db.disconnect()
 
 
-async def demo_neo4j_adapter():
+async def demo_neo4j_adapter(out: TextIO):
     """Demonstrate Neo4j adapter capabilities (mock for demo)."""
+    print = functools.partial(builtins.print, file=out)
     print("\n" + "="*50)
     print("🛢️  Neo4j Adapter Demo")
     print("="*50)
@@ -173,70 +169,61 @@ async def demo_neo4j_adapter():
         print("   4. Benefit from ACID compliance and clustering")
         
         # Show the same interface is available
-        print(f"\n📋 Available methods: {[m for m in dir(db) if not m.startswith('_') and callable(getattr(db, m))]}")
+        print(f"\n📋 Available methods: {list(db.public_methods())}")
         
     except Exception as e:
         print(f"⚠️  Neo4j configuration error (expected): {e}")
 
 
-async def demo_error_handling():
+async def demo_error_handling(out: TextIO, data_file: str):
     """Demonstrate proper error handling patterns."""
+    print = functools.partial(builtins.print, file=out)
     print("\n" + "="*50)
     print("⚠️  Error Handling Demo")
     print("="*50)
     
-    temp_dir = tempfile.mkdtemp()
-    data_file = os.path.join(temp_dir, 'error_demo.json')
+    db = create_database("networkx", {"data_file": data_file})
+    await db.connect()
     
     try:
-        db = create_database("networkx", {"data_file": data_file})
-        await db.connect()
+        # 1. Handling non-existent nodes
+        print("🔍 Testing node not found...")
+        non_existent = await db.get_node("non_existent_id")
+        print(f"   Non-existent node result: {non_existent}")  # Should be None
         
+        # 2. Validation errors
+        print("\n❌ Testing validation errors...")
         try:
-            # 1. Handling non-existent nodes
-            print("🔍 Testing node not found...")
-            non_existent = await db.get_node("non_existent_id")
-            print(f"   Non-existent node result: {non_existent}")  # Should be None
-            
-            # 2. Validation errors
-            print("\n❌ Testing validation errors...")
-            try:
-                await db.create_node("Rule", {})  # Empty properties might be invalid
-                print("   Empty properties accepted")
-            except ValidationError as e:
-                print(f"   Validation error caught: {e}")
-            
-            # 3. Invalid operations
-            print("\n🚫 Testing invalid operations...")
-            try:
-                deleted = await db.delete_node("definitely_not_exists")
-                print(f"   Delete non-existent node result: {deleted}")  # Should be False
-            except Exception as e:
-                print(f"   Error during delete: {e}")
-            
-            # 4. Database connection issues
-            print("\n🔌 Testing disconnected operations...")
-            await db.disconnect()
-            try:
-                await db.create_node("Rule", {"name": "test"})
-            except DatabaseConnectionError as e:
-                print(f"   Connection error caught: {e}")
-            
-            print("\n✅ Error handling demo completed!")
-            
+            await db.create_node("Rule", {})  # Empty properties might be invalid
+            print("   Empty properties accepted")
+        except ValidationError as e:
+            print(f"   Validation error caught: {e}")
+        
+        # 3. Invalid operations
+        print("\n🚫 Testing invalid operations...")
+        try:
+            deleted = await db.delete_node("definitely_not_exists")
+            print(f"   Delete non-existent node result: {deleted}")  # Should be False
         except Exception as e:
-            print(f"Unexpected error: {e}")
-            
-    finally:
+            print(f"   Error during delete: {e}")
+        
+        # 4. Database connection issues
+        print("\n🔌 Testing disconnected operations...")
+        await db.disconnect()
         try:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except Exception:
-            pass
+            await db.create_node("Rule", {"name": "test"})
+        except DatabaseConnectionError as e:
+            print(f"   Connection error caught: {e}")
+        
+        print("\n✅ Error handling demo completed!")
+        
+    except Exception as e:
+        print(f"Unexpected error: {e}")
 
 
-async def demo_adapter_switching():
+async def demo_adapter_switching(out: TextIO, data_file: str):
     """Demonstrate seamless adapter switching."""
+    print = functools.partial(builtins.print, file=out)
     print("\n" + "="*50)
     print("🔄 Adapter Switching Demo")
     print("="*50)
@@ -259,39 +246,45 @@ async def demo_adapter_switching():
             await db.disconnect()
     
     # Test with NetworkX
-    temp_dir = tempfile.mkdtemp()
-    networkx_file = os.path.join(temp_dir, 'switch_demo.json')
+    print("📊 Using NetworkX adapter...")
+    networkx_db = create_database("networkx", {"data_file": data_file})
+    await store_knowledge(networkx_db, "NetworkX")
     
-    try:
-        print("📊 Using NetworkX adapter...")
-        networkx_db = create_database("networkx", {"data_file": networkx_file})
-        await store_knowledge(networkx_db, "NetworkX")
-        
-        print("\n🛢️  Would use Neo4j adapter with same code...")
-        print("   (Skipped to avoid Neo4j dependency)")
-        
-        print("\n✅ Same interface works with both adapters!")
-        
-    finally:
-        try:
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except Exception:
-            pass
+    print("\n🛢️  Would use Neo4j adapter with same code...")
+    print("   (Skipped to avoid Neo4j dependency)")
+    
+    print("\n✅ Same interface works with both adapters!")
 
 
 async def main():
     """Run all database demonstrations."""
+    # Collect the whole report and write it to stdout in one go
+    out = io.StringIO()
+    print = functools.partial(builtins.print, file=out)
     print("🎯 Final Minimal Lean Graph Database MCP")
     print("Database Interface Demonstration")
     print("="*60)
     
+    # One temporary root directory shared by all demos, removed once at the end
+    root = tempfile.mkdtemp()
+    
     try:
-        # Run all demos
-        await demo_networkx_adapter()
-        await demo_neo4j_adapter()
-        await demo_error_handling()
-        await demo_adapter_switching()
+        # Run all demos concurrently, each printing into its own buffer so
+        # the output is collected in order once they have finished
+        buffers = [io.StringIO() for _ in range(4)]
+        results = await asyncio.gather(
+            demo_networkx_adapter(buffers[0], os.path.join(root, "demo_graph.json")),
+            demo_neo4j_adapter(buffers[1]),
+            demo_error_handling(buffers[2], os.path.join(root, "error_demo.json")),
+            demo_adapter_switching(buffers[3], os.path.join(root, "switch_demo.json")),
+            return_exceptions=True
+        )
+        for buffer in buffers:
+            out.write(buffer.getvalue())
+        
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         
         print("\n" + "="*60)
         print("🎉 All demonstrations completed successfully!")
@@ -305,8 +298,27 @@ async def main():
     except Exception as e:
         print(f"\n❌ Demo failed with error: {e}")
         raise
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+        await async_rmtree(root)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's faster event loop when it is available."""
+    if sys.platform == "win32":
+        return False
+    
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 if __name__ == "__main__":
     # Run the demo
+    install_uvloop()
     asyncio.run(main()) 
\ No newline at end of file
@@ -10,13 +10,18 @@ This module provides centralized configuration management including:
 """
 
 import os
+import sys
+import asyncio
 import logging
-from typing import Dict, Any, Optional, Union
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, Optional, Union
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Import database components
-from .database import create_database, GraphDatabase, DatabaseConnectionError, ValidationError
+from .database import create_database, resolve_adapter_class, GraphDatabase, DatabaseConnectionError, ValidationError
 from .models.rule import RuleCategory, RuleType
 from .models.learnt import ErrorType, SeverityLevel
 
@@ -28,11 +33,99 @@ from .models.learnt import ErrorType, SeverityLevel
 # Load environment variables from .env file
 load_dotenv()
 
+# Values treated as true for boolean settings
+_TRUTHY_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_bool(raw: str) -> bool:
+    """Parse a raw environment value as a boolean (memoized per value)."""
+    return raw.strip().lower() in _TRUTHY_VALUES
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_int(raw: str) -> int:
+    """Parse a raw environment value as an integer (memoized per value)."""
+    return int(raw)
+
+
+def _get_str(key: str, default: str) -> str:
+    """Get a string setting from the environment."""
+    return os.environ.get(key, default)
+
+
+def _get_bool(key: str, default: bool) -> bool:
+    """Get a boolean setting from the environment."""
+    raw = os.environ.get(key)
+    return default if raw is None else _parse_bool(raw)
+
+
+def _get_int(key: str, default: int) -> int:
+    """Get an integer setting from the environment."""
+    raw = os.environ.get(key)
+    return default if raw is None else _parse_int(raw)
+
+
+# Absolute paths of directories already created by this process
+_created_dirs: set = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory and its parents, at most once per process."""
+    if not path:
+        return
+    abs_path = os.path.abspath(path)
+    if abs_path in _created_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _created_dirs.add(abs_path)
+
 
 # ================================
 # Configuration Classes
 # ================================
 
+@functools.lru_cache(maxsize=None)
+def _normalize_db_type(raw_db_type: str) -> str:
+    """
+    Normalize and validate a raw GRAPH_DB_TYPE value.
+    
+    Results are memoized per raw value, so repeated lookups with an
+    unchanged environment skip the string processing and validation.
+    """
+    db_type = raw_db_type.lower().strip()
+    
+    if db_type not in ['neo4j', 'networkx']:
+        raise ValueError(f"Invalid GRAPH_DB_TYPE '{db_type}'. Must be 'neo4j' or 'networkx'")
+    
+    return db_type
+
+
+# Expected setting types per database type, checked by validate_shape()
+_DATABASE_SETTING_TYPES: Dict[str, Dict[str, type]] = {
+    "neo4j": {
+        "uri": str,
+        "username": str,
+        "password": str,
+        "timeout": int,
+        "max_pool_size": int,
+        "pool_warmup": int
+    },
+    "networkx": {
+        "data_file": str,
+        "enable_backup": bool,
+        "backup_count": int,
+        "backup_interval_seconds": int,
+        "auto_save": bool,
+        "auto_save_debounce_ms": int,
+        "auto_save_max_pending": int,
+        "journal": bool,
+        "journal_max_bytes": int,
+        "read_optimized": bool
+    }
+}
+
+
 class DatabaseConfig:
     """Database configuration management."""
     
@@ -48,12 +141,7 @@ class DatabaseConfig:
         Returns:
             str: Database type ('neo4j' or 'networkx')
         """
-        db_type = os.getenv('GRAPH_DB_TYPE', 'networkx').lower().strip()
-        
-        if db_type not in ['neo4j', 'networkx']:
-            raise ValueError(f"Invalid GRAPH_DB_TYPE '{db_type}'. Must be 'neo4j' or 'networkx'")
-        
-        return db_type
+        return _normalize_db_type(_get_str("GRAPH_DB_TYPE", "networkx"))
     
     def _get_database_config(self) -> Dict[str, Any]:
         """
@@ -67,11 +155,13 @@ class DatabaseConfig:
         """
         if self.db_type == "neo4j":
             config = {
-                "uri": os.getenv("NEO4J_URI", "bolt://localhost:7687"),
-                "username": os.getenv("NEO4J_USER", "neo4j"),  # Changed from 'user' to 'username'
-                "password": os.getenv("NEO4J_PASSWORD", "password"),
-                "timeout": int(os.getenv("DATABASE_TIMEOUT", "30")),
-                "max_pool_size": int(os.getenv("MAX_CONNECTION_POOL_SIZE", "10"))
+                "uri": _get_str("NEO4J_URI", "bolt://localhost:7687"),
+                "username": _get_str("NEO4J_USER", "neo4j"),  # Changed from 'user' to 'username'
+                "password": _get_str("NEO4J_PASSWORD", "password"),
+                "timeout": _get_int("DATABASE_TIMEOUT", 30),
+                "max_pool_size": _get_int("MAX_CONNECTION_POOL_SIZE", 10),
+                "pool_warmup": _get_int("POOL_WARMUP", _get_int("MAX_CONNECTION_POOL_SIZE", 10)),
+                "ensure_constraints": _get_bool("NEO4J_ENSURE_CONSTRAINTS", True)
             }
             
             # Validate required Neo4j settings
@@ -82,19 +172,46 @@ class DatabaseConfig:
                 
         elif self.db_type == "networkx":
             config = {
-                "data_file": os.getenv("NETWORKX_DATA_FILE", "data/graph_data.json"),
-                "enable_backup": os.getenv("ENABLE_BACKUP", "true").lower() == "true",
-                "backup_count": int(os.getenv("BACKUP_COUNT", "5")),
-                "auto_save": os.getenv("AUTO_SAVE", "true").lower() == "true"
+                "data_file": _get_str("NETWORKX_DATA_FILE", "data/graph_data.json"),
+                "enable_backup": _get_bool("ENABLE_BACKUP", True),
+                "backup_count": _get_int("BACKUP_COUNT", 5),
+                "backup_interval_seconds": _get_int("BACKUP_INTERVAL_SECONDS", 0),
+                "auto_save": _get_bool("AUTO_SAVE", True),
+                "auto_save_debounce_ms": _get_int("AUTO_SAVE_DEBOUNCE_MS", 0),
+                "auto_save_max_pending": _get_int("AUTO_SAVE_MAX_PENDING", 0),
+                "journal": _get_bool("JOURNAL", False),
+                "journal_max_bytes": _get_int("JOURNAL_MAX_BYTES", 16 * 1024 * 1024),
+                "read_optimized": _get_bool("READ_OPTIMIZED", False)
             }
             
             # Ensure data directory exists
-            data_dir = os.path.dirname(config["data_file"])
-            if data_dir and not os.path.exists(data_dir):
-                os.makedirs(data_dir, exist_ok=True)
+            _ensure_dir(os.path.dirname(config["data_file"]))
+        
+        # Read-through cache settings for the adapter; caching is opt-in because
+        # writes made by other processes are not seen until entries expire
+        config["cache_ttl"] = _get_int("CACHE_TTL", 3600) if _get_bool("ENABLE_CACHING", False) else None
+        config["cache_maxsize"] = _get_int("CACHE_MAXSIZE", 10000)
         
         return config
     
+    def validate_shape(self) -> None:
+        """
+        Check that the database settings have the expected keys and types.
+        
+        Unlike get_db_adapter(), this doesn't construct an adapter.
+        
+        Raises:
+            ValueError: If a setting is missing or has the wrong type
+        """
+        for key, expected_type in _DATABASE_SETTING_TYPES[self.db_type].items():
+            if key not in self.config:
+                raise ValueError(f"Missing database setting: {key}")
+            if not isinstance(self.config[key], expected_type):
+                raise ValueError(
+                    f"Invalid database setting {key}: expected {expected_type.__name__}, "
+                    f"got {type(self.config[key]).__name__}"
+                )
+    
     def get_db_adapter(self) -> GraphDatabase:
         """
         Factory function to return the appropriate database adapter.
@@ -113,20 +230,20 @@ class ServerConfig:
     """Server configuration management."""
     
     def __init__(self):
-        self.host = os.getenv("MCP_SERVER_HOST", "localhost")
-        self.port = int(os.getenv("MCP_SERVER_PORT", "8000"))
-        self.debug = os.getenv("DEBUG", "false").lower() == "true"
-        self.environment = os.getenv("ENVIRONMENT", "development")
+        self.host = _get_str("MCP_SERVER_HOST", "localhost")
+        self.port = _get_int("MCP_SERVER_PORT", 8000)
+        self.debug = _get_bool("DEBUG", False)
+        self.environment = _get_str("ENVIRONMENT", "development")
         
         # CORS settings
         self.cors_origins = self._parse_cors_origins()
-        self.cors_credentials = os.getenv("CORS_ALLOW_CREDENTIALS", "true").lower() == "true"
+        self.cors_credentials = _get_bool("CORS_ALLOW_CREDENTIALS", True)
         self.cors_methods = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
         self.cors_headers = ["*"]
     
     def _parse_cors_origins(self) -> list:
         """Parse CORS origins from environment variable."""
-        origins_str = os.getenv("CORS_ORIGINS", "*")
+        origins_str = _get_str("CORS_ORIGINS", "*")
         if origins_str == "*":
             return ["*"]
         return [origin.strip() for origin in origins_str.split(",") if origin.strip()]
@@ -136,14 +253,12 @@ class LoggingConfig:
     """Logging configuration management."""
     
     def __init__(self):
-        self.level = os.getenv("LOG_LEVEL", "INFO").upper()
-        self.log_file = os.getenv("LOG_FILE", "logs/mcp-server.log")
+        self.level = _get_str("LOG_LEVEL", "INFO").upper()
+        self.log_file = _get_str("LOG_FILE", "logs/mcp-server.log")
         self.format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         
         # Ensure logs directory exists
-        log_dir = os.path.dirname(self.log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
+        _ensure_dir(os.path.dirname(self.log_file))
     
     def configure_logging(self):
         """Configure Python logging."""
@@ -161,10 +276,31 @@ class PerformanceConfig:
     """Performance and caching configuration."""
     
     def __init__(self):
-        self.enable_caching = os.getenv("ENABLE_CACHING", "true").lower() == "true"
-        self.cache_ttl = int(os.getenv("CACHE_TTL", "3600"))
-        self.max_workers = int(os.getenv("MAX_WORKERS", "4"))
-        self.request_timeout = int(os.getenv("REQUEST_TIMEOUT", "30"))
+        self.enable_caching = _get_bool("ENABLE_CACHING", False)
+        self.cache_ttl = _get_int("CACHE_TTL", 3600)
+        self.cache_maxsize = _get_int("CACHE_MAXSIZE", 10000)
+        self.max_workers = _get_int("MAX_WORKERS", 4)
+        self.request_timeout = _get_int("REQUEST_TIMEOUT", 30)
+        self.use_uvloop = _get_bool("USE_UVLOOP", False)
+    
+    def configure_event_loop(self) -> bool:
+        """
+        Install uvloop as the asyncio event loop policy if enabled.
+        
+        Returns:
+            bool: True if uvloop was installed, False otherwise
+        """
+        if not self.use_uvloop or sys.platform == "win32":
+            return False
+        
+        try:
+            import uvloop
+        except ImportError:
+            logging.getLogger(__name__).warning("USE_UVLOOP is set but uvloop is not installed")
+            return False
+        
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
 
 
 # ================================
@@ -182,11 +318,17 @@ class Config:
         
         # Configure logging on initialization
         self.logging.configure_logging()
+        
+        # Switch to uvloop when requested
+        self.performance.configure_event_loop()
     
-    def validate_configuration(self) -> Dict[str, Any]:
+    def validate_configuration(self, deep: bool = False) -> Dict[str, Any]:
         """
         Validate the entire configuration and return status.
         
+        Args:
+            deep: Also construct the database adapter to validate it
+        
         Returns:
             Dict[str, Any]: Validation results with any errors or warnings
         """
@@ -200,7 +342,9 @@ class Config:
         
         try:
             # Test database configuration
-            db = self.database.get_db_adapter()
+            self.database.validate_shape()
+            if deep:
+                self.database.get_db_adapter()
             results["database_config"] = "valid"
         except Exception as e:
             results["valid"] = False
@@ -236,9 +380,30 @@ performance_config = config.performance
 # Factory Functions
 # ================================
 
+# Shared database adapter, created and connected lazily by get_database()
+_db_singleton: Optional[GraphDatabase] = None
+_db_lock: Optional[asyncio.Lock] = None
+
+# Database scoped to the current task by use_database(); overrides the shared one
+current_db: ContextVar[Optional[GraphDatabase]] = ContextVar("current_db", default=None)
+
+
+def _get_db_lock() -> asyncio.Lock:
+    """Get the lock guarding the shared database, creating it on first use."""
+    global _db_lock
+    if _db_lock is None:
+        _db_lock = asyncio.Lock()
+    return _db_lock
+
+
 async def get_database() -> GraphDatabase:
     """
-    Get configured database instance with connection.
+    Get the configured database instance with connection.
+    
+    Returns the database scoped to the current task by use_database() if
+    there is one, otherwise the shared adapter. The shared adapter is
+    created on first use and reused afterwards; it is only reconnected if
+    the connection was closed.
     
     Returns:
         GraphDatabase: Connected database adapter
@@ -247,13 +412,65 @@ async def get_database() -> GraphDatabase:
         DatabaseConnectionError: If database connection fails
         ValueError: If configuration is invalid
     """
-    db = db_config.get_db_adapter()
+    global _db_singleton
+    
+    scoped = current_db.get()
+    if scoped is not None:
+        if not scoped.is_connected:
+            await scoped.connect()
+        return scoped
     
-    # Ensure connection
-    if not db.is_connected:
-        await db.connect()
+    # Fast path: shared adapter already set up, no need to take the lock
+    shared = _db_singleton
+    if shared is not None and shared.is_connected:
+        return shared
     
-    return db
+    async with _get_db_lock():
+        if _db_singleton is None:
+            _db_singleton = db_config.get_db_adapter()
+        
+        # Ensure connection
+        if not _db_singleton.is_connected:
+            await _db_singleton.connect()
+        
+        return _db_singleton
+
+
+async def close_database() -> None:
+    """
+    Disconnect and discard the shared database instance.
+    
+    Should be called on application shutdown.
+    """
+    global _db_singleton
+    
+    async with _get_db_lock():
+        if _db_singleton is not None:
+            try:
+                await _db_singleton.disconnect()
+            finally:
+                _db_singleton = None
+
+
+@contextmanager
+def use_database(db: GraphDatabase) -> Iterator[GraphDatabase]:
+    """
+    Scope a database to the current task and the tasks it spawns.
+    
+    Inside the block, get_database() returns db instead of the shared
+    adapter, so concurrent tasks can each work against their own database.
+    
+    Args:
+        db: The database adapter to use
+        
+    Yields:
+        GraphDatabase: The scoped database adapter
+    """
+    token = current_db.set(db)
+    try:
+        yield db
+    finally:
+        current_db.reset(token)
 
 
 def get_db_type() -> str:
@@ -284,6 +501,19 @@ def get_db_adapter() -> GraphDatabase:
 # Validation Functions
 # ================================
 
+# Valid enum values, materialized once at import
+_VALID_ENUM_VALUES: Dict[str, list] = {
+    "rule_categories": [cat.value for cat in RuleCategory],
+    "rule_types": [rt.value for rt in RuleType],
+    "error_types": [et.value for et in ErrorType],
+    "severity_levels": [sl.value for sl in SeverityLevel]
+}
+_RULE_CATEGORY_SET = frozenset(_VALID_ENUM_VALUES["rule_categories"])
+_RULE_TYPE_SET = frozenset(_VALID_ENUM_VALUES["rule_types"])
+_ERROR_TYPE_SET = frozenset(_VALID_ENUM_VALUES["error_types"])
+_SEVERITY_LEVEL_SET = frozenset(_VALID_ENUM_VALUES["severity_levels"])
+
+
 def validate_enum_values() -> Dict[str, list]:
     """
     Get all valid enum values for validation purposes.
@@ -291,48 +521,28 @@ def validate_enum_values() -> Dict[str, list]:
     Returns:
         Dict[str, list]: Dictionary mapping enum names to their valid values
     """
-    return {
-        "rule_categories": [cat.value for cat in RuleCategory],
-        "rule_types": [rt.value for rt in RuleType],
-        "error_types": [et.value for et in ErrorType],
-        "severity_levels": [sl.value for sl in SeverityLevel]
-    }
+    # Copy the lists so callers can't mutate the shared tables
+    return {name: list(values) for name, values in _VALID_ENUM_VALUES.items()}
 
 
 def is_valid_rule_category(category: str) -> bool:
     """Check if a category is valid."""
-    try:
-        RuleCategory(category.lower())
-        return True
-    except ValueError:
-        return False
+    return category.lower() in _RULE_CATEGORY_SET
 
 
 def is_valid_rule_type(rule_type: str) -> bool:
     """Check if a rule type is valid."""
-    try:
-        RuleType(rule_type.lower())
-        return True
-    except ValueError:
-        return False
+    return rule_type.lower() in _RULE_TYPE_SET
 
 
 def is_valid_error_type(error_type: str) -> bool:
     """Check if an error type is valid."""
-    try:
-        ErrorType(error_type)
-        return True
-    except ValueError:
-        return False
+    return error_type in _ERROR_TYPE_SET
 
 
 def is_valid_severity_level(severity: str) -> bool:
     """Check if a severity level is valid."""
-    try:
-        SeverityLevel(severity.lower())
-        return True
-    except ValueError:
-        return False
+    return severity.lower() in _SEVERITY_LEVEL_SET
 
 
 # ================================
@@ -368,6 +578,12 @@ def load_env_file(env_file: Optional[str] = None) -> bool:
     Returns:
         bool: True if file was loaded successfully
     """
+    # Environment may change, so drop memoized lookups
+    _parse_bool.cache_clear()
+    _parse_int.cache_clear()
+    _normalize_db_type.cache_clear()
+    resolve_adapter_class.cache_clear()
+    
     if env_file:
         return load_dotenv(env_file)
     return load_dotenv()
@@ -394,6 +610,9 @@ __all__ = [
     
     # Factory functions
     "get_database",
+    "close_database",
+    "use_database",
+    "current_db",
     "get_db_type",
     "get_db_adapter",
     
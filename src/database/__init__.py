@@ -2,7 +2,10 @@
 Database adapters package for dual Neo4j and NetworkX support.
 """
 
-from typing import Dict, Any
+import functools
+import importlib
+import sys
+from typing import Any, Dict, Tuple, Type
 
 from .base import (
     GraphDatabase,
@@ -11,14 +14,71 @@ from .base import (
     RelationshipNotFoundError,
     ValidationError
 )
-from .neo4j_adapter import Neo4jAdapter
-from .networkx_adapter import NetworkXAdapter
+from .cached import CachedGraphDatabase
+
+
+# Canonical database type names, interned so lookups with literal names
+# hit the dict's identity fast path
+_NEO4J = sys.intern("neo4j")
+_NETWORKX = sys.intern("networkx")
+
+# Registry of adapter (module, class name) pairs keyed by canonical database
+# type. Adapters are imported on first use so that, e.g., NetworkX-only
+# deployments never import the neo4j driver.
+_ADAPTER_CLASSES: Dict[str, Tuple[str, str]] = {
+    _NEO4J: (".neo4j_adapter", "Neo4jAdapter"),
+    _NETWORKX: (".networkx_adapter", "NetworkXAdapter")
+}
+
+
+def _import_adapter_class(module_name: str, class_name: str) -> Type[GraphDatabase]:
+    """Import an adapter class from a module of this package."""
+    return getattr(importlib.import_module(module_name, __name__), class_name)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import adapter classes on first attribute access (PEP 562)."""
+    for module_name, class_name in _ADAPTER_CLASSES.values():
+        if name == class_name:
+            return _import_adapter_class(module_name, class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_adapter_class(db_type: str) -> Type[GraphDatabase]:
+    """
+    Resolve a database type name to its adapter class.
+    
+    The adapter module is imported on first resolution. Results are
+    memoized per db_type string, so repeated factory calls skip the
+    normalization and dispatch.
+    
+    Args:
+        db_type: Database type ("neo4j" or "networkx")
+        
+    Returns:
+        Type[GraphDatabase]: Adapter class for the database type
+        
+    Raises:
+        ValueError: If unsupported database type is specified
+    """
+    # Canonical names need no normalization
+    entry = _ADAPTER_CLASSES.get(db_type)
+    if entry is None:
+        entry = _ADAPTER_CLASSES.get(db_type.lower().strip())
+    if entry is None:
+        raise ValueError(f"Unsupported database type: {db_type}. Supported types: 'neo4j', 'networkx'")
+    return _import_adapter_class(*entry)
 
 
 def create_database(db_type: str, config: Dict[str, Any]) -> GraphDatabase:
     """
     Factory function to create database adapter instances.
     
+    If the configuration contains a ``cache_ttl`` (seconds), the adapter is
+    wrapped in a CachedGraphDatabase read-through cache holding at most
+    ``cache_maxsize`` entries.
+    
     Args:
         db_type: Database type ("neo4j" or "networkx")
         config: Configuration dictionary for the adapter
@@ -30,14 +90,12 @@ def create_database(db_type: str, config: Dict[str, Any]) -> GraphDatabase:
         ValueError: If unsupported database type is specified
         ValidationError: If configuration is invalid
     """
-    db_type_lower = db_type.lower().strip()
+    adapter = resolve_adapter_class(db_type)(config)
     
-    if db_type_lower == "neo4j":
-        return Neo4jAdapter(config)
-    elif db_type_lower == "networkx":
-        return NetworkXAdapter(config)
-    else:
-        raise ValueError(f"Unsupported database type: {db_type}. Supported types: 'neo4j', 'networkx'")
+    cache_ttl = config.get("cache_ttl")
+    if cache_ttl:
+        return CachedGraphDatabase(adapter, ttl=cache_ttl, maxsize=config.get("cache_maxsize", 10_000))
+    return adapter
 
 
 # Export all public classes and functions
@@ -51,6 +109,8 @@ __all__ = [
     # Adapter implementations
     "Neo4jAdapter",
     "NetworkXAdapter",
-    # Factory function
-    "create_database"
+    "CachedGraphDatabase",
+    # Factory functions
+    "create_database",
+    "resolve_adapter_class"
 ] 
\ No newline at end of file
@@ -6,10 +6,61 @@ It ensures consistent API across different backends (Neo4j, NetworkX, etc.).
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+import functools
+import os
+import re
+import time
 import uuid
 
 
+# Random ID bits are drawn in batches from one os.urandom call, so generating
+# IDs doesn't cost a getrandom syscall each
+_RANDOM_POOL_SIZE = 256
+_random_pool: List[int] = []
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not hand out the parent's remaining random bits
+    os.register_at_fork(after_in_child=_random_pool.clear)
+
+
+def _refill_random_pool() -> None:
+    """Draw a batch of 74-bit random values into the pool."""
+    buf = os.urandom(10 * _RANDOM_POOL_SIZE)
+    mask = (1 << 74) - 1
+    _random_pool.extend(
+        int.from_bytes(buf[i:i + 10], "big") & mask for i in range(0, len(buf), 10)
+    )
+
+
+def generate_id() -> str:
+    """
+    Generate a time-ordered UUID (version 7 layout).
+    
+    The top 48 bits hold the Unix time in milliseconds and the remaining 74
+    free bits are random, so IDs sort roughly by creation time while staying
+    collision-safe.
+    
+    Returns:
+        str: The ID in canonical 36-character UUID form
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    while True:
+        try:
+            rand = _random_pool.pop()
+            break
+        except IndexError:
+            _refill_random_pool()
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 62) << 64
+        | 0b10 << 62
+        | rand & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return str(uuid.UUID(int=value))
+
+
 class DatabaseConnectionError(Exception):
     """Raised when database connection fails."""
     pass
@@ -38,6 +89,12 @@ class GraphDatabase(ABC):
     must follow to ensure consistent behavior across different backends.
     """
     
+    # Property keys adapters use for their own bookkeeping
+    _RESERVED_KEYS = frozenset({"id", "_id", "node_id"})
+    
+    # Relationship types are interpolated into queries by some adapters
+    _REL_TYPE_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the database adapter with configuration.
@@ -53,6 +110,27 @@ class GraphDatabase(ABC):
         """Check if the database is connected."""
         return self._connected
     
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def public_methods(cls) -> Tuple[str, ...]:
+        """
+        List the public method names of this adapter class.
+        
+        Walks the class hierarchy without touching instance attributes,
+        so no properties are evaluated. Cached per adapter class.
+        
+        Returns:
+            Tuple[str, ...]: Sorted public method names
+        """
+        names = {
+            name
+            for klass in cls.__mro__
+            if klass is not object
+            for name in vars(klass)
+            if not name.startswith('_')
+        }
+        return tuple(sorted(name for name in names if callable(getattr(cls, name))))
+    
     # Connection Management
     @abstractmethod
     async def connect(self) -> None:
@@ -261,10 +339,296 @@ class GraphDatabase(ABC):
         """
         pass
     
+    # Bulk Operations (with default implementations)
+    async def create_nodes(self, specs: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Create multiple nodes in a single operation.
+        
+        Adapters should override this to amortize per-operation overhead;
+        the default implementation creates the nodes one by one.
+        
+        Args:
+            specs: List of (label, properties) pairs
+            
+        Returns:
+            List[str]: IDs of the created nodes, in input order
+            
+        Raises:
+            ValidationError: If any properties are invalid
+            DatabaseConnectionError: If database is not connected
+        """
+        return [await self.create_node(label, properties) for label, properties in specs]
+    
+    async def create_nodes_bulk(self, label: str, properties_list: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create multiple nodes sharing one label in a single operation.
+        
+        The default implementation delegates to ``create_nodes``.
+        
+        Args:
+            label: Node label shared by all nodes
+            properties_list: Properties of each node
+            
+        Returns:
+            List[str]: IDs of the created nodes, in input order
+            
+        Raises:
+            ValidationError: If any properties are invalid
+            DatabaseConnectionError: If database is not connected
+        """
+        return await self.create_nodes([(label, properties) for properties in properties_list])
+    
+    async def upsert_node(self, label: str, node_id: str, properties: Dict[str, Any]) -> str:
+        """
+        Create a node, or merge properties into it if it already exists.
+        
+        Adapters should override this with a single atomic operation; the
+        default implementation looks the node up first.
+        
+        Args:
+            label: Node label used when the node is created
+            node_id: ID of the node to create or update
+            properties: Node properties
+            
+        Returns:
+            str: The node ID
+            
+        Raises:
+            ValidationError: If properties are invalid
+            DatabaseConnectionError: If database is not connected
+        """
+        if await self.get_node(node_id) is None:
+            return await self.create_node(label, properties, node_id)
+        await self.update_node(node_id, properties)
+        return node_id
+    
+    async def upsert_nodes_bulk(
+        self,
+        label: str,
+        nodes: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[str]:
+        """
+        Upsert multiple nodes sharing one label in a single operation.
+        
+        Adapters should override this to amortize per-operation overhead;
+        the default implementation upserts the nodes one by one.
+        
+        Args:
+            label: Node label used for nodes that are created
+            nodes: List of (node_id, properties) pairs
+            
+        Returns:
+            List[str]: The node IDs, in input order
+            
+        Raises:
+            ValidationError: If any properties are invalid
+            DatabaseConnectionError: If database is not connected
+        """
+        return [await self.upsert_node(label, node_id, properties) for node_id, properties in nodes]
+    
+    async def create_relationships(
+        self,
+        specs: List[Tuple[str, str, str, Optional[Dict[str, Any]]]]
+    ) -> List[str]:
+        """
+        Create multiple relationships in a single operation.
+        
+        Adapters should override this to amortize per-operation overhead;
+        the default implementation creates the relationships one by one.
+        
+        Args:
+            specs: List of (start_node_id, end_node_id, relationship_type, properties) tuples
+            
+        Returns:
+            List[str]: IDs of the created relationships, in input order
+            
+        Raises:
+            NodeNotFoundError: If any referenced node doesn't exist
+            ValidationError: If any relationship data is invalid
+        """
+        return [
+            await self.create_relationship(start_node_id, end_node_id, relationship_type, properties)
+            for start_node_id, end_node_id, relationship_type, properties in specs
+        ]
+    
+    # Pagination (with default implementation)
+    async def get_nodes_page(
+        self,
+        label: str,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 1000
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve one page of nodes with a specific label, in node_id order.
+        
+        Pages are addressed by keyset: pass the returned cursor to get the
+        next page. Unlike offsets, this stays cheap however deep the page is
+        when the backend can range-scan node_id. The default implementation
+        filters the full ``get_nodes_by_label`` result.
+        
+        Args:
+            label: The label to filter by
+            filters: Optional property filters
+            cursor: node_id after which the page starts; None for the first page
+            page_size: Maximum number of nodes per page
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: The page and the cursor
+                for the next one, or None if this is the last page
+            
+        Raises:
+            ValidationError: If page_size is less than 1
+        """
+        if page_size < 1:
+            raise ValidationError(f"page_size must be at least 1, got {page_size}")
+        
+        rows = [
+            node for node in await self.get_nodes_by_label(label, filters)
+            if cursor is None or node["node_id"] > cursor
+        ][:page_size]
+        next_cursor = rows[-1]["node_id"] if len(rows) == page_size else None
+        return rows, next_cursor
+    
+    # Traversal (with default implementation)
+    async def traverse(
+        self,
+        start_id: str,
+        max_depth: int = 3,
+        relationship_type: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Find the nodes reachable from a start node within a number of hops.
+        
+        Relationships are followed in both directions. The search is
+        breadth-first with a visited set, so every node is expanded at most
+        once even when many paths lead to it (e.g. diamond-shaped rule
+        hierarchies); the default implementation expands nodes through
+        ``get_relationships``.
+        
+        Args:
+            start_id: ID of the node to start from
+            max_depth: Maximum number of hops
+            relationship_type: Optional relationship type to follow
+            
+        Returns:
+            Dict[str, int]: Reachable node IDs (excluding the start node)
+                mapped to their distance in hops
+        """
+        depths = {start_id: 0}
+        frontier = [start_id]
+        for depth in range(1, max_depth + 1):
+            next_frontier = []
+            for node_id in frontier:
+                for rel in await self.get_relationships(node_id, relationship_type):
+                    other = rel["end_node_id"] if rel["start_node_id"] == node_id else rel["start_node_id"]
+                    if other not in depths:
+                        depths[other] = depth
+                        next_frontier.append(other)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        
+        del depths[start_id]
+        return depths
+    
+    # Streaming Operations (with default implementations)
+    async def iter_nodes_by_label(
+        self,
+        label: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all nodes with a specific label.
+        
+        Adapters backed by a remote server should override this to yield rows
+        as they arrive; the default implementation iterates over the result of
+        ``get_nodes_by_label``.
+        
+        Args:
+            label: The label to filter by
+            filters: Optional property filters
+            limit: Optional limit on results
+            
+        Yields:
+            Dict[str, Any]: Matching nodes, one at a time
+        """
+        for node in await self.get_nodes_by_label(label, filters, limit):
+            yield node
+    
+    async def iter_relationships(
+        self,
+        node_id: str,
+        relationship_type: Optional[str] = None,
+        direction: str = "both"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the relationships of a specific node.
+        
+        Adapters backed by a remote server should override this to yield rows
+        as they arrive; the default implementation iterates over the result of
+        ``get_relationships``.
+        
+        Args:
+            node_id: The node ID to get relationships for
+            relationship_type: Optional filter by relationship type
+            direction: "incoming", "outgoing", or "both"
+            
+        Yields:
+            Dict[str, Any]: Relationships, one at a time
+        """
+        for relationship in await self.get_relationships(node_id, relationship_type, direction):
+            yield relationship
+    
+    async def get_nodes_by_label_columns(
+        self,
+        label: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Retrieve nodes with a specific label in column-major layout.
+        
+        Each property becomes one list holding that property for every node,
+        in row order, with None where a node lacks the property. The lists
+        can be handed straight to column-oriented tools such as NumPy or
+        pandas.
+        
+        Args:
+            label: The label to filter by
+            filters: Optional property filters
+            limit: Optional limit on results
+            
+        Returns:
+            Dict[str, List[Any]]: Column name to column values
+        """
+        columns: Dict[str, List[Any]] = {}
+        row_count = 0
+        async for node in self.iter_nodes_by_label(label, filters, limit):
+            for key, value in node.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * row_count
+                column.append(value)
+            row_count += 1
+            
+            # Pad the columns this node doesn't have
+            if len(node) < len(columns):
+                for column in columns.values():
+                    if len(column) < row_count:
+                        column.append(None)
+        
+        return columns
+    
     # Helper Methods (with default implementations)
     def generate_node_id(self) -> str:
         """Generate a unique node ID."""
-        return str(uuid.uuid4())
+        return generate_id()
+    
+    def generate_relationship_id(self) -> str:
+        """Generate a unique relationship ID."""
+        return generate_id()
     
     def validate_node_properties(self, properties: Dict[str, Any]) -> None:
         """
@@ -279,11 +643,9 @@ class GraphDatabase(ABC):
         if not isinstance(properties, dict):
             raise ValidationError("Properties must be a dictionary")
         
-        # Check for reserved keys
-        reserved_keys = {"id", "_id", "node_id"}
-        for key in reserved_keys:
-            if key in properties:
-                raise ValidationError(f"Property key '{key}' is reserved")
+        reserved = self._RESERVED_KEYS.intersection(properties)
+        if reserved:
+            raise ValidationError(f"Property key '{min(reserved)}' is reserved")
     
     def validate_relationship_type(self, relationship_type: str) -> None:
         """
@@ -295,8 +657,10 @@ class GraphDatabase(ABC):
         Raises:
             ValidationError: If relationship type is invalid
         """
-        if not isinstance(relationship_type, str) or not relationship_type.strip():
-            raise ValidationError("Relationship type must be a non-empty string")
+        if not isinstance(relationship_type, str) or not self._REL_TYPE_RE.fullmatch(relationship_type):
+            raise ValidationError(
+                "Relationship type must be a non-empty string of letters, digits and underscores"
+            )
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -0,0 +1,333 @@
+"""
+Cached Graph Database Wrapper
+
+This module implements a read-through TTL cache around any GraphDatabase
+adapter. Reads are served from the cache until they expire or a write
+invalidates them; writes always go straight to the wrapped adapter.
+"""
+
+import copy
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .base import GraphDatabase
+
+
+class _TTLCache:
+    """Minimal size-bounded cache whose entries expire after a fixed TTL."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting expired and then oldest entries when full."""
+        now = time.monotonic()
+        if key not in self._data and len(self._data) >= self.maxsize:
+            for stale_key in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+                del self._data[stale_key]
+            while len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (now + self.ttl, value)
+    
+    def pop(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CachedGraphDatabase(GraphDatabase):
+    """
+    Read-through caching decorator for a GraphDatabase adapter.
+    
+    ``get_node``, ``get_nodes_by_label`` and ``get_relationships`` results are
+    cached per argument set. Writes that touch known node IDs drop those
+    nodes' ``get_node`` entries directly. Listings are invalidated through
+    generation counters embedded in their keys instead: creating nodes bumps
+    the generation of their label, other node and relationship writes bump
+    the listing generation, and writes with an unknown blast radius bump the
+    global generation, so stale entries simply stop being looked up and age
+    out. Cached values are deep-copied on the way in and out, so callers
+    can mutate what they get back, nested lists included.
+    
+    Adapter-specific methods (e.g. ``get_graph_stats``) are delegated to the
+    wrapped adapter unchanged.
+    """
+    
+    def __init__(self, adapter: GraphDatabase, ttl: float, maxsize: int = 10_000):
+        """
+        Initialize the cache wrapper.
+        
+        Args:
+            adapter: The database adapter to wrap
+            ttl: Time-to-live of cached reads, in seconds
+            maxsize: Maximum number of cached entries
+        """
+        super().__init__(adapter.config)
+        self.adapter = adapter
+        self._cache = _TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generation = 0
+        self._listing_generation = 0
+        self._label_generations: Dict[str, int] = {}
+        # Bumped on every targeted node write so reads racing that write don't cache stale data
+        self._node_versions: Dict[str, int] = {}
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper itself
+        if name == "adapter":
+            raise AttributeError(name)
+        return getattr(self.adapter, name)
+    
+    @property
+    def is_connected(self) -> bool:
+        """Check if the wrapped database is connected."""
+        return self.adapter.is_connected
+    
+    def _invalidate(self, label: Optional[str] = None) -> None:
+        """
+        Invalidate cached reads affected by a write.
+        
+        Args:
+            label: Label whose listings are affected; None invalidates everything
+        """
+        if label is None:
+            self._generation += 1
+            # Keys from older generations are never looked up again
+            self._node_versions.clear()
+        else:
+            self._label_generations[label] = self._label_generations.get(label, 0) + 1
+    
+    def _invalidate_nodes(self, *node_ids: str) -> None:
+        """
+        Invalidate the cached reads of specific nodes and all listings.
+        
+        Args:
+            node_ids: IDs of the nodes whose data or neighbourhood changed
+        """
+        node_versions = self._node_versions
+        for node_id in node_ids:
+            self._cache.pop(("get_node", self._generation, node_id))
+            node_versions[node_id] = node_versions.get(node_id, 0) + 1
+        self._listing_generation += 1
+    
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict[str, int]: Hit and miss counts, current size and maximum size
+        """
+        return {
+            "hits": self._cache.hits,
+            "misses": self._cache.misses,
+            "size": len(self._cache),
+            "maxsize": self._cache.maxsize
+        }
+    
+    def cache_clear(self) -> None:
+        """Drop every cached read."""
+        self._cache.clear()
+        self._invalidate()
+    
+    # Connection Management
+    async def connect(self) -> None:
+        await self.adapter.connect()
+        # Data may have changed while disconnected
+        self._invalidate()
+    
+    async def disconnect(self) -> None:
+        await self.adapter.disconnect()
+    
+    async def health_check(self) -> bool:
+        return await self.adapter.health_check()
+    
+    # Node Operations
+    async def create_node(
+        self,
+        label: str,
+        properties: Dict[str, Any],
+        node_id: Optional[str] = None
+    ) -> str:
+        result = await self.adapter.create_node(label, properties, node_id)
+        self._invalidate(label)
+        return result
+    
+    async def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        key = ("get_node", self._generation, node_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        version = self._node_versions.get(node_id, 0)
+        result = await self.adapter.get_node(node_id)
+        # Misses are not cached so a node created under this ID is seen at once,
+        # and a write to the node during the read means the result may be stale
+        if result is not None and self._node_versions.get(node_id, 0) == version:
+            self._cache.set(key, copy.deepcopy(result))
+        return result
+    
+    async def update_node(self, node_id: str, properties: Dict[str, Any]) -> bool:
+        result = await self.adapter.update_node(node_id, properties)
+        self._invalidate_nodes(node_id)
+        return result
+    
+    async def delete_node(self, node_id: str) -> bool:
+        result = await self.adapter.delete_node(node_id)
+        # Neighbours of the deleted node change too, and they are unknown here
+        self._invalidate()
+        return result
+    
+    async def get_nodes_by_label(
+        self,
+        label: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        try:
+            key = (
+                "by_label",
+                self._generation,
+                self._listing_generation,
+                self._label_generations.get(label, 0),
+                label,
+                frozenset(filters.items()) if filters else None,
+                limit
+            )
+            cached = self._cache.get(key)
+        except TypeError:
+            # Unhashable filter values can't be used as a cache key
+            return await self.adapter.get_nodes_by_label(label, filters, limit)
+        
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        result = await self.adapter.get_nodes_by_label(label, filters, limit)
+        self._cache.set(key, copy.deepcopy(result))
+        return result
+    
+    async def get_nodes_page(
+        self,
+        label: str,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 1000
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        return await self.adapter.get_nodes_page(label, filters, cursor, page_size)
+    
+    # Relationship Operations
+    async def create_relationship(
+        self,
+        start_node_id: str,
+        end_node_id: str,
+        relationship_type: str,
+        properties: Optional[Dict[str, Any]] = None
+    ) -> str:
+        result = await self.adapter.create_relationship(
+            start_node_id, end_node_id, relationship_type, properties
+        )
+        self._invalidate_nodes(start_node_id, end_node_id)
+        return result
+    
+    async def get_relationships(
+        self,
+        node_id: str,
+        relationship_type: Optional[str] = None,
+        direction: str = "both"
+    ) -> List[Dict[str, Any]]:
+        key = ("rels", self._generation, self._listing_generation, node_id, relationship_type, direction)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        result = await self.adapter.get_relationships(node_id, relationship_type, direction)
+        self._cache.set(key, copy.deepcopy(result))
+        return result
+    
+    async def traverse(
+        self,
+        start_id: str,
+        max_depth: int = 3,
+        relationship_type: Optional[str] = None
+    ) -> Dict[str, int]:
+        return await self.adapter.traverse(start_id, max_depth, relationship_type)
+    
+    async def delete_relationship(self, relationship_id: str) -> bool:
+        result = await self.adapter.delete_relationship(relationship_id)
+        self._invalidate()
+        return result
+    
+    # Utility Methods
+    async def execute_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Any:
+        # Raw queries may write, so treat them as invalidating
+        result = await self.adapter.execute_query(query, parameters)
+        self._invalidate()
+        return result
+    
+    async def write_batch(self, func: Callable[[Any], Awaitable[Any]]) -> Any:
+        # The batch may write anything, so treat it as invalidating
+        result = await self.adapter.write_batch(func)
+        self._invalidate()
+        return result
+    
+    async def clear_all_data(self) -> None:
+        await self.adapter.clear_all_data()
+        self.cache_clear()
+    
+    # Bulk Operations
+    async def create_nodes(self, specs: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        result = await self.adapter.create_nodes(specs)
+        for label in {label for label, _ in specs}:
+            self._invalidate(label)
+        return result
+    
+    async def create_nodes_bulk(self, label: str, properties_list: List[Dict[str, Any]]) -> List[str]:
+        result = await self.adapter.create_nodes_bulk(label, properties_list)
+        self._invalidate(label)
+        return result
+    
+    async def upsert_node(self, label: str, node_id: str, properties: Dict[str, Any]) -> str:
+        result = await self.adapter.upsert_node(label, node_id, properties)
+        self._invalidate(label)
+        self._invalidate_nodes(node_id)
+        return result
+    
+    async def upsert_nodes_bulk(
+        self,
+        label: str,
+        nodes: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[str]:
+        result = await self.adapter.upsert_nodes_bulk(label, nodes)
+        self._invalidate(label)
+        self._invalidate_nodes(*(node_id for node_id, _ in nodes))
+        return result
+    
+    async def create_relationships(
+        self,
+        specs: List[Tuple[str, str, str, Optional[Dict[str, Any]]]]
+    ) -> List[str]:
+        result = await self.adapter.create_relationships(specs)
+        self._invalidate_nodes(*{node_id for start, end, _, _ in specs for node_id in (start, end)})
+        return result
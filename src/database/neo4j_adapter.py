@@ -6,11 +6,15 @@ Neo4j Python driver with async support.
 """
 
 import asyncio
+import copy
+import functools
 import logging
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+import re
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, RoutingControl
+import orjson
+from neo4j import AsyncGraphDatabase, AsyncDriver, READ_ACCESS, RoutingControl
 from neo4j.exceptions import Neo4jError, DriverError
 
 from .base import (
@@ -23,13 +27,173 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Labels and property keys are interpolated into Cypher, so restrict them to plain identifiers
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _validate_identifier(kind: str, name: str) -> None:
+    """
+    Check that a name is safe to interpolate into a Cypher query.
+    
+    Args:
+        kind: What the name is used as, for the error message
+        name: The label or property key to check
+        
+    Raises:
+        ValidationError: If the name is not a plain identifier
+    """
+    if not isinstance(name, str) or not _IDENTIFIER_RE.fullmatch(name):
+        raise ValidationError(f"Invalid {kind}: {name!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def _node_id_predicate(var: str, node_id: str, labels: Tuple[str, ...]) -> str:
+    """
+    Build the WHERE condition matching a node by node_id among labels.
+    
+    Naming the labels lets the planner seek each label's node_id constraint
+    index instead of scanning every node; with no labels any node matches.
+    
+    Args:
+        var: Cypher variable of the node
+        node_id: Cypher expression holding the node ID, e.g. "$node_id"
+        labels: Labels the node may carry
+        
+    Returns:
+        str: The condition, e.g. "(n:Rule OR n:Learnt) AND n.node_id = $node_id"
+    """
+    condition = f"{var}.node_id = {node_id}"
+    if not labels:
+        return condition
+    for label in labels:
+        _validate_identifier("label", label)
+    label_test = " OR ".join(f"{var}:{label}" for label in labels)
+    return f"({label_test}) AND {condition}"
+
+
+# Query texts are memoized so hot calls reuse the exact same string, which also
+# keeps Neo4j's server-side plan cache (keyed on query text) warm.
+@functools.lru_cache(maxsize=None)
+def _create_node_query(label: str) -> str:
+    """Build the query creating a single node under label."""
+    _validate_identifier("label", label)
+    return f"""
+    CREATE (n:{label} $properties)
+    RETURN n.node_id as node_id
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def _upsert_nodes_query(label: str) -> str:
+    """Build the UNWIND query merging one node per row on its node_id under label."""
+    _validate_identifier("label", label)
+    return f"""
+    UNWIND $rows AS row
+    MERGE (n:{label} {{node_id: row.node_id}})
+    ON CREATE SET n = row
+    ON MATCH SET n += row
+    RETURN n.node_id AS node_id
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def _node_id_constraint_query(label: str) -> str:
+    """Build the schema query making node_id unique (and indexed) under label."""
+    _validate_identifier("label", label)
+    return f"""
+    CREATE CONSTRAINT node_id_{label} IF NOT EXISTS
+    FOR (n:{label}) REQUIRE n.node_id IS UNIQUE
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def _bulk_create_nodes_query(label: str) -> str:
+    """Build the UNWIND query creating one node per row under label."""
+    _validate_identifier("label", label)
+    return f"""
+    UNWIND $rows AS row
+    CREATE (n:{label})
+    SET n = row
+    RETURN row.node_id AS node_id
+    """
+
+
+# Relationship pattern per direction; "{type}" is replaced by the optional type filter
+_REL_PATTERNS = {
+    "incoming": "(other)-[r{type}]->(n)",
+    "outgoing": "(n)-[r{type}]->(other)",
+    "both": "(n)-[r{type}]-(other)"
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _relationships_query(direction: str, relationship_type: Optional[str], labels: Tuple[str, ...]) -> str:
+    """Build the query listing a node's relationships in one direction."""
+    type_filter = ""
+    if relationship_type is not None:
+        _validate_identifier("relationship type", relationship_type)
+        type_filter = f":{relationship_type}"
+    
+    return f"""
+    MATCH {_REL_PATTERNS[direction].format(type=type_filter)}
+    WHERE {_node_id_predicate("n", "$node_id", labels)}
+    RETURN r, type(r) as rel_type, id(r) as internal_id,
+           startNode(r).node_id as start_node_id,
+           endNode(r).node_id as end_node_id
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def _nodes_page_query(label: str) -> str:
+    """Build the keyset-paginated label scan query."""
+    _validate_identifier("label", label)
+    return f"""
+    MATCH (n:{label})
+    WHERE ($cursor IS NULL OR n.node_id > $cursor)
+      AND all(k IN keys($filters) WHERE n[k] = $filters[k])
+    RETURN n, labels(n) as labels, id(n) as internal_id
+    ORDER BY n.node_id
+    LIMIT $page_size
+    """
+
+
+@functools.lru_cache(maxsize=64)
+def _neighbours_query(relationship_type: Optional[str], labels: Tuple[str, ...]) -> str:
+    """Build the query expanding a BFS frontier by one hop in both directions."""
+    type_filter = ""
+    if relationship_type is not None:
+        _validate_identifier("relationship type", relationship_type)
+        type_filter = f":{relationship_type}"
+    
+    return f"""
+    UNWIND $frontier AS frontier_id
+    MATCH (n)-[r{type_filter}]-(m)
+    WHERE {_node_id_predicate("n", "frontier_id", labels)} AND NOT m.node_id IN $visited
+    RETURN DISTINCT m.node_id AS node_id
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def _nodes_by_label_query(label: str, limited: bool) -> str:
+    """Build the label scan query; filters are matched from the $filters map."""
+    _validate_identifier("label", label)
+    return f"""
+    MATCH (n:{label})
+    WHERE all(k IN keys($filters) WHERE n[k] = $filters[k])
+    RETURN n, labels(n) as labels, id(n) as internal_id
+    ORDER BY n.node_id
+    {"LIMIT $limit" if limited else ""}
+    """
+
 
 class Neo4jAdapter(GraphDatabase):
     """
     Neo4j implementation of the GraphDatabase interface.
     
     This adapter uses the official Neo4j Python driver to provide
-    graph database operations for Rules and Learnt nodes.
+    graph database operations for Rules and Learnt nodes. Every query names
+    its target database explicitly, which spares the driver a home-database
+    lookup round-trip.
     """
     
     def __init__(self, config: Dict[str, Any]):
@@ -42,16 +206,66 @@ class Neo4jAdapter(GraphDatabase):
                 - username: Database username
                 - password: Database password
                 - database: Target database name (optional, defaults to "neo4j")
+                - max_connection_pool_size: Connection pool size (optional, defaults
+                  to 10); size it to the expected number of concurrent queries
+                - pool_warmup: Number of connections to open at connect time
+                  (optional, defaults to the pool size)
+                - labels: Labels of the nodes looked up by node_id (optional,
+                  defaults to ["Rule", "Learnt"]); lookups by node_id only
+                  find nodes carrying one of them, so they can use the
+                  constraints from ensure_constraints(). An empty list
+                  matches nodes of any label
+                - ensure_constraints: Whether the server runs
+                  ensure_constraints() at startup (optional, defaults to False)
+                - clear_chunk: Nodes deleted per transaction by clear_all_data
+                  (optional, defaults to 10000)
+                - health_ttl: Seconds a successful health probe is reused
+                  (optional, defaults to 5)
+                - bulk_read_backend: "bolt" (default) or "http" to send large
+                  label scans to the transactional HTTP API (requires httpx)
+                - http_uri: HTTP endpoint for the "http" backend
+                  (e.g. "http://localhost:7474")
+                - http_bulk_threshold: Scans without a limit, or with a limit
+                  of at least this many rows, use the HTTP backend
+                  (optional, defaults to 10000)
         """
         super().__init__(config)
         self.driver: Optional[AsyncDriver] = None
         self.database = config.get("database", "neo4j")
         
+        # Reads currently in flight, shared by concurrent callers with the same key
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        
+        # Health probe memo: last success, and the back-off after failures
+        self._last_health_ok = float("-inf")
+        self._health_cooldown = 0.0
+        self._health_retry_at = float("-inf")
+        
+        # Pooled client for the optional HTTP bulk-read backend, created on first use
+        self._http = None
+        
         # Validate required configuration
         required_fields = ["uri", "username", "password"]
         for field in required_fields:
             if field not in config:
                 raise ValidationError(f"Missing required configuration field: {field}")
+        if config.get("bulk_read_backend", "bolt") == "http" and not config.get("http_uri"):
+            raise ValidationError("The http bulk_read_backend requires http_uri")
+        
+        # Labels node_id lookups are scoped to; checked here so bad ones fail early
+        self._labels = tuple(config.get("labels", ("Rule", "Learnt")))
+        self._node_id_match = f"MATCH (n) WHERE {_node_id_predicate('n', '$node_id', self._labels)}"
+        
+        # Resolve connection settings once rather than on every (re)connect
+        self._uri = config["uri"]
+        self._auth = (config["username"], config["password"])
+        self._pool_size = config.get("max_connection_pool_size", config.get("max_pool_size", 10))
+        self._driver_kwargs = {
+            "max_connection_pool_size": self._pool_size,
+            "connection_acquisition_timeout": config.get(
+                "connection_timeout", config.get("timeout", 30)
+            )
+        }
     
     async def connect(self) -> None:
         """
@@ -62,14 +276,25 @@ class Neo4jAdapter(GraphDatabase):
         """
         try:
             self.driver = AsyncGraphDatabase.driver(
-                self.config["uri"],
-                auth=(self.config["username"], self.config["password"]),
-                max_connection_pool_size=self.config.get("max_connection_pool_size", 10),
-                connection_acquisition_timeout=self.config.get("connection_timeout", 30)
+                self._uri,
+                auth=self._auth,
+                **self._driver_kwargs
             )
             
             # Verify connectivity
             await self.driver.verify_connectivity()
+            
+            # Open pooled connections up front so early queries don't pay for them
+            warmup = min(self.config.get("pool_warmup", self._pool_size), self._pool_size)
+            await asyncio.gather(*(
+                self.driver.execute_query(
+                    "RETURN 1",
+                    database_=self.database,
+                    routing_=RoutingControl.READ
+                )
+                for _ in range(warmup)
+            ))
+            
             self._connected = True
             logger.info("Successfully connected to Neo4j database")
             
@@ -80,10 +305,48 @@ class Neo4jAdapter(GraphDatabase):
             logger.error(f"Unexpected error connecting to Neo4j: {e}")
             raise DatabaseConnectionError(f"Unexpected connection error: {e}")
     
+    async def ensure_constraints(self) -> int:
+        """
+        Create node_id uniqueness constraints for the known labels.
+        
+        This is a schema migration and is not run on connect: creating a
+        constraint takes a schema lock and fails if existing data holds
+        duplicate node_ids. A label whose constraint can't be created is
+        logged and skipped.
+        
+        The constraint is backed by an index, which node_id lookups (scoped to
+        the configured labels) and get_nodes_page seek instead of scanning.
+        
+        Returns:
+            int: Number of labels whose constraint is in place
+            
+        Raises:
+            DatabaseConnectionError: If the database is not connected
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        ensured = 0
+        for label in self._labels:
+            try:
+                await self.driver.execute_query(
+                    _node_id_constraint_query(label),
+                    database_=self.database,
+                    routing_=RoutingControl.WRITE
+                )
+                ensured += 1
+            except (Neo4jError, DriverError) as e:
+                logger.warning(f"Could not create node_id constraint for {label}: {e}")
+        return ensured
+    
     async def disconnect(self) -> None:
         """
         Close the Neo4j connection.
         """
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        
         if self.driver:
             await self.driver.close()
             self._connected = False
@@ -93,12 +356,23 @@ class Neo4jAdapter(GraphDatabase):
         """
         Check if the database is healthy and responsive.
         
+        A successful probe is reused for ``health_ttl`` seconds. After a
+        failure no probe is sent for a cooldown that doubles with each
+        consecutive failure (up to 30 seconds), so frequent callers such as
+        load balancers don't hammer a struggling server.
+        
         Returns:
             bool: True if database is healthy, False otherwise
         """
         if not self.driver or not self._connected:
             return False
         
+        now = time.monotonic()
+        if now - self._last_health_ok < self.config.get("health_ttl", 5):
+            return True
+        if now < self._health_retry_at:
+            return False
+        
         try:
             # Simple query to test connectivity
             await self.driver.execute_query(
@@ -106,10 +380,15 @@ class Neo4jAdapter(GraphDatabase):
                 database_=self.database,
                 routing_=RoutingControl.READ
             )
-            return True
         except Exception as e:
             logger.warning(f"Health check failed: {e}")
+            self._health_cooldown = min(max(self._health_cooldown * 2, 1.0), 30.0)
+            self._health_retry_at = time.monotonic() + self._health_cooldown
             return False
+        
+        self._last_health_ok = time.monotonic()
+        self._health_cooldown = 0.0
+        return True
     
     async def create_node(
         self, 
@@ -144,12 +423,9 @@ class Neo4jAdapter(GraphDatabase):
         # Add node_id to properties
         properties_with_id = {**properties, "node_id": node_id}
         
+        query = _create_node_query(label)
+        
         try:
-            query = f"""
-            CREATE (n:{label} $properties)
-            RETURN n.node_id as node_id
-            """
-            
             record = await self.driver.execute_query(
                 query,
                 properties=properties_with_id,
@@ -158,12 +434,14 @@ class Neo4jAdapter(GraphDatabase):
                 result_transformer_=lambda r: r.single(strict=True)
             )
             
-            logger.debug(f"Created {label} node with ID: {node_id}")
+            logger.debug("Created %s node with ID: %s", label, node_id)
             return record["node_id"]
             
         except (Neo4jError, DriverError) as e:
             logger.error(f"Failed to create node: {e}")
             raise DatabaseConnectionError(f"Node creation failed: {e}")
+        finally:
+            self._forget_reads(node_id)
     
     async def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -178,32 +456,35 @@ class Neo4jAdapter(GraphDatabase):
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
+        result = await self._single_flight(("get_node", node_id), lambda: self._fetch_node(node_id))
+        # Concurrent callers share one result, so each gets its own copy
+        return copy.deepcopy(result) if result is not None else None
+    
+    async def _fetch_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Run the get_node query."""
         try:
-            query = """
-            MATCH (n {node_id: $node_id})
-            RETURN n, labels(n) as labels, id(n) as internal_id
+            # Project straight into a map so the record already is the result dict
+            query = f"""
+            {self._node_id_match}
+            RETURN n{{.*, _labels: labels(n), _iid: id(n)}} AS row
+            LIMIT 1
             """
             
-            records, _, _ = await self.driver.execute_query(
+            record = await self.driver.execute_query(
                 query,
                 node_id=node_id,
                 database_=self.database,
-                routing_=RoutingControl.READ
+                routing_=RoutingControl.READ,
+                result_transformer_=lambda r: r.single(strict=False)
             )
             
-            if not records:
+            if record is None:
                 return None
             
-            record = records[0]
-            node = record["n"]
-            
-            # Build result dictionary
-            result = {
-                "node_id": node_id,
-                "labels": record["labels"],
-                "internal_id": record["internal_id"],
-                **dict(node)
-            }
+            result = record["row"]
+            result["node_id"] = node_id
+            result["labels"] = result.pop("_labels")
+            result["internal_id"] = result.pop("_iid")
             
             return result
             
@@ -228,30 +509,23 @@ class Neo4jAdapter(GraphDatabase):
         self.validate_node_properties(properties)
         
         try:
-            # Create SET clauses for each property
-            set_clauses = []
-            params = {"node_id": node_id}
-            
-            for key, value in properties.items():
-                param_name = f"prop_{key}"
-                set_clauses.append(f"n.{key} = ${param_name}")
-                params[param_name] = value
-            
+            # One parameterized query for every property set keeps the plan cached
             query = f"""
-            MATCH (n {{node_id: $node_id}})
-            SET {', '.join(set_clauses)}
+            {self._node_id_match}
+            SET n += $properties
             RETURN n.node_id as updated_id
             """
             
             records, _, _ = await self.driver.execute_query(
                 query,
-                **params,
+                node_id=node_id,
+                properties=properties,
                 database_=self.database,
                 routing_=RoutingControl.WRITE
             )
             
             if records:
-                logger.debug(f"Updated node {node_id}")
+                logger.debug("Updated node %s", node_id)
                 return True
             else:
                 logger.warning(f"Node {node_id} not found for update")
@@ -260,6 +534,8 @@ class Neo4jAdapter(GraphDatabase):
         except (Neo4jError, DriverError) as e:
             logger.error(f"Failed to update node {node_id}: {e}")
             raise DatabaseConnectionError(f"Node update failed: {e}")
+        finally:
+            self._forget_reads(node_id)
     
     async def delete_node(self, node_id: str) -> bool:
         """
@@ -275,8 +551,8 @@ class Neo4jAdapter(GraphDatabase):
             raise DatabaseConnectionError("Database is not connected")
         
         try:
-            query = """
-            MATCH (n {node_id: $node_id})
+            query = f"""
+            {self._node_id_match}
             DETACH DELETE n
             RETURN count(n) as deleted_count
             """
@@ -291,7 +567,7 @@ class Neo4jAdapter(GraphDatabase):
             
             deleted_count = record["deleted_count"]
             if deleted_count > 0:
-                logger.debug(f"Deleted node {node_id}")
+                logger.debug("Deleted node %s", node_id)
                 return True
             else:
                 logger.warning(f"Node {node_id} not found for deletion")
@@ -300,6 +576,53 @@ class Neo4jAdapter(GraphDatabase):
         except (Neo4jError, DriverError) as e:
             logger.error(f"Failed to delete node {node_id}: {e}")
             raise DatabaseConnectionError(f"Node deletion failed: {e}")
+        finally:
+            self._forget_reads(node_id)
+    
+    def _forget_reads(self, *node_ids: str) -> None:
+        """
+        Detach in-flight get_node reads from later callers after a write.
+        
+        A read that started before the write may return the old node, so
+        get_node calls made once the write is done must issue their own.
+        
+        Args:
+            node_ids: IDs of the nodes the write touched
+        """
+        for node_id in node_ids:
+            self._inflight.pop(("get_node", node_id), None)
+    
+    async def _single_flight(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a read once for all concurrent callers with the same key.
+        
+        Callers arriving while a read for key is in flight await its outcome
+        instead of issuing their own round-trip. Writes detach the reads they
+        may have overtaken (see _forget_reads), so a caller never joins a read
+        older than its own completed write. The read runs in its own
+        task and every caller awaits it through a shield, so cancelling one
+        caller (the first included) doesn't cancel the read for the others.
+        
+        Args:
+            key: Identifies reads that are interchangeable
+            fetch: Issues the read
+            
+        Returns:
+            Any: The result of the shared read
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            
+            def settle(done: asyncio.Future) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                # Mark the outcome as retrieved so a failure without waiters isn't logged
+                done.cancelled() or done.exception()
+            
+            task.add_done_callback(settle)
+        return await asyncio.shield(task)
     
     async def get_nodes_by_label(
         self, 
@@ -318,60 +641,171 @@ class Neo4jAdapter(GraphDatabase):
         Returns:
             List[Dict[str, Any]]: List of matching nodes
         """
+        results = [node async for node in self.iter_nodes_by_label(label, filters, limit)]
+        
+        logger.debug("Retrieved %s nodes with label %s", len(results), label)
+        return results
+    
+    async def iter_nodes_by_label(
+        self,
+        label: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all nodes with a specific label as records arrive.
+        
+        Args:
+            label: The label to filter by
+            filters: Optional property filters
+            limit: Optional limit on results
+            
+        Yields:
+            Dict[str, Any]: Matching nodes, one at a time
+        """
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
+        # Filters and the limit are parameters, so the query text only varies by label
+        query = _nodes_by_label_query(label, bool(limit))
+        params = {"filters": filters or {}}
+        if limit:
+            params["limit"] = int(limit)
+        
+        if self.config.get("bulk_read_backend", "bolt") == "http" and (
+            not limit or limit >= self.config.get("http_bulk_threshold", 10000)
+        ):
+            for row in await self._http_read(query, params):
+                node = row[0]
+                node.setdefault("node_id", None)
+                node["labels"] = row[1]
+                node["internal_id"] = row[2]
+                yield node
+            return
+        
         try:
-            # Build WHERE clause for filters
-            where_clauses = []
-            params = {}
-            
-            if filters:
-                for key, value in filters.items():
-                    param_name = f"filter_{key}"
-                    where_clauses.append(f"n.{key} = ${param_name}")
-                    params[param_name] = value
-            
-            where_clause = ""
-            if where_clauses:
-                where_clause = "WHERE " + " AND ".join(where_clauses)
+            async with self.driver.session(
+                database=self.database,
+                default_access_mode=READ_ACCESS
+            ) as session:
+                result = await session.run(query, params)
+                async for record in result:
+                    yield self._record_to_node(record)
             
-            limit_clause = ""
-            if limit:
-                limit_clause = f"LIMIT {limit}"
+        except (Neo4jError, DriverError) as e:
+            logger.error(f"Failed to get nodes by label {label}: {e}")
+            raise DatabaseConnectionError(f"Node query failed: {e}")
+    
+    async def get_nodes_page(
+        self,
+        label: str,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 1000
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve one page of nodes with a specific label, in node_id order.
+        
+        Each page is filtered by the cursor and sorted by node_id in the
+        database. Once ensure_constraints() has created the label's node_id
+        index, the planner can serve the cursor predicate and the ordering
+        from it; without that index every page scans and sorts the label.
+        
+        Args:
+            label: The label to filter by
+            filters: Optional property filters
+            cursor: node_id after which the page starts; None for the first page
+            page_size: Maximum number of nodes per page
             
-            query = f"""
-            MATCH (n:{label})
-            {where_clause}
-            RETURN n, labels(n) as labels, id(n) as internal_id
-            ORDER BY n.node_id
-            {limit_clause}
-            """
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: The page and the cursor
+                for the next one, or None if this is the last page
             
+        Raises:
+            DatabaseConnectionError: If the database is not connected or the query fails
+            ValidationError: If page_size is less than 1
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        if page_size < 1:
+            raise ValidationError(f"page_size must be at least 1, got {page_size}")
+        
+        query = _nodes_page_query(label)
+        
+        try:
             records, _, _ = await self.driver.execute_query(
                 query,
-                **params,
+                cursor=cursor,
+                filters=filters or {},
+                page_size=int(page_size),
                 database_=self.database,
                 routing_=RoutingControl.READ
             )
             
-            results = []
-            for record in records:
-                node = record["n"]
-                result = {
-                    "node_id": node.get("node_id"),
-                    "labels": record["labels"],
-                    "internal_id": record["internal_id"],
-                    **dict(node)
-                }
-                results.append(result)
-            
-            logger.debug(f"Retrieved {len(results)} nodes with label {label}")
-            return results
-            
         except (Neo4jError, DriverError) as e:
-            logger.error(f"Failed to get nodes by label {label}: {e}")
+            logger.error(f"Failed to get page of nodes by label {label}: {e}")
             raise DatabaseConnectionError(f"Node query failed: {e}")
+        
+        rows = [self._record_to_node(record) for record in records]
+        next_cursor = rows[-1]["node_id"] if len(rows) == page_size else None
+        return rows, next_cursor
+    
+    @staticmethod
+    def _record_to_node(record: Any) -> Dict[str, Any]:
+        """Turn an (n, labels, internal_id) record into a node dict."""
+        node = dict(record["n"])
+        node.setdefault("node_id", None)
+        node["labels"] = record["labels"]
+        node["internal_id"] = record["internal_id"]
+        return node
+    
+    async def _http_read(self, query: str, params: Dict[str, Any]) -> List[List[Any]]:
+        """
+        Run a read query through Neo4j's transactional HTTP API.
+        
+        Large scans skip the Bolt driver's per-record object construction this
+        way; rows come back as plain JSON values.
+        
+        Args:
+            query: Cypher query to run
+            params: Query parameters
+            
+        Returns:
+            List[List[Any]]: Result rows, one list of column values per row
+            
+        Raises:
+            DatabaseConnectionError: If the request or the query fails
+        """
+        import httpx
+        
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.config["http_uri"],
+                auth=self._auth,
+                timeout=self._driver_kwargs["connection_acquisition_timeout"]
+            )
+        
+        try:
+            # orjson encodes large parameter payloads far faster than httpx's stdlib json
+            response = await self._http.post(
+                f"/db/{self.database}/tx/commit",
+                content=orjson.dumps(
+                    {"statements": [{"statement": query, "parameters": params}]},
+                    option=orjson.OPT_SERIALIZE_NUMPY
+                ),
+                headers={"Accept": "application/json", "Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP bulk read failed: {e}")
+            raise DatabaseConnectionError(f"HTTP bulk read failed: {e}")
+        
+        body = orjson.loads(response.content)
+        if body.get("errors"):
+            logger.error(f"HTTP bulk read failed: {body['errors']}")
+            raise DatabaseConnectionError(f"HTTP bulk read failed: {body['errors'][0].get('message')}")
+        
+        return [entry["row"] for entry in body["results"][0]["data"]]
     
     async def create_relationship(
         self, 
@@ -401,12 +835,14 @@ class Neo4jAdapter(GraphDatabase):
             properties = {}
         
         # Generate relationship ID
-        rel_id = str(uuid4())
+        rel_id = self.generate_relationship_id()
         properties_with_id = {**properties, "rel_id": rel_id}
         
         try:
             query = f"""
-            MATCH (start {{node_id: $start_node_id}}), (end {{node_id: $end_node_id}})
+            MATCH (start), (end)
+            WHERE {_node_id_predicate("start", "$start_node_id", self._labels)}
+              AND {_node_id_predicate("end", "$end_node_id", self._labels)}
             CREATE (start)-[r:{relationship_type} $properties]->(end)
             RETURN r.rel_id as rel_id
             """
@@ -421,7 +857,7 @@ class Neo4jAdapter(GraphDatabase):
                 result_transformer_=lambda r: r.single(strict=True)
             )
             
-            logger.debug(f"Created {relationship_type} relationship: {rel_id}")
+            logger.debug("Created %s relationship: %s", relationship_type, rel_id)
             return record["rel_id"]
             
         except (Neo4jError, DriverError) as e:
@@ -447,56 +883,111 @@ class Neo4jAdapter(GraphDatabase):
         Returns:
             List[Dict[str, Any]]: List of relationships
         """
+        results = [
+            relationship
+            async for relationship in self.iter_relationships(node_id, relationship_type, direction)
+        ]
+        
+        logger.debug("Retrieved %s relationships for node %s", len(results), node_id)
+        return results
+    
+    async def iter_relationships(
+        self,
+        node_id: str,
+        relationship_type: Optional[str] = None,
+        direction: str = "both"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the relationships of a specific node as records arrive.
+        
+        Args:
+            node_id: The node ID to get relationships for
+            relationship_type: Optional filter by relationship type
+            direction: "incoming", "outgoing", or "both"
+            
+        Yields:
+            Dict[str, Any]: Relationships, one at a time
+        """
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
-        if direction not in ["incoming", "outgoing", "both"]:
+        if direction not in _REL_PATTERNS:
             raise ValidationError("Direction must be 'incoming', 'outgoing', or 'both'")
         
+        query = _relationships_query(direction, relationship_type or None, self._labels)
+        
         try:
-            # Build relationship pattern based on direction
-            if direction == "incoming":
-                rel_pattern = f"(other)-[r{':' + relationship_type if relationship_type else ''}]->(n)"
-            elif direction == "outgoing":
-                rel_pattern = f"(n)-[r{':' + relationship_type if relationship_type else ''}]->(other)"
-            else:  # both
-                rel_pattern = f"(n)-[r{':' + relationship_type if relationship_type else ''}]-(other)"
-            
-            query = f"""
-            MATCH {rel_pattern}
-            WHERE n.node_id = $node_id
-            RETURN r, type(r) as rel_type, id(r) as internal_id,
-                   startNode(r).node_id as start_node_id,
-                   endNode(r).node_id as end_node_id
-            """
-            
-            records, _, _ = await self.driver.execute_query(
-                query,
-                node_id=node_id,
-                database_=self.database,
-                routing_=RoutingControl.READ
-            )
-            
-            results = []
-            for record in records:
-                rel = record["r"]
-                result = {
-                    "rel_id": rel.get("rel_id"),
-                    "type": record["rel_type"],
-                    "internal_id": record["internal_id"],
-                    "start_node_id": record["start_node_id"],
-                    "end_node_id": record["end_node_id"],
-                    **dict(rel)
-                }
-                results.append(result)
-            
-            logger.debug(f"Retrieved {len(results)} relationships for node {node_id}")
-            return results
+            async with self.driver.session(
+                database=self.database,
+                default_access_mode=READ_ACCESS
+            ) as session:
+                result = await session.run(query, node_id=node_id)
+                async for record in result:
+                    rel = dict(record["r"])
+                    rel.setdefault("rel_id", None)
+                    rel["type"] = record["rel_type"]
+                    rel["internal_id"] = record["internal_id"]
+                    rel["start_node_id"] = record["start_node_id"]
+                    rel["end_node_id"] = record["end_node_id"]
+                    yield rel
             
         except (Neo4jError, DriverError) as e:
             logger.error(f"Failed to get relationships for node {node_id}: {e}")
             raise DatabaseConnectionError(f"Relationship query failed: {e}")
     
+    async def traverse(
+        self,
+        start_id: str,
+        max_depth: int = 3,
+        relationship_type: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Find the nodes reachable from a start node within a number of hops.
+        
+        Expands one whole BFS level per query, skipping nodes already seen,
+        so the cost is one round-trip per hop and each node is expanded once.
+        A variable-length MATCH would instead enumerate every path, which
+        grows exponentially on diamond-shaped graphs.
+        
+        Args:
+            start_id: ID of the node to start from
+            max_depth: Maximum number of hops
+            relationship_type: Optional relationship type to follow
+            
+        Returns:
+            Dict[str, int]: Reachable node IDs (excluding the start node)
+                mapped to their distance in hops
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        query = _neighbours_query(relationship_type or None, self._labels)
+        depths = {start_id: 0}
+        frontier = [start_id]
+        
+        try:
+            for depth in range(1, max_depth + 1):
+                next_frontier = await self.driver.execute_query(
+                    query,
+                    frontier=frontier,
+                    visited=list(depths),
+                    database_=self.database,
+                    routing_=RoutingControl.READ,
+                    result_transformer_=lambda r: r.value("node_id")
+                )
+                if not next_frontier:
+                    break
+                for node_id in next_frontier:
+                    depths[node_id] = depth
+                frontier = next_frontier
+            
+        except (Neo4jError, DriverError) as e:
+            logger.error(f"Failed to traverse from node {start_id}: {e}")
+            raise DatabaseConnectionError(f"Traversal failed: {e}")
+        
+        del depths[start_id]
+        return depths
+    
     async def delete_relationship(self, relationship_id: str) -> bool:
         """
         Delete a relationship.
@@ -527,7 +1018,7 @@ class Neo4jAdapter(GraphDatabase):
             
             deleted_count = record["deleted_count"]
             if deleted_count > 0:
-                logger.debug(f"Deleted relationship {relationship_id}")
+                logger.debug("Deleted relationship %s", relationship_id)
                 return True
             else:
                 logger.warning(f"Relationship {relationship_id} not found for deletion")
@@ -568,6 +1059,43 @@ class Neo4jAdapter(GraphDatabase):
         except (Neo4jError, DriverError) as e:
             logger.error(f"Failed to execute query: {e}")
             raise DatabaseConnectionError(f"Query execution failed: {e}")
+        finally:
+            # Raw queries may write to any node
+            self._inflight.clear()
+    
+    async def write_batch(self, func: Callable[[Any], Awaitable[Any]]) -> Any:
+        """
+        Run several write statements in one managed transaction.
+        
+        ``func`` receives the transaction and issues its statements with
+        ``await tx.run(query, parameters)``. The transaction commits once when
+        ``func`` returns, is rolled back if it raises, and is retried on
+        transient errors, so ``func`` must be safe to run more than once.
+        Ingest pipelines should call this once per batch of up to about a
+        thousand operations rather than once per operation.
+        
+        Args:
+            func: Async transaction function
+            
+        Returns:
+            Any: Whatever ``func`` returns
+            
+        Raises:
+            DatabaseConnectionError: If database is not connected or the
+                driver fails to run the batch
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        try:
+            async with self.driver.session(database=self.database) as session:
+                return await session.execute_write(func)
+        except (Neo4jError, DriverError) as e:
+            logger.error(f"Failed to run write batch: {e}")
+            raise DatabaseConnectionError(f"Write batch failed: {e}")
+        finally:
+            # The batch may write to any node
+            self._inflight.clear()
     
     async def clear_all_data(self) -> None:
         """
@@ -580,15 +1108,228 @@ class Neo4jAdapter(GraphDatabase):
             raise DatabaseConnectionError("Database is not connected")
         
         try:
-            # Delete all nodes and relationships
+            # Delete in chunked commits so large graphs don't exhaust server memory.
+            # IN TRANSACTIONS batches the rows fed into the CALL, so the match
+            # has to sit outside it. It also needs an auto-commit transaction,
+            # so this goes through session.run rather than a managed execute_query.
+            async with self.driver.session(database=self.database) as session:
+                result = await session.run(
+                    """
+                    MATCH (n)
+                    CALL { WITH n DETACH DELETE n }
+                    IN TRANSACTIONS OF $chunk ROWS
+                    """,
+                    chunk=self.config.get("clear_chunk", 10000)
+                )
+                await result.consume()
+            
+            logger.warning("Cleared all data from Neo4j database")
+            
+        except (Neo4jError, DriverError) as e:
+            logger.error(f"Failed to clear database: {e}")
+            raise DatabaseConnectionError(f"Database clear failed: {e}")
+        finally:
+            self._inflight.clear()
+    
+    async def create_nodes(self, specs: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Create multiple nodes with one UNWIND query per label.
+        
+        All properties are validated before anything is written, and all
+        label groups are written in a single transaction.
+        
+        Args:
+            specs: List of (label, properties) pairs
+            
+        Returns:
+            List[str]: IDs of the created nodes, in input order
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        for _, properties in specs:
+            self.validate_node_properties(properties)
+        
+        # Labels cannot be parameterized, so group rows per label
+        rows_by_label: Dict[str, List[Dict[str, Any]]] = {}
+        node_ids = []
+        for label, properties in specs:
+            node_id = self.generate_node_id()
+            rows_by_label.setdefault(label, []).append({**properties, "node_id": node_id})
+            node_ids.append(node_id)
+        
+        queries = {label: _bulk_create_nodes_query(label) for label in rows_by_label}
+        
+        async def work(tx):
+            for label, rows in rows_by_label.items():
+                result = await tx.run(queries[label], rows=rows)
+                await result.consume()
+        
+        try:
+            await self.write_batch(work)
+            
+            logger.debug("Created %s nodes in bulk", len(node_ids))
+            return node_ids
+            
+        except (Neo4jError, DriverError) as e:
+            logger.error(f"Failed to create nodes in bulk: {e}")
+            raise DatabaseConnectionError(f"Bulk node creation failed: {e}")
+    
+    async def create_nodes_bulk(self, label: str, properties_list: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create many nodes with the same label using a single UNWIND query.
+        
+        Args:
+            label: Node label shared by all nodes
+            properties_list: Properties of each node
+            
+        Returns:
+            List[str]: IDs of the created nodes, in input order
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        for properties in properties_list:
+            self.validate_node_properties(properties)
+        
+        query = _bulk_create_nodes_query(label)
+        rows = [{**properties, "node_id": self.generate_node_id()} for properties in properties_list]
+        
+        try:
+            node_ids = await self.driver.execute_query(
+                query,
+                rows=rows,
+                database_=self.database,
+                routing_=RoutingControl.WRITE,
+                result_transformer_=lambda r: r.value("node_id")
+            )
+            
+            logger.debug("Created %s %s nodes in bulk", len(node_ids), label)
+            return node_ids
+            
+        except (Neo4jError, DriverError) as e:
+            logger.error(f"Failed to create {label} nodes in bulk: {e}")
+            raise DatabaseConnectionError(f"Bulk node creation failed: {e}")
+    
+    async def upsert_node(self, label: str, node_id: str, properties: Dict[str, Any]) -> str:
+        """
+        Create a node, or merge properties into it if it already exists.
+        
+        Runs as a single MERGE on the node_id constraint's index, so it is one
+        atomic round-trip instead of a lookup followed by a write.
+        
+        Args:
+            label: Node label used when the node is created
+            node_id: ID of the node to create or update
+            properties: Node properties
+            
+        Returns:
+            str: The node ID
+        """
+        return (await self.upsert_nodes_bulk(label, [(node_id, properties)]))[0]
+    
+    async def upsert_nodes_bulk(
+        self,
+        label: str,
+        nodes: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[str]:
+        """
+        Upsert multiple nodes with a single UNWIND ... MERGE query.
+        
+        Args:
+            label: Node label used for nodes that are created
+            nodes: List of (node_id, properties) pairs
+            
+        Returns:
+            List[str]: The node IDs, in input order
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        for _, properties in nodes:
+            self.validate_node_properties(properties)
+        
+        query = _upsert_nodes_query(label)
+        rows = [{**properties, "node_id": node_id} for node_id, properties in nodes]
+        
+        try:
             await self.driver.execute_query(
-                "MATCH (n) DETACH DELETE n",
+                query,
+                rows=rows,
                 database_=self.database,
                 routing_=RoutingControl.WRITE
             )
             
-            logger.warning("Cleared all data from Neo4j database")
+            logger.debug("Upserted %s %s nodes", len(rows), label)
+            return [row["node_id"] for row in rows]
             
         except (Neo4jError, DriverError) as e:
-            logger.error(f"Failed to clear database: {e}")
-            raise DatabaseConnectionError(f"Database clear failed: {e}") 
\ No newline at end of file
+            logger.error(f"Failed to upsert {label} nodes: {e}")
+            raise DatabaseConnectionError(f"Node upsert failed: {e}")
+        finally:
+            self._forget_reads(*(node_id for node_id, _ in nodes))
+    
+    async def create_relationships(
+        self,
+        specs: List[Tuple[str, str, str, Optional[Dict[str, Any]]]]
+    ) -> List[str]:
+        """
+        Create multiple relationships with one UNWIND query per relationship type.
+        
+        All type groups are written in a single transaction, so a missing
+        endpoint rolls back the whole batch.
+        
+        Args:
+            specs: List of (start_node_id, end_node_id, relationship_type, properties) tuples
+            
+        Returns:
+            List[str]: IDs of the created relationships, in input order
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        for _, _, relationship_type, _ in specs:
+            self.validate_relationship_type(relationship_type)
+        
+        # Relationship types cannot be parameterized, so group rows per type
+        rows_by_type: Dict[str, List[Dict[str, Any]]] = {}
+        rel_ids = []
+        for start_node_id, end_node_id, relationship_type, properties in specs:
+            rel_id = self.generate_relationship_id()
+            rows_by_type.setdefault(relationship_type, []).append({
+                "start_node_id": start_node_id,
+                "end_node_id": end_node_id,
+                "properties": {**(properties or {}), "rel_id": rel_id}
+            })
+            rel_ids.append(rel_id)
+        
+        async def work(tx):
+            for relationship_type, rows in rows_by_type.items():
+                query = f"""
+                UNWIND $rows AS row
+                MATCH (start), (end)
+                WHERE {_node_id_predicate("start", "row.start_node_id", self._labels)}
+                  AND {_node_id_predicate("end", "row.end_node_id", self._labels)}
+                CREATE (start)-[r:{relationship_type}]->(end)
+                SET r = row.properties
+                RETURN count(r) as created_count
+                """
+                
+                result = await tx.run(query, rows=rows)
+                record = await result.single(strict=True)
+                
+                # Raising inside the transaction function rolls back the batch
+                if record["created_count"] < len(rows):
+                    raise NodeNotFoundError(
+                        f"One or more nodes not found for {relationship_type} relationships"
+                    )
+        
+        try:
+            await self.write_batch(work)
+            
+            logger.debug("Created %s relationships in bulk", len(rel_ids))
+            return rel_ids
+            
+        except (Neo4jError, DriverError) as e:
+            logger.error(f"Failed to create relationships in bulk: {e}")
+            raise DatabaseConnectionError(f"Bulk relationship creation failed: {e}")
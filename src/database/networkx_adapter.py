@@ -6,14 +6,15 @@ in-memory graph operations with JSON file persistence.
 """
 
 import asyncio
-import json
 import logging
+import mmap
 import os
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 import networkx as nx
+import orjson
 from networkx.readwrite import json_graph
 
 from .base import (
@@ -26,6 +27,238 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# fdatasync skips syncing file metadata; fall back to fsync where it's missing
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# Node attributes that identify a node rather than describe it; they are
+# neither indexed nor stored as property columns
+_UNINDEXED_KEYS = frozenset({"node_id", "label"})
+
+
+def _is_string_column(column: List[Any]) -> bool:
+    """Check whether a column holds only strings, apart from None placeholders."""
+    has_string = False
+    for value in column:
+        if isinstance(value, str):
+            has_string = True
+        elif value is not None:
+            return False
+    return has_string
+
+
+def _rows_to_columns(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert attribute dicts into a struct-of-arrays layout.
+    
+    String columns with few distinct values (relationship types, categories)
+    are dictionary-encoded: stored once under "coded" as their
+    distinct values plus one integer code per row.
+    
+    Args:
+        rows: Attribute dicts, one per element
+        
+    Returns:
+        Dict[str, Any]: "props" mapping each key to a list of values aligned
+                        with rows, "coded" holding the dictionary-encoded
+                        columns, plus "missing" mapping keys that some rows
+                        lack to the indices of those rows (empty sections
+                        are omitted)
+    """
+    count = len(rows)
+    props: Dict[str, list] = {}
+    present: Dict[str, int] = {}
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            column = props.get(key)
+            if column is None:
+                column = props[key] = [None] * count
+                present[key] = 0
+            column[i] = value
+            present[key] += 1
+    
+    missing = {
+        key: [i for i, row in enumerate(rows) if key not in row]
+        for key, seen in present.items()
+        if seen < count
+    }
+    
+    coded = {}
+    for key, column in list(props.items()):
+        if not _is_string_column(column):
+            continue
+        codes_by_value: Dict[Optional[str], int] = {}
+        codes = [codes_by_value.setdefault(value, len(codes_by_value)) for value in column]
+        if len(codes_by_value) * 2 <= count:
+            coded[key] = {"values": list(codes_by_value), "codes": codes}
+            del props[key]
+    
+    columns: Dict[str, Any] = {"props": props}
+    if coded:
+        columns["coded"] = coded
+    if missing:
+        columns["missing"] = missing
+    return columns
+
+
+def _fill_from_columns(rows: List[Dict[str, Any]], columns: Dict[str, Any]) -> None:
+    """
+    Populate attribute dicts from a struct-of-arrays layout.
+    
+    Args:
+        rows: Attribute dicts to fill, one per element
+        columns: Layout produced by _rows_to_columns
+        
+    Raises:
+        ValueError: If a column's length doesn't match the number of rows
+    """
+    count = len(rows)
+    for key, column in columns.get("props", {}).items():
+        if len(column) != count:
+            raise ValueError(f"Column '{key}' has {len(column)} values, expected {count}")
+        for row, value in zip(rows, column):
+            row[key] = value
+    for key, column in columns.get("coded", {}).items():
+        values, codes = column["values"], column["codes"]
+        if len(codes) != count:
+            raise ValueError(f"Column '{key}' has {len(codes)} values, expected {count}")
+        for row, code in zip(rows, codes):
+            row[key] = values[code]
+    for key, indices in columns.get("missing", {}).items():
+        for i in indices:
+            del rows[i][key]
+
+
+def _graph_to_columns(graph: nx.Graph) -> Dict[str, Any]:
+    """
+    Convert a graph into the columnar on-disk layout.
+    
+    Nodes are grouped by label, each group holding its node IDs and property
+    columns; edges hold source/target columns plus attribute columns.
+    
+    Args:
+        graph: The graph to convert
+        
+    Returns:
+        Dict[str, Any]: "labels" and "edges" sections of the data file
+    """
+    groups: Dict[str, list] = {}
+    for node_id, label in graph.nodes(data="label", default=""):
+        groups.setdefault(label, []).append(node_id)
+    
+    nodes = graph._node
+    labels = {}
+    for label, ids in groups.items():
+        rows = [
+            {k: v for k, v in nodes[node_id].items() if k not in _UNINDEXED_KEYS}
+            for node_id in ids
+        ]
+        labels[label] = {"ids": ids, **_rows_to_columns(rows)}
+    
+    sources, targets, edge_rows = [], [], []
+    for u, v, edge_attrs in graph.edges(data=True):
+        sources.append(u)
+        targets.append(v)
+        edge_rows.append(edge_attrs)
+    
+    return {
+        "labels": labels,
+        "edges": {"source": sources, "target": targets, **_rows_to_columns(edge_rows)}
+    }
+
+
+def _write_columns(f: BinaryIO, columns: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+    """
+    Stream the columnar layout to a file.
+    
+    Each label group and edge column is encoded and written on its own, so
+    the encoded document is never held in memory at once.
+    
+    Args:
+        f: Binary file to write to
+        columns: Layout produced by _graph_to_columns
+        metadata: Contents of the "metadata" section
+    """
+    def dump(value: Any) -> bytes:
+        return orjson.dumps(value, default=str)
+    
+    f.write(b'{"labels":{')
+    for i, (label, group) in enumerate(columns["labels"].items()):
+        f.write(b"," if i else b"")
+        f.write(dump(label) + b":" + dump(group))
+    
+    edges = columns["edges"]
+    f.write(b'},"edges":{"source":' + dump(edges["source"]) + b',"target":' + dump(edges["target"]) + b',"props":{')
+    for i, (key, column) in enumerate(edges["props"].items()):
+        f.write(b"," if i else b"")
+        f.write(dump(key) + b":" + dump(column))
+    f.write(b"}")
+    for section in ("coded", "missing"):
+        if section in edges:
+            f.write(b',"' + section.encode() + b'":' + dump(edges[section]))
+    
+    f.write(b'},"metadata":' + dump(metadata) + b"}")
+
+
+def _fsync_directory(path: Path) -> None:
+    """
+    Sync a directory so renames into it survive a crash.
+    
+    Platforms that can't open or sync directories (e.g. Windows) are skipped.
+    
+    Args:
+        path: Directory to sync
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _graph_from_columns(data: Dict[str, Any]) -> Optional[nx.Graph]:
+    """
+    Rebuild a graph from the columnar on-disk layout.
+    
+    The graph's node and adjacency dicts are filled directly rather than
+    through add_nodes_from/add_edges_from, skipping their per-element checks;
+    the file was written by _write_graph, so it holds each node and each
+    node pair once.
+    
+    Args:
+        data: Parsed data file containing "labels" and optionally "edges"
+        
+    Returns:
+        Optional[nx.Graph]: The rebuilt graph, None if the layout is invalid
+    """
+    graph = nx.Graph()
+    nodes, adj = graph._node, graph._adj
+    try:
+        for label, group in data["labels"].items():
+            ids = group["ids"]
+            rows = [{"node_id": node_id, "label": label} for node_id in ids]
+            _fill_from_columns(rows, group)
+            nodes.update(zip(ids, rows))
+            adj.update((node_id, {}) for node_id in ids)
+        
+        edges = data.get("edges") or {"source": [], "target": []}
+        sources, targets = edges["source"], edges["target"]
+        if len(sources) != len(targets):
+            return None
+        edge_rows = [{} for _ in sources]
+        _fill_from_columns(edge_rows, edges)
+        for u, v, edge_attrs in zip(sources, targets, edge_rows):
+            if u not in adj or v not in adj:
+                return None
+            adj[u][v] = adj[v][u] = edge_attrs
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+    return graph
+
 
 class NetworkXAdapter(GraphDatabase):
     """
@@ -44,19 +277,82 @@ class NetworkXAdapter(GraphDatabase):
                 - data_file: Path to JSON file for persistence
                 - auto_save: Whether to auto-save after operations (default: True)
                 - backup_count: Number of backup files to keep (default: 3)
+                - backup_interval_seconds: Minimum time between backups;
+                  0 backs up on every save (default: 0)
+                - auto_save_debounce_ms: Delay used to coalesce auto-saves;
+                  0 saves after every operation (default: 0)
+                - auto_save_max_pending: Number of debounced mutations after
+                  which the save happens without waiting out the delay;
+                  0 means no limit (default: 0)
+                - journal: Append each mutation to a .jsonl journal next to
+                  the data file instead of rewriting it (default: False)
+                - journal_max_bytes: Journal size at which it is compacted
+                  into the data file (default: 16 MiB)
+                - read_optimized: Serve get_relationships from a compressed
+                  sparse row snapshot of the adjacency, rebuilt after
+                  topology changes; suits read-mostly retrieval workloads
+                  (default: False)
         """
         super().__init__(config)
-        self.graph: nx.Graph = nx.Graph()
+        self.graph = nx.Graph()
         self.data_file = Path(config.get("data_file", "data/graph_data.json"))
         self.auto_save = config.get("auto_save", True)
         self.backup_count = config.get("backup_count", 3)
+        self.backup_interval = config.get("backup_interval_seconds", 0)
+        self._last_backup = float("-inf")
+        self.auto_save_debounce = config.get("auto_save_debounce_ms", 0) / 1000
+        self.auto_save_max_pending = config.get("auto_save_max_pending", 0)
+        self.journal = config.get("journal", False)
+        self.journal_max_bytes = config.get("journal_max_bytes", 16 * 1024 * 1024)
+        self.journal_file = self.data_file.with_suffix('.jsonl')
+        self.read_optimized = config.get("read_optimized", False)
         
         # Ensure data directory exists
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Node and relationship tracking
-        self._nodes_by_label: Dict[str, set] = {}
+        self._nodes_by_label: Dict[str, Dict[str, None]] = {}
+        self._attr_index: Dict[Tuple[str, str, Any], set] = {}
+        
+        # Relationship index: rel_id -> position in parallel endpoint arrays,
+        # kept dense by swap-removal so edges can be scanned without walking
+        # the graph's nested adjacency dicts
+        self._rel_index: Dict[str, int] = {}
+        self._edge_src: List[str] = []
+        self._edge_dst: List[str] = []
+        self._edge_rel: List[str] = []
         self._relationship_counter = 0
+        
+        # Debounced auto-save state
+        self._dirty = False
+        self._pending_mutations = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Journal file descriptor, opened on the first journaled mutation
+        self._journal_fd: Optional[int] = None
+        
+        # Serializes saves; created lazily so it binds to the running loop
+        self._save_lock: Optional[asyncio.Lock] = None
+    
+    @property
+    def graph(self) -> nx.Graph:
+        """The underlying NetworkX graph."""
+        return self._graph
+    
+    @graph.setter
+    def graph(self, graph: nx.Graph) -> None:
+        # Hot paths read the graph's node and adjacency dicts directly,
+        # bypassing the view objects built by graph.nodes[...] and friends
+        self._graph = graph
+        self._node = graph._node
+        self._adj = graph._adj
+        
+        # Graph.number_of_edges() walks every node, so the count is kept
+        # up to date by the edge helpers instead
+        self._edge_count = graph.number_of_edges()
+        self._is_connected: Optional[bool] = None
+        self._csr: Optional[Tuple[Dict[str, int], List[int], List[str], List[Dict[str, Any]]]] = None
     
     async def connect(self) -> None:
         """
@@ -67,8 +363,10 @@ class NetworkXAdapter(GraphDatabase):
         """
         try:
             await self._load_graph()
+            if self.read_optimized:
+                self._build_csr()
             self._connected = True
-            logger.info(f"Successfully connected to NetworkX database: {self.data_file}")
+            logger.info("Successfully connected to NetworkX database: %s", self.data_file)
             
         except Exception as e:
             logger.error(f"Failed to connect to NetworkX database: {e}")
@@ -79,7 +377,13 @@ class NetworkXAdapter(GraphDatabase):
         Save the graph and close the connection.
         """
         if self._connected:
+            self._cancel_pending_flush()
             await self._save_graph()
+            self._dirty = False
+            self._pending_mutations = 0
+            if self._journal_fd is not None:
+                os.close(self._journal_fd)
+                self._journal_fd = None
             self._connected = False
             logger.info("Disconnected from NetworkX database")
     
@@ -93,8 +397,8 @@ class NetworkXAdapter(GraphDatabase):
         try:
             # Simple check: verify graph is accessible
             node_count = self.graph.number_of_nodes()
-            edge_count = self.graph.number_of_edges()
-            logger.debug(f"Health check: {node_count} nodes, {edge_count} edges")
+            edge_count = self._edge_count
+            logger.debug("Health check: %s nodes, %s edges", node_count, edge_count)
             return self._connected
         except Exception as e:
             logger.warning(f"Health check failed: {e}")
@@ -127,29 +431,15 @@ class NetworkXAdapter(GraphDatabase):
             node_id = self.generate_node_id()
         
         # Check if node already exists
-        if self.graph.has_node(node_id):
+        if node_id in self._node:
             raise ValidationError(f"Node with ID {node_id} already exists")
         
-        # Prepare node attributes
-        node_attrs = {
-            "node_id": node_id,
-            "label": label,
-            **properties
-        }
-        
-        # Add node to graph
-        self.graph.add_node(node_id, **node_attrs)
-        
-        # Track node by label
-        if label not in self._nodes_by_label:
-            self._nodes_by_label[label] = set()
-        self._nodes_by_label[label].add(node_id)
+        self._add_node(label, node_id, properties)
         
         # Auto-save if enabled
-        if self.auto_save:
-            await self._save_graph()
+        await self._auto_save({"op": "add_node", "id": node_id, "label": label, "attrs": properties})
         
-        logger.debug(f"Created {label} node with ID: {node_id}")
+        logger.debug("Created %s node with ID: %s", label, node_id)
         return node_id
     
     async def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
@@ -165,17 +455,17 @@ class NetworkXAdapter(GraphDatabase):
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
-        if not self.graph.has_node(node_id):
+        if node_id not in self._node:
             return None
         
-        # Get node attributes
-        node_attrs = dict(self.graph.nodes[node_id])
+        # Get node attributes and neighbours straight from the graph's dicts
+        neighbors = self._adj[node_id]
         
         # Add metadata
         result = {
-            **node_attrs,
-            "degree": self.graph.degree(node_id),
-            "neighbors": list(self.graph.neighbors(node_id))
+            **self._node[node_id],
+            "degree": len(neighbors),
+            "neighbors": list(neighbors)
         }
         
         return result
@@ -194,19 +484,17 @@ class NetworkXAdapter(GraphDatabase):
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
-        if not self.graph.has_node(node_id):
+        if node_id not in self._node:
             return False
         
         self.validate_node_properties(properties)
         
-        # Update node attributes
-        self.graph.nodes[node_id].update(properties)
+        self._merge_node_attrs(node_id, properties)
         
         # Auto-save if enabled
-        if self.auto_save:
-            await self._save_graph()
+        await self._auto_save({"op": "update_node", "id": node_id, "attrs": properties})
         
-        logger.debug(f"Updated node {node_id}")
+        logger.debug("Updated node %s", node_id)
         return True
     
     async def delete_node(self, node_id: str) -> bool:
@@ -222,27 +510,15 @@ class NetworkXAdapter(GraphDatabase):
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
-        if not self.graph.has_node(node_id):
+        if node_id not in self._node:
             return False
         
-        # Get node label for tracking cleanup
-        node_attrs = self.graph.nodes[node_id]
-        label = node_attrs.get("label")
-        
-        # Remove node (automatically removes all connected edges)
-        self.graph.remove_node(node_id)
-        
-        # Clean up label tracking
-        if label and label in self._nodes_by_label:
-            self._nodes_by_label[label].discard(node_id)
-            if not self._nodes_by_label[label]:
-                del self._nodes_by_label[label]
+        self._remove_node(node_id)
         
         # Auto-save if enabled
-        if self.auto_save:
-            await self._save_graph()
+        await self._auto_save({"op": "delete_node", "id": node_id})
         
-        logger.debug(f"Deleted node {node_id}")
+        logger.debug("Deleted node %s", node_id)
         return True
     
     async def get_nodes_by_label(
@@ -265,37 +541,113 @@ class NetworkXAdapter(GraphDatabase):
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
-        results = []
+        results = self._select_nodes(label, filters, limit)
         
-        # Get nodes with matching label
-        for node_id, node_attrs in self.graph.nodes(data=True):
-            if node_attrs.get("label") == label:
-                # Apply filters if provided
-                if filters:
-                    match = True
-                    for key, value in filters.items():
-                        if node_attrs.get(key) != value:
-                            match = False
-                            break
-                    if not match:
-                        continue
-                
-                # Build result
-                result = {
-                    **node_attrs,
-                    "degree": self.graph.degree(node_id),
-                    "neighbors": list(self.graph.neighbors(node_id))
-                }
-                results.append(result)
-                
-                # Apply limit if specified
-                if limit and len(results) >= limit:
-                    break
+        logger.debug("Retrieved %s nodes with label %s", len(results), label)
+        return results
+    
+    async def get_nodes_page(
+        self,
+        label: str,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 1000
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Retrieve one page of nodes with a specific label, in node_id order.
+        
+        This is not true keyset pagination: each call re-filters the label
+        by the cursor and sorts the remaining matches, so paging through a
+        label costs O(n log n) per page rather than O(page_size).
+        
+        Args:
+            label: The label to filter by
+            filters: Optional property filters
+            cursor: node_id after which the page starts; None for the first page
+            page_size: Maximum number of nodes per page
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: The page and the cursor
+                for the next one, or None if this is the last page
+            
+        Raises:
+            DatabaseConnectionError: If the database is not connected
+            ValidationError: If page_size is less than 1
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        if page_size < 1:
+            raise ValidationError(f"page_size must be at least 1, got {page_size}")
+        
+        rows = self._select_nodes(label, filters, page_size, after=cursor)
+        next_cursor = rows[-1]["node_id"] if len(rows) == page_size else None
+        return rows, next_cursor
+    
+    def _select_nodes(
+        self,
+        label: str,
+        filters: Optional[Dict[str, Any]],
+        limit: Optional[int],
+        after: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect matching nodes of a label in node_id order.
+        
+        Args:
+            label: The label to filter by
+            filters: Optional property filters
+            limit: Optional limit on results
+            after: Only include node IDs greater than this one
+            
+        Returns:
+            List[Dict[str, Any]]: Matching nodes with degree and neighbors
+        """
+        candidates = self._nodes_by_label.get(label, {}).keys()
+        if after is not None:
+            candidates = {node_id for node_id in candidates if node_id > after}
+        
+        # Narrow candidates through the attribute index; filters that can't
+        # be looked up there are checked per node instead
+        unindexed_filters = {}
+        for key, value in (filters or {}).items():
+            if key in _UNINDEXED_KEYS or value is None:
+                unindexed_filters[key] = value
+                continue
+            try:
+                matches = self._attr_index.get((label, key, value), set())
+            except TypeError:
+                unindexed_filters[key] = value
+                continue
+            candidates = candidates & matches
+            if not candidates:
+                break
+        
+        # Remaining filters are checked with one tuple comparison per node
+        residual_keys = tuple(unindexed_filters)
+        residual_values = tuple(unindexed_filters.values())
+        results = []
+        nodes, adj = self._node, self._adj
         
-        # Sort by node_id for consistent ordering
-        results.sort(key=lambda x: x.get("node_id", ""))
+        # Iterate in node_id order for consistent ordering
+        for node_id in sorted(candidates):
+            node_attrs = nodes[node_id]
+            
+            if residual_keys and tuple(map(node_attrs.get, residual_keys)) != residual_values:
+                continue
+            
+            # Build result
+            neighbors = adj[node_id]
+            result = {
+                **node_attrs,
+                "degree": len(neighbors),
+                "neighbors": list(neighbors)
+            }
+            results.append(result)
+            
+            # Apply limit if specified
+            if limit and len(results) >= limit:
+                break
         
-        logger.debug(f"Retrieved {len(results)} nodes with label {label}")
         return results
     
     async def create_relationship(
@@ -321,9 +673,9 @@ class NetworkXAdapter(GraphDatabase):
             raise DatabaseConnectionError("Database is not connected")
         
         # Validate nodes exist
-        if not self.graph.has_node(start_node_id):
+        if start_node_id not in self._node:
             raise NodeNotFoundError(f"Start node {start_node_id} not found")
-        if not self.graph.has_node(end_node_id):
+        if end_node_id not in self._node:
             raise NodeNotFoundError(f"End node {end_node_id} not found")
         
         self.validate_relationship_type(relationship_type)
@@ -332,8 +684,7 @@ class NetworkXAdapter(GraphDatabase):
             properties = {}
         
         # Generate relationship ID
-        rel_id = str(uuid4())
-        self._relationship_counter += 1
+        rel_id = self.generate_relationship_id()
         
         # Prepare edge attributes
         edge_attrs = {
@@ -345,13 +696,12 @@ class NetworkXAdapter(GraphDatabase):
         }
         
         # Add edge to graph
-        self.graph.add_edge(start_node_id, end_node_id, **edge_attrs)
+        self._add_edge(edge_attrs)
         
         # Auto-save if enabled
-        if self.auto_save:
-            await self._save_graph()
+        await self._auto_save({"op": "add_edge", "attrs": edge_attrs})
         
-        logger.debug(f"Created {relationship_type} relationship: {rel_id}")
+        logger.debug("Created %s relationship: %s", relationship_type, rel_id)
         return rel_id
     
     async def get_relationships(
@@ -374,7 +724,7 @@ class NetworkXAdapter(GraphDatabase):
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
-        if not self.graph.has_node(node_id):
+        if node_id not in self._node:
             return []
         
         if direction not in ["incoming", "outgoing", "both"]:
@@ -382,10 +732,13 @@ class NetworkXAdapter(GraphDatabase):
         
         results = []
         
+        if self.read_optimized:
+            edges = self._fast_neighbors(node_id)
+        else:
+            edges = self._adj[node_id].items()
+        
         # Iterate through all edges connected to the node
-        for neighbor in self.graph.neighbors(node_id):
-            edge_data = self.graph.edges[node_id, neighbor]
-            
+        for neighbor, edge_data in edges:
             # Determine direction
             start_node = edge_data.get("start_node_id", node_id)
             end_node = edge_data.get("end_node_id", neighbor)
@@ -408,9 +761,44 @@ class NetworkXAdapter(GraphDatabase):
             }
             results.append(result)
         
-        logger.debug(f"Retrieved {len(results)} relationships for node {node_id}")
+        logger.debug("Retrieved %s relationships for node %s", len(results), node_id)
         return results
     
+    async def traverse(
+        self,
+        start_id: str,
+        max_depth: int = 3,
+        relationship_type: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Find the nodes reachable from a start node within a number of hops.
+        
+        Args:
+            start_id: ID of the node to start from
+            max_depth: Maximum number of hops
+            relationship_type: Optional relationship type to follow
+            
+        Returns:
+            Dict[str, int]: Reachable node IDs (excluding the start node)
+                mapped to their distance in hops
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        if start_id not in self._node:
+            return {}
+        
+        graph = self.graph
+        if relationship_type is not None:
+            graph = nx.subgraph_view(
+                self.graph,
+                filter_edge=lambda u, v: self._adj[u][v].get("type") == relationship_type
+            )
+        
+        depths = nx.single_source_shortest_path_length(graph, start_id, cutoff=max_depth)
+        del depths[start_id]
+        return depths
+    
     async def delete_relationship(self, relationship_id: str) -> bool:
         """
         Delete a relationship.
@@ -424,17 +812,12 @@ class NetworkXAdapter(GraphDatabase):
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
-        # Find the edge with the given relationship ID
-        for u, v, edge_data in self.graph.edges(data=True):
-            if edge_data.get("rel_id") == relationship_id:
-                self.graph.remove_edge(u, v)
-                
-                # Auto-save if enabled
-                if self.auto_save:
-                    await self._save_graph()
-                
-                logger.debug(f"Deleted relationship {relationship_id}")
-                return True
+        if self._remove_edge(relationship_id):
+            # Auto-save if enabled
+            await self._auto_save({"op": "delete_edge", "id": relationship_id})
+            
+            logger.debug("Deleted relationship %s", relationship_id)
+            return True
         
         logger.warning(f"Relationship {relationship_id} not found for deletion")
         return False
@@ -462,10 +845,13 @@ class NetworkXAdapter(GraphDatabase):
         if query.lower().startswith("count nodes"):
             return {"count": self.graph.number_of_nodes()}
         elif query.lower().startswith("count edges"):
-            return {"count": self.graph.number_of_edges()}
+            return {"count": self._edge_count}
         elif query.lower().startswith("list nodes"):
             return {"nodes": list(self.graph.nodes())}
         elif query.lower().startswith("list edges"):
+            # The endpoint arrays cover every edge unless some lack a rel_id
+            if len(self._edge_rel) == self._edge_count:
+                return {"edges": list(zip(self._edge_src, self._edge_dst))}
             return {"edges": list(self.graph.edges())}
         else:
             raise ValidationError(f"Unsupported query: {query}")
@@ -480,46 +866,617 @@ class NetworkXAdapter(GraphDatabase):
         if not self._connected:
             raise DatabaseConnectionError("Database is not connected")
         
+        self._clear_graph()
+        
+        # Auto-save if enabled
+        await self._auto_save({"op": "clear"})
+        
+        logger.warning("Cleared all data from NetworkX database")
+    
+    # Bulk operations
+    async def create_nodes(self, specs: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Create multiple nodes with a single auto-save.
+        
+        All properties are validated before any node is added.
+        
+        Args:
+            specs: List of (label, properties) pairs
+            
+        Returns:
+            List[str]: IDs of the created nodes, in input order
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        for _, properties in specs:
+            self.validate_node_properties(properties)
+        
+        node_ids = []
+        ops = []
+        for label, properties in specs:
+            node_id = self.generate_node_id()
+            self._add_node(label, node_id, properties)
+            node_ids.append(node_id)
+            ops.append({"op": "add_node", "id": node_id, "label": label, "attrs": properties})
+        
+        # Auto-save once for the whole batch
+        if node_ids:
+            await self._auto_save(*ops)
+        
+        logger.debug("Created %s nodes in bulk", len(node_ids))
+        return node_ids
+    
+    async def upsert_node(self, label: str, node_id: str, properties: Dict[str, Any]) -> str:
+        """
+        Create a node, or merge properties into it if it already exists.
+        
+        Args:
+            label: Node label used when the node is created
+            node_id: ID of the node to create or update
+            properties: Node properties
+            
+        Returns:
+            str: The node ID
+        """
+        return (await self.upsert_nodes_bulk(label, [(node_id, properties)]))[0]
+    
+    async def upsert_nodes_bulk(
+        self,
+        label: str,
+        nodes: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[str]:
+        """
+        Upsert multiple nodes with a single auto-save.
+        
+        All properties are validated before any node is touched.
+        
+        Args:
+            label: Node label used for nodes that are created
+            nodes: List of (node_id, properties) pairs
+            
+        Returns:
+            List[str]: The node IDs, in input order
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        for _, properties in nodes:
+            self.validate_node_properties(properties)
+        
+        ops = []
+        for node_id, properties in nodes:
+            if node_id in self._node:
+                self._merge_node_attrs(node_id, properties)
+                ops.append({"op": "update_node", "id": node_id, "attrs": properties})
+            else:
+                self._add_node(label, node_id, properties)
+                ops.append({"op": "add_node", "id": node_id, "label": label, "attrs": properties})
+        
+        if nodes:
+            await self._auto_save(*ops)
+        
+        logger.debug("Upserted %s %s nodes", len(nodes), label)
+        return [node_id for node_id, _ in nodes]
+    
+    async def create_relationships(
+        self,
+        specs: List[Tuple[str, str, str, Optional[Dict[str, Any]]]]
+    ) -> List[str]:
+        """
+        Create multiple relationships with a single auto-save.
+        
+        All nodes and relationship types are validated before any edge is added.
+        
+        Args:
+            specs: List of (start_node_id, end_node_id, relationship_type, properties) tuples
+            
+        Returns:
+            List[str]: IDs of the created relationships, in input order
+        """
+        if not self._connected:
+            raise DatabaseConnectionError("Database is not connected")
+        
+        for start_node_id, end_node_id, relationship_type, _ in specs:
+            if start_node_id not in self._node:
+                raise NodeNotFoundError(f"Start node {start_node_id} not found")
+            if end_node_id not in self._node:
+                raise NodeNotFoundError(f"End node {end_node_id} not found")
+            self.validate_relationship_type(relationship_type)
+        
+        rel_ids = []
+        ops = []
+        for start_node_id, end_node_id, relationship_type, properties in specs:
+            rel_id = self.generate_relationship_id()
+            edge_attrs = {
+                "rel_id": rel_id,
+                "type": relationship_type,
+                "start_node_id": start_node_id,
+                "end_node_id": end_node_id,
+                **(properties or {})
+            }
+            self._add_edge(edge_attrs)
+            rel_ids.append(rel_id)
+            ops.append({"op": "add_edge", "attrs": edge_attrs})
+        
+        # Auto-save once for the whole batch
+        if rel_ids:
+            await self._auto_save(*ops)
+        
+        logger.debug("Created %s relationships in bulk", len(rel_ids))
+        return rel_ids
+    
+    # Index maintenance
+    def _add_node(self, label: str, node_id: str, properties: Dict[str, Any]) -> None:
+        """Add a new node to the graph and register it in the label and attribute indexes."""
+        # The node is known to be absent, so its dicts are set up directly
+        # rather than through graph.add_node
+        self._node[node_id] = {"node_id": node_id, "label": label, **properties}
+        self._adj[node_id] = {}
+        self._topology_changed()
+        self._nodes_by_label.setdefault(label, {})[node_id] = None
+        self._index_attrs(node_id, label, properties)
+    
+    def _merge_node_attrs(self, node_id: str, properties: Dict[str, Any]) -> None:
+        """Merge properties into an existing node, keeping the attribute index in sync."""
+        node_attrs = self._node[node_id]
+        label = node_attrs.get("label")
+        self._unindex_attrs(node_id, label, {k: node_attrs[k] for k in properties if k in node_attrs})
+        node_attrs.update(properties)
+        self._index_attrs(node_id, label, properties)
+    
+    def _remove_node(self, node_id: str) -> None:
+        """Remove a node and its edges, dropping it from the label and attribute indexes."""
+        node_attrs = self._node[node_id]
+        label = node_attrs.get("label")
+        
+        for _, _, rel_id in self.graph.edges(node_id, data="rel_id"):
+            self._unindex_edge(rel_id)
+        self._edge_count -= len(self._adj[node_id])
+        
+        # Remove node (automatically removes all connected edges)
+        self.graph.remove_node(node_id)
+        self._topology_changed()
+        
+        # Clean up label and attribute tracking
+        self._unindex_attrs(node_id, label, node_attrs)
+        if label and label in self._nodes_by_label:
+            self._nodes_by_label[label].pop(node_id, None)
+            if not self._nodes_by_label[label]:
+                del self._nodes_by_label[label]
+    
+    def _add_edge(self, edge_attrs: Dict[str, Any]) -> None:
+        """
+        Add an edge to the graph and register it in the relationship index.
+        
+        The graph holds one edge per node pair, so an edge replacing an
+        existing one takes over its index entry.
+        
+        Args:
+            edge_attrs: Edge attributes including rel_id, start_node_id and end_node_id
+        """
+        start_node_id, end_node_id = edge_attrs["start_node_id"], edge_attrs["end_node_id"]
+        existing = self._adj[start_node_id].get(end_node_id)
+        if existing is not None:
+            self._unindex_edge(existing.get("rel_id"))
+        else:
+            self._edge_count += 1
+        self.graph.add_edge(start_node_id, end_node_id, **edge_attrs)
+        self._index_edge(edge_attrs["rel_id"], start_node_id, end_node_id)
+        self._topology_changed()
+        self._relationship_counter += 1
+    
+    def _remove_edge(self, relationship_id: str) -> bool:
+        """Remove the edge with the given relationship ID, returning whether it existed."""
+        endpoints = self._unindex_edge(relationship_id)
+        if endpoints is None:
+            return False
+        self.graph.remove_edge(*endpoints)
+        self._edge_count -= 1
+        self._topology_changed()
+        return True
+    
+    def _index_edge(self, rel_id: str, start_node_id: str, end_node_id: str) -> None:
+        """Append an edge to the relationship index."""
+        self._rel_index[rel_id] = len(self._edge_rel)
+        self._edge_src.append(start_node_id)
+        self._edge_dst.append(end_node_id)
+        self._edge_rel.append(rel_id)
+    
+    def _unindex_edge(self, rel_id: Optional[str]) -> Optional[Tuple[str, str]]:
+        """
+        Remove an edge from the relationship index.
+        
+        The last entry is moved into the freed slot so the arrays stay dense.
+        
+        Args:
+            rel_id: The relationship ID
+            
+        Returns:
+            Optional[Tuple[str, str]]: The edge's endpoints, None if it wasn't indexed
+        """
+        idx = self._rel_index.pop(rel_id, None)
+        if idx is None:
+            return None
+        endpoints = (self._edge_src[idx], self._edge_dst[idx])
+        
+        last = len(self._edge_rel) - 1
+        if idx != last:
+            moved = self._edge_rel[last]
+            self._edge_src[idx] = self._edge_src[last]
+            self._edge_dst[idx] = self._edge_dst[last]
+            self._edge_rel[idx] = moved
+            self._rel_index[moved] = idx
+        self._edge_src.pop()
+        self._edge_dst.pop()
+        self._edge_rel.pop()
+        return endpoints
+    
+    def _reset_edge_index(self) -> None:
+        """Empty the relationship index."""
+        self._rel_index = {}
+        self._edge_src = []
+        self._edge_dst = []
+        self._edge_rel = []
+    
+    def _clear_graph(self) -> None:
+        """Remove all nodes and edges and reset the indexes."""
         self.graph.clear()
+        self._edge_count = 0
+        self._topology_changed()
         self._nodes_by_label.clear()
+        self._attr_index.clear()
+        self._reset_edge_index()
         self._relationship_counter = 0
+    
+    def _topology_changed(self) -> None:
+        """Drop cached structures derived from the graph's nodes and edges."""
+        self._is_connected = None
+        self._csr = None
+    
+    def _build_csr(self) -> None:
+        """
+        Build a compressed sparse row snapshot of the adjacency.
         
-        # Auto-save if enabled
-        if self.auto_save:
+        Each node's neighbours and edge attribute dicts occupy one contiguous
+        slice of two flat lists, located through an offsets list.
+        """
+        position: Dict[str, int] = {}
+        indptr = [0]
+        neighbors: List[str] = []
+        edges: List[Dict[str, Any]] = []
+        for i, (node_id, node_adj) in enumerate(self._adj.items()):
+            position[node_id] = i
+            neighbors.extend(node_adj)
+            edges.extend(node_adj.values())
+            indptr.append(len(neighbors))
+        self._csr = (position, indptr, neighbors, edges)
+    
+    def _fast_neighbors(self, node_id: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Get a node's (neighbour, edge attributes) pairs from the CSR snapshot.
+        
+        Args:
+            node_id: ID of an existing node
+            
+        Returns:
+            Iterator[Tuple[str, Dict[str, Any]]]: Pairs of neighbour ID and
+                edge attributes
+        """
+        if self._csr is None:
+            self._build_csr()
+        position, indptr, neighbors, edges = self._csr
+        i = position[node_id]
+        start, end = indptr[i], indptr[i + 1]
+        return zip(neighbors[start:end], edges[start:end])
+    
+    def _index_attrs(self, node_id: str, label: Optional[str], attrs: Dict[str, Any]) -> None:
+        """
+        Add a node's hashable attribute values to the attribute index.
+        
+        Args:
+            node_id: The node ID
+            label: The node label
+            attrs: Attribute values to index
+        """
+        for key, value in attrs.items():
+            if key in _UNINDEXED_KEYS:
+                continue
+            try:
+                self._attr_index.setdefault((label, key, value), set()).add(node_id)
+            except TypeError:
+                # Unhashable values (lists, dicts) are filtered by scanning
+                continue
+    
+    def _unindex_attrs(self, node_id: str, label: Optional[str], attrs: Dict[str, Any]) -> None:
+        """
+        Remove a node's attribute values from the attribute index.
+        
+        Args:
+            node_id: The node ID
+            label: The node label
+            attrs: Attribute values to remove
+        """
+        for key, value in attrs.items():
+            if key in _UNINDEXED_KEYS:
+                continue
+            try:
+                index_key = (label, key, value)
+                node_ids = self._attr_index.get(index_key)
+            except TypeError:
+                continue
+            if node_ids is not None:
+                node_ids.discard(node_id)
+                if not node_ids:
+                    del self._attr_index[index_key]
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the label, attribute and relationship indexes from the graph."""
+        self._nodes_by_label = {}
+        self._attr_index = {}
+        for node_id, node_attrs in self.graph.nodes(data=True):
+            label = node_attrs.get("label")
+            if label is not None:
+                self._nodes_by_label.setdefault(label, {})[node_id] = None
+            self._index_attrs(node_id, label, node_attrs)
+        
+        self._reset_edge_index()
+        for u, v, rel_id in self.graph.edges(data="rel_id"):
+            if rel_id is not None:
+                self._index_edge(rel_id, u, v)
+    
+    # Auto-save methods
+    async def _auto_save(self, *ops: Dict[str, Any]) -> None:
+        """
+        Persist a mutation according to the auto-save settings.
+        
+        With journaling enabled the mutation's op records are appended to the
+        journal, which is compacted into the data file once it grows past
+        journal_max_bytes. Otherwise saves immediately unless a debounce delay
+        is configured, in which case the graph is marked dirty and a single
+        deferred save is scheduled for all mutations made within the delay,
+        or made right away once auto_save_max_pending mutations are pending.
+        
+        Args:
+            ops: Op records describing the mutation, replayed on load
+        """
+        if not self.auto_save:
+            return
+        
+        if self.journal:
+            if self._append_journal(ops) >= self.journal_max_bytes:
+                await self._save_graph()
+            return
+        
+        if self.auto_save_debounce <= 0:
             await self._save_graph()
+            return
         
-        logger.warning("Cleared all data from NetworkX database")
+        self._dirty = True
+        self._pending_mutations += 1
+        if self.auto_save_max_pending and self._pending_mutations >= self.auto_save_max_pending:
+            await self.flush()
+            return
+        
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.auto_save_debounce, self._start_background_flush)
+    
+    def _start_background_flush(self) -> None:
+        """Timer callback that runs the deferred save as a task."""
+        self._flush_handle = None
+        self._flush_task = asyncio.ensure_future(self._background_flush())
+    
+    async def _background_flush(self) -> None:
+        """Run a deferred save, logging instead of raising on failure."""
+        try:
+            await self.flush()
+        except DatabaseConnectionError as e:
+            logger.error(f"Deferred auto-save failed: {e}")
+    
+    def _cancel_pending_flush(self) -> None:
+        """Cancel a scheduled deferred save, if any."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+    
+    async def flush(self) -> None:
+        """
+        Write pending changes to disk immediately.
+        
+        Only needed when auto-save is debounced; disconnect() always saves.
+        """
+        self._cancel_pending_flush()
+        
+        if self._dirty:
+            self._dirty = False
+            self._pending_mutations = 0
+            try:
+                await self._save_graph()
+            except DatabaseConnectionError:
+                self._dirty = True
+                raise
+    
+    # Journal methods
+    def _append_journal(self, ops: Tuple[Dict[str, Any], ...]) -> int:
+        """
+        Append op records to the journal, one JSON line each.
+        
+        The records are written straight to the journal's descriptor and
+        synced with fdatasync, which skips flushing file metadata, so a
+        mutation is durable once this returns.
+        
+        Args:
+            ops: Op records to append
+            
+        Returns:
+            int: The journal size after the write
+            
+        Raises:
+            DatabaseConnectionError: If the journal can't be written
+        """
+        try:
+            if self._journal_fd is None:
+                self._journal_fd = os.open(self.journal_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._write_journal(b"".join(
+                orjson.dumps(op, default=str, option=orjson.OPT_APPEND_NEWLINE) for op in ops
+            ))
+            return os.fstat(self._journal_fd).st_size
+        except OSError as e:
+            logger.error(f"Failed to write journal: {e}")
+            raise DatabaseConnectionError(f"Journal write failed: {e}")
+    
+    def _write_journal(self, data: bytes) -> None:
+        """Write bytes to the end of the open journal and sync them to disk."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._journal_fd, view):]
+        _fdatasync(self._journal_fd)
+    
+    def _journal_size(self) -> int:
+        """Return the current journal size in bytes."""
+        if self._journal_fd is not None:
+            return os.fstat(self._journal_fd).st_size
+        try:
+            return self.journal_file.stat().st_size
+        except FileNotFoundError:
+            return 0
+    
+    def _truncate_journal(self, upto: int) -> None:
+        """
+        Discard journaled mutations once they are contained in the data file.
+        
+        The kept tail is written to a synced temporary file that atomically
+        replaces the journal, so a crash mid-truncation leaves either the old
+        or the new journal on disk, never an empty one.
+        
+        Args:
+            upto: Journal size when the saved state was captured; records
+                  appended after that point are kept
+        """
+        if self._journal_fd is None:
+            # Only holds mutations that were replayed into the saved graph
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+            return
+        
+        tail = b""
+        if self._journal_size() > upto:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(upto)
+                tail = f.read()
+        
+        temp_file = self.journal_file.with_name(self.journal_file.name + '.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(tail)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.journal_file)
+        _fsync_directory(self.journal_file.parent)
+        
+        # The open descriptor still points at the replaced journal
+        os.close(self._journal_fd)
+        self._journal_fd = os.open(self.journal_file, os.O_WRONLY | os.O_APPEND)
+    
+    def _replay_journal(self) -> int:
+        """
+        Apply the journaled mutations on top of the loaded data file.
+        
+        A torn record at the end of the journal (from an interrupted write)
+        ends the replay.
+        
+        Returns:
+            int: Number of op records applied
+        """
+        if not self.journal_file.exists():
+            return 0
+        
+        with open(self.journal_file, 'rb') as f:
+            lines = f.read().splitlines()
+        
+        applied = 0
+        for line in lines:
+            try:
+                op = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning("Ignoring torn record at the end of journal %s", self.journal_file)
+                break
+            self._apply_op(op)
+            applied += 1
+        return applied
+    
+    def _apply_op(self, op: Dict[str, Any]) -> None:
+        """
+        Apply a single journaled op record to the graph.
+        
+        Args:
+            op: Op record written by _auto_save
+        """
+        kind = op.get("op")
+        if kind == "add_node":
+            if op["id"] in self._node:
+                self._merge_node_attrs(op["id"], op["attrs"])
+            else:
+                self._add_node(op["label"], op["id"], op["attrs"])
+        elif kind == "update_node":
+            if op["id"] in self._node:
+                self._merge_node_attrs(op["id"], op["attrs"])
+        elif kind == "delete_node":
+            if op["id"] in self._node:
+                self._remove_node(op["id"])
+        elif kind == "add_edge":
+            edge_attrs = op["attrs"]
+            start_node_id, end_node_id = edge_attrs["start_node_id"], edge_attrs["end_node_id"]
+            if start_node_id in self._node and end_node_id in self._node:
+                self._add_edge(edge_attrs)
+        elif kind == "delete_edge":
+            self._remove_edge(op["id"])
+        elif kind == "clear":
+            self._clear_graph()
+        else:
+            logger.warning("Skipping unknown journal op: %s", kind)
     
     # File persistence methods
     async def _save_graph(self) -> None:
         """
         Save the graph to JSON file.
+        
+        The graph is converted to columns on the event loop, so it can't
+        change mid-save; encoding and writing the file run in a worker thread
+        so other coroutines keep being served meanwhile.
         """
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+        
+        async with self._save_lock:
+            await self._save_graph_locked()
+    
+    async def _save_graph_locked(self) -> None:
+        """Save the graph to JSON file, with the save lock held."""
         try:
-            # Create backup if file exists
-            if self.data_file.exists() and self.backup_count > 0:
-                await self._create_backup()
-            
-            # Convert graph to JSON data
-            data = {
-                "graph": json_graph.node_link_data(self.graph, edges="links"),
-                "metadata": {
-                    "nodes_by_label": {k: list(v) for k, v in self._nodes_by_label.items()},
-                    "relationship_counter": self._relationship_counter,
-                    "node_count": self.graph.number_of_nodes(),
-                    "edge_count": self.graph.number_of_edges()
-                }
+            columns = _graph_to_columns(self.graph)
+            metadata = {
+                "relationship_counter": self._relationship_counter,
+                "node_count": self.graph.number_of_nodes(),
+                "edge_count": self._edge_count
             }
+            journaled = self._journal_size()
             
-            # Write to temporary file first, then move (atomic operation)
-            temp_file = self.data_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Create backup if file exists and the last one is old enough
+            if (
+                self.data_file.exists()
+                and self.backup_count > 0
+                and time.monotonic() - self._last_backup >= self.backup_interval
+            ):
+                await self._create_backup()
             
-            # Atomic move
-            temp_file.replace(self.data_file)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_data_file, columns, metadata)
             
-            logger.debug(f"Saved graph to {self.data_file}")
+            # The data file now durably holds every mutation journaled before the save
+            self._truncate_journal(journaled)
+            
+            logger.debug("Saved graph to %s", self.data_file)
             
         except Exception as e:
             # Clean up temp file if it exists
@@ -532,68 +1489,140 @@ class NetworkXAdapter(GraphDatabase):
             logger.error(f"Failed to save graph: {e}")
             raise DatabaseConnectionError(f"Graph save failed: {e}")
     
+    def _write_data_file(self, columns: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+        """
+        Write the data file through a temporary file and an atomic move.
+        
+        The temporary file and then the directory entry are synced before
+        returning, so the journal may be truncated once this completes.
+        
+        Args:
+            columns: Layout produced by _graph_to_columns
+            metadata: Contents of the "metadata" section
+        """
+        # Write to temporary file first, then move (atomic operation)
+        temp_file = self.data_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            _write_columns(f, columns, metadata)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # Atomic move
+        temp_file.replace(self.data_file)
+        _fsync_directory(self.data_file.parent)
+    
+    def _read_data_file(self) -> Any:
+        """
+        Parse the data file.
+        
+        Returns:
+            Any: The parsed JSON document
+        """
+        # Parse straight from a read-only mapping of the file rather than
+        # copying it into a bytes object first
+        with open(self.data_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                memoryview(mapped) as view:
+            return orjson.loads(view)
+    
     async def _load_graph(self) -> None:
+        """
+        Load the graph from JSON file, then replay the journal on top of it.
+        
+        Raises:
+            DatabaseConnectionError: If the journal can't be read
+        """
+        await self._load_snapshot()
+        
+        try:
+            applied = self._replay_journal()
+        except (OSError, KeyError, TypeError) as e:
+            logger.error(f"Failed to replay journal: {e}")
+            raise DatabaseConnectionError(f"Journal replay failed: {e}")
+        if applied:
+            logger.info("Replayed %s journaled changes from %s", applied, self.journal_file)
+    
+    async def _load_snapshot(self) -> None:
         """
         Load the graph from JSON file.
         """
         if not self.data_file.exists():
-            logger.info(f"Data file {self.data_file} doesn't exist, starting with empty graph")
+            logger.info("Data file %s doesn't exist, starting with empty graph", self.data_file)
             return
         
         # Check if file is empty
         if self.data_file.stat().st_size == 0:
-            logger.info(f"Data file {self.data_file} is empty, starting with empty graph")
+            logger.info("Data file %s is empty, starting with empty graph", self.data_file)
             return
         
         try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-            
-            # Load graph
-            graph_data = data.get("graph", {})
-            
-            # Validate graph data structure before loading
-            if not isinstance(graph_data, dict) or "nodes" not in graph_data:
-                logger.warning(f"Invalid graph structure in {self.data_file}. Expected 'nodes' field. Starting with empty graph.")
-                self.graph = nx.Graph()
-                self._nodes_by_label = {}
-                self._relationship_counter = 0
-                return
-            
-            # Validate that nodes is a list
-            if not isinstance(graph_data.get("nodes"), list):
-                logger.warning(f"Invalid nodes data in {self.data_file}. Expected list. Starting with empty graph.")
-                self.graph = nx.Graph()
-                self._nodes_by_label = {}
-                self._relationship_counter = 0
-                return
-            
-            # Validate that links is a list (if present)
-            if "links" in graph_data and not isinstance(graph_data.get("links"), list):
-                logger.warning(f"Invalid links data in {self.data_file}. Expected list. Starting with empty graph.")
-                self.graph = nx.Graph()
-                self._nodes_by_label = {}
-                self._relationship_counter = 0
-                return
-            
-            self.graph = json_graph.node_link_graph(graph_data, edges="links")
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, self._read_data_file)
+            
+            # Load graph, accepting both the columnar layout and the
+            # node-link layout written by earlier versions
+            if "labels" in data:
+                graph = _graph_from_columns(data)
+                if graph is None:
+                    logger.warning(f"Invalid columnar graph data in {self.data_file}. Starting with empty graph.")
+                    self.graph = nx.Graph()
+                    self._nodes_by_label = {}
+                    self._attr_index = {}
+                    self._reset_edge_index()
+                    self._relationship_counter = 0
+                    return
+                self.graph = graph
+            else:
+                graph_data = data.get("graph", {})
+                
+                # Validate graph data structure before loading
+                if not isinstance(graph_data, dict) or "nodes" not in graph_data:
+                    logger.warning(f"Invalid graph structure in {self.data_file}. Expected 'nodes' field. Starting with empty graph.")
+                    self.graph = nx.Graph()
+                    self._nodes_by_label = {}
+                    self._attr_index = {}
+                    self._reset_edge_index()
+                    self._relationship_counter = 0
+                    return
+                
+                # Validate that nodes is a list
+                if not isinstance(graph_data.get("nodes"), list):
+                    logger.warning(f"Invalid nodes data in {self.data_file}. Expected list. Starting with empty graph.")
+                    self.graph = nx.Graph()
+                    self._nodes_by_label = {}
+                    self._attr_index = {}
+                    self._reset_edge_index()
+                    self._relationship_counter = 0
+                    return
+                
+                # Validate that links is a list (if present)
+                if "links" in graph_data and not isinstance(graph_data.get("links"), list):
+                    logger.warning(f"Invalid links data in {self.data_file}. Expected list. Starting with empty graph.")
+                    self.graph = nx.Graph()
+                    self._nodes_by_label = {}
+                    self._attr_index = {}
+                    self._reset_edge_index()
+                    self._relationship_counter = 0
+                    return
+                
+                self.graph = json_graph.node_link_graph(graph_data, edges="links")
             
             # Load metadata (handle case where metadata might be null)
             metadata = data.get("metadata", {})
             if metadata is None:
                 metadata = {}
-            self._nodes_by_label = {
-                k: set(v) for k, v in metadata.get("nodes_by_label", {}).items()
-            }
+            self._rebuild_indexes()
             self._relationship_counter = metadata.get("relationship_counter", 0)
             
-            logger.info(f"Loaded graph with {self.graph.number_of_nodes()} nodes and {self.graph.number_of_edges()} edges")
+            logger.info("Loaded graph with %s nodes and %s edges", self.graph.number_of_nodes(), self._edge_count)
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Invalid JSON in data file {self.data_file}: {e}. Starting with empty graph.")
             # Start with empty graph instead of failing
             self.graph = nx.Graph()
             self._nodes_by_label = {}
+            self._attr_index = {}
+            self._reset_edge_index()
             self._relationship_counter = 0
         except Exception as e:
             logger.error(f"Failed to load graph: {e}")
@@ -618,12 +1647,19 @@ class NetworkXAdapter(GraphDatabase):
             if backup_file.exists():
                 backup_file.unlink()
             self.data_file.rename(backup_file)
+            self._last_backup = time.monotonic()
             
-            logger.debug(f"Created backup: {backup_file}")
+            logger.debug("Created backup: %s", backup_file)
             
         except Exception as e:
             logger.warning(f"Failed to create backup: {e}")
     
+    def _graph_is_connected(self) -> bool:
+        """Check whether the graph is connected, reusing the answer until the topology changes."""
+        if self._is_connected is None:
+            self._is_connected = nx.is_connected(self.graph) if self.graph.number_of_nodes() > 0 else True
+        return self._is_connected
+    
     def get_graph_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the current graph.
@@ -633,8 +1669,8 @@ class NetworkXAdapter(GraphDatabase):
         """
         return {
             "node_count": self.graph.number_of_nodes(),
-            "edge_count": self.graph.number_of_edges(),
+            "edge_count": self._edge_count,
             "nodes_by_label": {k: len(v) for k, v in self._nodes_by_label.items()},
-            "is_connected": nx.is_connected(self.graph) if self.graph.number_of_nodes() > 0 else True,
-            "average_degree": sum(dict(self.graph.degree()).values()) / max(1, self.graph.number_of_nodes())
+            "is_connected": self._graph_is_connected(),
+            "average_degree": 2 * self._edge_count / max(1, self.graph.number_of_nodes())
         } 
\ No newline at end of file
@@ -5,12 +5,86 @@ This module defines the Learnt data model that captures validated solutions
 to problems and supports meta-rule contribution tracking.
 """
 
-import uuid
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Callable
+import logging
+import os
+from types import MappingProxyType
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Mapping, Optional, Callable, Tuple
+from typing_extensions import Annotated
 from enum import Enum
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+import orjson
+from pydantic import (
+    BaseModel, ConfigDict, Field, PrivateAttr, StringConstraints,
+    field_serializer, model_validator
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Text that is stripped and must be non-empty, checked inside pydantic-core
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+SummaryStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=500)]
+
+# Random UUIDs are formatted in batches from one os.urandom call
+_UUID_POOL_SIZE = 256
+_uuid_pool: List[str] = []
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not hand out the parent's remaining IDs
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _refill_uuid_pool() -> None:
+    """Format a batch of random version 4 UUID strings into the pool."""
+    buf = os.urandom(16 * _UUID_POOL_SIZE)
+    batch = []
+    for i in range(0, len(buf), 16):
+        value = int.from_bytes(buf[i:i + 16], "big")
+        # Set the RFC 4122 variant and version 4 bits, as uuid.uuid4() does
+        value = (value & ~(0xc000 << 48)) | (0x8000 << 48)
+        value = (value & ~(0xf000 << 64)) | (0x4000 << 64)
+        h = "%032x" % value
+        batch.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    _uuid_pool.extend(batch)
+
+
+def _next_uuid() -> str:
+    """
+    Take a random version 4 UUID string from the pool.
+    
+    Returns:
+        str: UUID in canonical 8-4-4-4-12 hex form
+    """
+    while True:
+        try:
+            return _uuid_pool.pop()
+        except IndexError:
+            _refill_uuid_pool()
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+# Example shown in the generated JSON schema, read-only so schemas cannot alter it
+_LEARNT_SCHEMA_EXAMPLE: Mapping[str, Any] = MappingProxyType({
+    "type_of_error": "IncorrectAction",
+    "problem_summary": "AI suggested using deprecated React lifecycle method",
+    "problematic_input_segment": "How do I fetch data in React?",
+    "problematic_ai_output_segment": "Use componentWillMount() to fetch data",
+    "inferred_original_cause": "Outdated React knowledge from training data",
+    "original_severity": "major",
+    "validated_solution_description": "Use useEffect() hook with empty dependency array for data fetching in functional components",
+    "solution_implemented_notes": "Updated React best practices rule to emphasize hooks over lifecycle methods",
+    "related_rule_ids": ("rule-abc-123",)
+})
 
 
 class ErrorType(str, Enum):
@@ -33,6 +107,17 @@ class SeverityLevel(str, Enum):
     LOW = "low"
 
 
+# Accepted values of Learnt.verification_status
+_VALID_STATUSES = frozenset({"validated", "pending", "rejected"})
+
+# Value to member lookups that avoid the Enum.__call__ dispatch
+_ERROR_TYPE_MAP: Dict[str, ErrorType] = {e.value: e for e in ErrorType}
+_SEVERITY_MAP: Dict[str, SeverityLevel] = {s.value: s for s in SeverityLevel}
+
+# Lowercased error type values used in meta-rule contribution text
+_ERROR_TYPE_LOWER: Dict[str, str] = {e.value: e.value.lower() for e in ErrorType}
+
+
 class Learnt(BaseModel):
     """
     Learnt model for capturing validated solutions to problems.
@@ -43,12 +128,12 @@ class Learnt(BaseModel):
     
     # Core PRD attributes
     learnt_id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=_next_uuid,
         description="Unique identifier for the learnt solution"
     )
     
     timestamp_recorded: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utc_now,
         description="ISO timestamp when the learning was recorded"
     )
     
@@ -57,22 +142,18 @@ class Learnt(BaseModel):
         description="Type of error that was encountered"
     )
     
-    problem_summary: str = Field(
+    problem_summary: SummaryStr = Field(
         ...,
-        min_length=1,
-        max_length=500,
         description="Concise AI-generated problem summary"
     )
     
-    problematic_input_segment: str = Field(
+    problematic_input_segment: NonEmptyStr = Field(
         ...,
-        min_length=1,
         description="User input part that caused the problem"
     )
     
-    problematic_ai_output_segment: str = Field(
+    problematic_ai_output_segment: NonEmptyStr = Field(
         ...,
-        min_length=1,
         description="Incorrect AI output that caused the issue"
     )
     
@@ -87,9 +168,8 @@ class Learnt(BaseModel):
         description="Severity level of the original problem"
     )
     
-    validated_solution_description: str = Field(
+    validated_solution_description: NonEmptyStr = Field(
         ...,
-        min_length=1,
         description="Detailed description of the proven solution"
     )
     
@@ -135,64 +215,27 @@ class Learnt(BaseModel):
         description="Additional metadata for the learning"
     )
     
-    # Callback for meta-rule updates  
-    meta_rule_update_callback: Optional[Callable] = Field(
-        default=None,
-        exclude=True,
-        description="Callback function to trigger meta-rule updates"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        json_schema_extra = {
-            "example": {
-                "type_of_error": "IncorrectAction",
-                "problem_summary": "AI suggested using deprecated React lifecycle method",
-                "problematic_input_segment": "How do I fetch data in React?",
-                "problematic_ai_output_segment": "Use componentWillMount() to fetch data",
-                "inferred_original_cause": "Outdated React knowledge from training data",
-                "original_severity": "major",
-                "validated_solution_description": "Use useEffect() hook with empty dependency array for data fetching in functional components",
-                "solution_implemented_notes": "Updated React best practices rule to emphasize hooks over lifecycle methods",
-                "related_rule_ids": ["rule-abc-123"]
-            }
-        }
+    # Callback for meta-rule updates, kept out of the schema and serialization
+    _meta_rule_update_callback: Optional[Callable] = PrivateAttr(default=None)
     
-    @field_validator("problem_summary")
-    @classmethod
-    def validate_problem_summary(cls, v):
-        """Validate problem summary format."""
-        if not v.strip():
-            raise ValueError("Problem summary cannot be empty")
-        return v.strip()
+    # ISO string of timestamp_recorded, paired with the datetime it was made from
+    _iso_cache: Optional[Tuple[datetime, str]] = PrivateAttr(default=None)
     
-    @field_validator("problematic_input_segment")
-    @classmethod
-    def validate_problematic_input(cls, v):
-        """Validate problematic input segment."""
-        if not v.strip():
-            raise ValueError("Problematic input segment cannot be empty")
-        return v.strip()
+    # Formatted __str__ and __repr__, paired with the field values they display
+    _str_cache: Optional[Tuple[Tuple[Any, ...], str]] = PrivateAttr(default=None)
+    _repr_cache: Optional[Tuple[Tuple[Any, ...], str]] = PrivateAttr(default=None)
     
-    @field_validator("problematic_ai_output_segment")
-    @classmethod
-    def validate_problematic_output(cls, v):
-        """Validate problematic AI output segment."""
-        if not v.strip():
-            raise ValueError("Problematic AI output segment cannot be empty")
-        return v.strip()
+    model_config = ConfigDict(
+        use_enum_values=True,
+        defer_build=True,
+        extra="ignore",
+        json_schema_extra=lambda schema, model: schema.update(example=dict(_LEARNT_SCHEMA_EXAMPLE)),
+    )
     
-    @field_validator("validated_solution_description")
-    @classmethod
-    def validate_solution_description(cls, v):
-        """Validate solution description."""
-        if not v.strip():
-            raise ValueError("Validated solution description cannot be empty")
-        return v.strip()
+    @field_serializer("timestamp_recorded", when_used="json")
+    def serialize_timestamp(self, value: datetime) -> str:
+        """Serialize the recorded timestamp as an ISO 8601 string."""
+        return value.isoformat()
     
     @model_validator(mode='after')
     def validate_meta_rule_contribution(self):
@@ -210,21 +253,56 @@ class Learnt(BaseModel):
         Returns:
             Dict[str, Any]: Dictionary representation of the learnt solution
         """
-        data = self.dict(exclude={"meta_rule_update_callback"})
+        data = self.__dict__.copy()
+        
+        # Copy containers so the caller cannot mutate this instance through them
+        data["related_rule_ids"] = list(self.related_rule_ids)
+        data["tags"] = list(self.tags)
+        data["metadata"] = dict(self.metadata)
         
         # Convert datetime to ISO format string
         if data.get("timestamp_recorded"):
-            data["timestamp_recorded"] = data["timestamp_recorded"].isoformat()
+            data["timestamp_recorded"] = self._timestamp_iso()
         
         return data
     
+    def to_json(self) -> bytes:
+        """
+        Serialize the learnt solution to compact JSON with orjson.
+        
+        Naive timestamps are treated as UTC, matching how they are recorded.
+        
+        Returns:
+            bytes: UTF-8 encoded JSON document
+        """
+        return orjson.dumps(self.__dict__, default=str, option=orjson.OPT_NAIVE_UTC)
+    
+    def _timestamp_iso(self) -> str:
+        """
+        Get timestamp_recorded as an ISO 8601 string, formatting it once.
+        
+        Returns:
+            str: ISO format of the recorded timestamp
+        """
+        timestamp = self.timestamp_recorded
+        private = self.__pydantic_private__
+        cached = private["_iso_cache"]
+        if cached is not None and cached[0] is timestamp:
+            return cached[1]
+        
+        iso = timestamp.isoformat()
+        private["_iso_cache"] = (timestamp, iso)
+        return iso
+    
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Learnt":
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> "Learnt":
         """
         Create a Learnt instance from a dictionary.
         
         Args:
             data: Dictionary containing learnt solution data
+            trusted: Skip validation because the data came from to_dict or
+                the database and is already well-formed
             
         Returns:
             Learnt: New Learnt instance
@@ -233,6 +311,14 @@ class Learnt(BaseModel):
         if "timestamp_recorded" in data and isinstance(data["timestamp_recorded"], str):
             data["timestamp_recorded"] = datetime.fromisoformat(data["timestamp_recorded"])
         
+        if trusted:
+            # Enums are stored as their plain values, as use_enum_values would
+            for key in ("type_of_error", "original_severity"):
+                value = data.get(key)
+                if isinstance(value, Enum):
+                    data[key] = value.value
+            return cls.model_construct(**data)
+        
         return cls(**data)
     
     def set_meta_rule_update_callback(self, callback: Callable) -> None:
@@ -242,7 +328,7 @@ class Learnt(BaseModel):
         Args:
             callback: Function to call when meta-rule updates are needed
         """
-        self.meta_rule_update_callback = callback
+        self._meta_rule_update_callback = callback
     
     def trigger_meta_rule_update(self) -> bool:
         """
@@ -263,17 +349,16 @@ class Learnt(BaseModel):
             self.contributed_to_meta_rule = True
             
             # Call the callback if set
-            if self.meta_rule_update_callback:
-                self.meta_rule_update_callback(self)
+            if self._meta_rule_update_callback:
+                self._meta_rule_update_callback(self)
                 return True
             
             # If no callback is set, just mark as ready for contribution
             return True
             
-        except Exception as e:
+        except Exception:
             # Log error but don't fail the operation
-            # In production, this would use proper logging
-            print(f"Error triggering meta-rule update: {e}")
+            logger.exception("Error triggering meta-rule update")
             return False
     
     def _generate_meta_rule_contribution(self) -> str:
@@ -283,9 +368,10 @@ class Learnt(BaseModel):
         Returns:
             str: Formatted contribution text for meta-rule aggregation
         """
+        error_type = self.type_of_error
         return (
-            f"To avoid {self.type_of_error.lower()}: {self.problem_summary}. "
-            f"Solution: {self.validated_solution_description[:200]}{'...' if len(self.validated_solution_description) > 200 else ''}"
+            f"To avoid {_ERROR_TYPE_LOWER.get(error_type) or error_type.lower()}: {self.problem_summary}. "
+            f"Solution: {_truncate(self.validated_solution_description, 200)}"
         )
     
     def add_related_rule_id(self, rule_id: str) -> None:
@@ -313,23 +399,60 @@ class Learnt(BaseModel):
             return True
         return False
     
-    def update_verification_status(self, status: str) -> None:
+    def update_verification_status(self, status: str, skip_meta_trigger: bool = False) -> None:
         """
         Update the verification status of this learning.
         
         Args:
             status: New verification status (validated, pending, rejected)
+            skip_meta_trigger: Leave the meta-rule update to the caller, e.g.
+                batch_mark_validated
         """
-        if status not in ["validated", "pending", "rejected"]:
+        if status not in _VALID_STATUSES:
             raise ValueError("Status must be one of: validated, pending, rejected")
         
         self.verification_status = status
         
         # If status changes to validated, it might be ready for meta-rule contribution
-        if status == "validated" and not self.contributed_to_meta_rule:
+        if status == "validated" and not self.contributed_to_meta_rule and not skip_meta_trigger:
             # Auto-trigger meta-rule update for newly validated solutions
             self.trigger_meta_rule_update()
     
+    @classmethod
+    def batch_mark_validated(
+        cls,
+        learnts: List["Learnt"],
+        callback: Optional[Callable[[List["Learnt"]], Any]] = None
+    ) -> List["Learnt"]:
+        """
+        Mark many learnings as validated and prepare their meta-rule contributions.
+        
+        Per-instance callbacks are not invoked; instead the learnings that
+        became ready for the meta-rule are handed to callback in one call.
+        
+        Args:
+            learnts: Learnings to mark as validated
+            callback: Optional function receiving the newly contributed learnings
+            
+        Returns:
+            List[Learnt]: Learnings that were newly marked as contributed
+        """
+        ready = []
+        for learnt in learnts:
+            learnt.update_verification_status("validated", skip_meta_trigger=True)
+            if learnt.contributed_to_meta_rule:
+                continue
+            
+            if not learnt.meta_rule_contribution:
+                learnt.meta_rule_contribution = learnt._generate_meta_rule_contribution()
+            learnt.contributed_to_meta_rule = True
+            ready.append(learnt)
+        
+        if callback is not None and ready:
+            callback(ready)
+        
+        return ready
+    
     def get_learning_summary(self) -> Dict[str, str]:
         """
         Get a concise summary of this learning for display purposes.
@@ -339,11 +462,11 @@ class Learnt(BaseModel):
         """
         return {
             "id": self.learnt_id,
-            "timestamp": self.timestamp_recorded.isoformat(),
+            "timestamp": self._timestamp_iso(),
             "error_type": self.type_of_error,
             "severity": self.original_severity,
             "problem": self.problem_summary,
-            "solution": self.validated_solution_description[:100] + "..." if len(self.validated_solution_description) > 100 else self.validated_solution_description,
+            "solution": _truncate(self.validated_solution_description, 100),
             "meta_rule_ready": str(self.contributed_to_meta_rule)
         }
     
@@ -377,13 +500,24 @@ class Learnt(BaseModel):
         Returns:
             Learnt: New Learnt instance
         """
+        try:
+            type_of_error = _ERROR_TYPE_MAP[error_type]
+        except KeyError:
+            # Members and unknown values go through the enum, which raises ValueError
+            type_of_error = ErrorType(error_type)
+        
+        try:
+            original_severity = _SEVERITY_MAP[severity]
+        except KeyError:
+            original_severity = SeverityLevel(severity)
+        
         return cls(
-            type_of_error=ErrorType(error_type),
+            type_of_error=type_of_error,
             problem_summary=problem_summary,
             problematic_input_segment=problematic_input,
             problematic_ai_output_segment=problematic_output,
             inferred_original_cause=root_cause,
-            original_severity=SeverityLevel(severity),
+            original_severity=original_severity,
             validated_solution_description=solution,
             solution_implemented_notes=implementation_notes,
             **kwargs
@@ -391,11 +525,25 @@ class Learnt(BaseModel):
     
     def __str__(self) -> str:
         """String representation of the learnt solution."""
-        return f"Learning: {self.type_of_error} - {self.problem_summary[:50]}..."
+        # Keyed on the displayed values, so assignments and model_copy(update=...)
+        # can't leave stale text behind
+        key = (self.type_of_error, self.problem_summary)
+        private = self.__pydantic_private__
+        cached = private["_str_cache"]
+        if cached is None or cached[0] != key:
+            cached = (key, f"Learning: {key[0]} - {key[1][:50]}...")
+            private["_str_cache"] = cached
+        return cached[1]
     
     def __repr__(self) -> str:
         """Detailed string representation."""
-        return (
-            f"Learnt(id={self.learnt_id}, error_type={self.type_of_error}, "
-            f"severity={self.original_severity}, contributed={self.contributed_to_meta_rule})"
-        ) 
\ No newline at end of file
+        key = (self.learnt_id, self.type_of_error, self.original_severity, self.contributed_to_meta_rule)
+        private = self.__pydantic_private__
+        cached = private["_repr_cache"]
+        if cached is None or cached[0] != key:
+            cached = (key, (
+                f"Learnt(id={key[0]}, error_type={key[1]}, "
+                f"severity={key[2]}, contributed={key[3]})"
+            ))
+            private["_repr_cache"] = cached
+        return cached[1] 
\ No newline at end of file
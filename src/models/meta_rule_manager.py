@@ -6,15 +6,44 @@ The MetaRuleManager manages the creation, updating, and aggregation of meta-rule
 based on learnt experiences.
 """
 
+import io
 import logging
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Set
 from collections import defaultdict, Counter
 
 from .rule import Rule, RuleCategory, RuleType
 from .learnt import Learnt, ErrorType, SeverityLevel
 
 
+# Fixed text around the generated sections of the meta-rule content
+_CONTENT_HEADER = "\n".join([
+    "# AI Learning Aggregator - Validated Solutions",
+    "",
+    "This meta-rule contains aggregated knowledge from validated AI learning experiences.",
+    "Total learnt experiences processed: "
+])
+
+_CONTENT_FOOTER = "\n".join([
+    "## Actionable Guidance:",
+    "",
+    "Based on the aggregated learning experiences, focus on:",
+    "1. Preventing the most common error types listed above",
+    "2. Implementing validated solutions for recurring problems",
+    "3. Following patterns that have proven successful",
+    "",
+    "## Meta-Learning Principles:",
+    "",
+    "- Always validate solutions before implementing",
+    "- Learn from both successful and failed approaches",
+    "- Continuously update knowledge based on new experiences",
+    "- Focus on error prevention rather than just error correction",
+    "",
+    "*This content is automatically generated and updated. Source learnt experiences: "
+])
+
+
 class MetaRuleManager:
     """
     Core manager for the meta-rule system.
@@ -40,6 +69,16 @@ class MetaRuleManager:
         self._meta_rule: Optional[Rule] = None
         self._tracked_learnt_nodes: Set[str] = set()
         self._aggregation_stats: Dict[str, Any] = {}
+        # Inputs the meta-rule content was last rendered from, and the
+        # statistics and guidance text rendered from them
+        self._content_signature: Optional[Tuple[Any, ...]] = None
+        self._content_body: Optional[str] = None
+        # Set while batched_updates defers content rebuilds
+        self._suppress_rebuild = False
+        # Clock reading shared by every update in the current batch
+        self._batch_now: Optional[datetime] = None
+        self._batch_now_iso: Optional[str] = None
+        self._batch_now_human: Optional[str] = None
         
     @property
     def meta_rule(self) -> Optional[Rule]:
@@ -79,8 +118,9 @@ class MetaRuleManager:
             content=initial_content,
             **kwargs
         )
+        self._content_signature = None
         
-        self.logger.info(f"Initialized meta-rule: {self._meta_rule.rule_id}")
+        self.logger.info("Initialized meta-rule: %s", self._meta_rule.rule_id)
         
         return self._meta_rule
     
@@ -111,12 +151,12 @@ class MetaRuleManager:
             
             # Skip if already processed
             if learnt.learnt_id in self._tracked_learnt_nodes:
-                self.logger.debug(f"Learnt {learnt.learnt_id} already processed")
+                self.logger.debug("Learnt %s already processed", learnt.learnt_id)
                 return False
             
             # Only process validated solutions
             if learnt.verification_status != "validated":
-                self.logger.debug(f"Skipping non-validated learnt {learnt.learnt_id}")
+                self.logger.debug("Skipping non-validated learnt %s", learnt.learnt_id)
                 return False
             
             # Set up callback for meta-rule updates
@@ -125,15 +165,16 @@ class MetaRuleManager:
             # Trigger the learnt node to contribute to meta-rule
             if learnt.trigger_meta_rule_update():
                 # Add learnt ID to meta-rule sources
-                meta_rule.add_source_learnt_id(learnt.learnt_id)
+                meta_rule.add_source_learnt_id(learnt.learnt_id, now=self._batch_now)
                 
                 # Track this learnt node
                 self._tracked_learnt_nodes.add(learnt.learnt_id)
                 
                 # Update the meta-rule content with aggregated knowledge
-                self._update_meta_rule_content()
+                if not self._suppress_rebuild:
+                    self._update_meta_rule_content()
                 
-                self.logger.info(f"Successfully added learnt {learnt.learnt_id} to meta-rule")
+                self.logger.info("Successfully added learnt %s to meta-rule", learnt.learnt_id)
                 return True
             
             else:
@@ -144,6 +185,53 @@ class MetaRuleManager:
             self.logger.error(f"Error adding learnt experience {learnt.learnt_id}: {e}")
             return False
     
+    @contextmanager
+    def batched_updates(self) -> Iterator[None]:
+        """
+        Defer meta-rule content rebuilds until the block exits.
+        
+        Learnt experiences added inside the block are aggregated as usual, but
+        the meta-rule content is regenerated only once on exit. The clock is
+        read once for the whole batch.
+        
+        Yields:
+            None
+        """
+        previous = self._suppress_rebuild
+        if not previous:
+            now = datetime.utcnow()
+            self._batch_now = now
+            self._batch_now_iso = now.isoformat()
+            self._batch_now_human = now.strftime('%Y-%m-%d %H:%M:%S UTC')
+        
+        self._suppress_rebuild = True
+        try:
+            yield
+        finally:
+            self._suppress_rebuild = previous
+            if not previous:
+                try:
+                    self._update_meta_rule_content()
+                finally:
+                    self._batch_now = self._batch_now_iso = self._batch_now_human = None
+    
+    def add_learnt_experiences(self, learnts: Iterable[Learnt]) -> int:
+        """
+        Add several learnt experiences with a single content rebuild.
+        
+        Args:
+            learnts: The learnt experiences to incorporate
+            
+        Returns:
+            int: Number of learnt experiences that were added
+        """
+        added = 0
+        with self.batched_updates():
+            for learnt in learnts:
+                if self.add_learnt_experience(learnt):
+                    added += 1
+        return added
+    
     def _on_learnt_update(self, learnt: Learnt) -> None:
         """
         Callback triggered when a learnt node updates the meta-rule.
@@ -151,7 +239,7 @@ class MetaRuleManager:
         Args:
             learnt: The learnt node that triggered the update
         """
-        self.logger.debug(f"Meta-rule update triggered by learnt {learnt.learnt_id}")
+        self.logger.debug("Meta-rule update triggered by learnt %s", learnt.learnt_id)
         
         # Update aggregation stats
         self._update_aggregation_stats(learnt)
@@ -163,8 +251,9 @@ class MetaRuleManager:
         Args:
             learnt: The learnt experience to analyze
         """
-        if not self._aggregation_stats:
-            self._aggregation_stats = {
+        stats = self._aggregation_stats
+        if not stats:
+            stats = self._aggregation_stats = {
                 "error_types": Counter(),
                 "severity_levels": Counter(),
                 "total_learnt": 0,
@@ -172,10 +261,10 @@ class MetaRuleManager:
                 "common_patterns": []
             }
         
-        self._aggregation_stats["error_types"][learnt.type_of_error] += 1
-        self._aggregation_stats["severity_levels"][learnt.original_severity] += 1
-        self._aggregation_stats["total_learnt"] += 1
-        self._aggregation_stats["last_updated"] = datetime.utcnow().isoformat()
+        stats["error_types"][learnt.type_of_error] += 1
+        stats["severity_levels"][learnt.original_severity] += 1
+        stats["total_learnt"] += 1
+        stats["last_updated"] = self._batch_now_iso or datetime.utcnow().isoformat()
     
     def _update_meta_rule_content(self) -> None:
         """
@@ -187,61 +276,84 @@ class MetaRuleManager:
         if not self._meta_rule or not self._tracked_learnt_nodes:
             return
         
-        # Get aggregation statistics
+        # Get aggregation statistics, bound once for the loops below
         stats = self._aggregation_stats
+        error_types = stats.get("error_types")
+        severity_levels = stats.get("severity_levels")
+        total = stats.get("total_learnt", 0)
+        tracked_count = len(self._tracked_learnt_nodes)
+        
+        # Skip the rebuild when nothing shown in the content has changed
+        signature = (
+            tracked_count,
+            total,
+            tuple(error_types.items()) if error_types else (),
+            tuple(severity_levels.items()) if severity_levels else ()
+        )
+        previous = self._content_signature
+        if signature == previous:
+            return
+        
+        # Only the tracked count moved (e.g. a removal), so the statistics
+        # sections rendered last time can be reused as they are
+        body = self._content_body
+        if body is None or previous is None or signature[1:] != previous[1:]:
+            body = self._render_content_body(error_types, severity_levels, total)
         
-        # Build comprehensive meta-rule content
-        content_parts = [
-            "# AI Learning Aggregator - Validated Solutions",
-            "",
-            "This meta-rule contains aggregated knowledge from validated AI learning experiences.",
-            f"Total learnt experiences processed: {len(self._tracked_learnt_nodes)}",
-            f"Last updated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}",
-            "",
-            "## Key Learning Patterns:",
-            ""
-        ]
+        updated = self._batch_now_human or datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+        content = f"{_CONTENT_HEADER}{tracked_count}\nLast updated: {updated}\n{body}{tracked_count}*"
+        
+        # Update the meta-rule content
+        self._meta_rule.update_content(content, now=self._batch_now)
+        self._content_signature = signature
+        self._content_body = body
+        
+        self.logger.info("Updated meta-rule content with %s learnt experiences", len(self._tracked_learnt_nodes))
+    
+    @staticmethod
+    def _render_content_body(
+        error_types: Optional[Counter],
+        severity_levels: Optional[Counter],
+        total: int
+    ) -> str:
+        """
+        Render the statistics sections and guidance of the meta-rule content.
+        
+        Args:
+            error_types: Occurrences per error type
+            severity_levels: Occurrences per severity level
+            total: Total learnt experiences the percentages are relative to
+            
+        Returns:
+            str: Content from the learning patterns heading through the footer
+        """
+        inv_total = 100.0 / total if total else 0.0
+        
+        out = io.StringIO()
+        write = out.write
+        write("\n## Key Learning Patterns:\n\n")
         
         # Add error type insights
-        if stats.get("error_types"):
-            content_parts.append("### Common Error Types:")
-            for error_type, count in stats["error_types"].most_common():
-                percentage = (count / stats["total_learnt"]) * 100
-                content_parts.append(f"- {error_type}: {count} occurrences ({percentage:.1f}%)")
-            content_parts.append("")
+        if error_types:
+            write("### Common Error Types:\n")
+            write("".join([
+                f"- {error_type}: {count} occurrences ({count * inv_total:.1f}%)\n"
+                for error_type, count in error_types.most_common()
+            ]))
+            write("\n")
         
         # Add severity insights
-        if stats.get("severity_levels"):
-            content_parts.append("### Severity Distribution:")
-            for severity, count in stats["severity_levels"].most_common():
-                percentage = (count / stats["total_learnt"]) * 100
-                content_parts.append(f"- {severity}: {count} occurrences ({percentage:.1f}%)")
-            content_parts.append("")
+        if severity_levels:
+            write("### Severity Distribution:\n")
+            write("".join([
+                f"- {severity}: {count} occurrences ({count * inv_total:.1f}%)\n"
+                for severity, count in severity_levels.most_common()
+            ]))
+            write("\n")
         
         # Add actionable guidance
-        content_parts.extend([
-            "## Actionable Guidance:",
-            "",
-            "Based on the aggregated learning experiences, focus on:",
-            "1. Preventing the most common error types listed above",
-            "2. Implementing validated solutions for recurring problems",
-            "3. Following patterns that have proven successful",
-            "",
-            "## Meta-Learning Principles:",
-            "",
-            "- Always validate solutions before implementing",
-            "- Learn from both successful and failed approaches",
-            "- Continuously update knowledge based on new experiences",
-            "- Focus on error prevention rather than just error correction",
-            "",
-            f"*This content is automatically generated and updated. Source learnt experiences: {len(self._tracked_learnt_nodes)}*"
-        ])
-        
-        # Update the meta-rule content
-        new_content = "\n".join(content_parts)
-        self._meta_rule.update_content(new_content)
-        
-        self.logger.info(f"Updated meta-rule content with {len(self._tracked_learnt_nodes)} learnt experiences")
+        write(_CONTENT_FOOTER)
+        return out.getvalue()
     
     def get_aggregation_summary(self) -> Dict[str, Any]:
         """
@@ -272,12 +384,16 @@ class MetaRuleManager:
             Dict[str, Any]: Learning insights and recommendations
         """
         stats = self._aggregation_stats
+        total = stats.get("total_learnt", 0) if stats else 0
         
-        if not stats or stats.get("total_learnt", 0) == 0:
+        if total == 0:
             return {"message": "No learning data available yet"}
         
+        # One division serves every percentage below
+        inv_total = 100.0 / total
+        
         insights = {
-            "total_experiences": stats.get("total_learnt", 0),
+            "total_experiences": total,
             "most_common_error": None,
             "most_severe_issues": None,
             "learning_velocity": None,
@@ -285,23 +401,25 @@ class MetaRuleManager:
         }
         
         # Identify most common error type
-        if stats.get("error_types"):
-            most_common = stats["error_types"].most_common(1)[0]
+        error_types = stats.get("error_types")
+        if error_types:
+            most_common = error_types.most_common(1)[0]
             insights["most_common_error"] = {
                 "type": most_common[0],
                 "count": most_common[1],
-                "percentage": (most_common[1] / stats["total_learnt"]) * 100
+                "percentage": most_common[1] * inv_total
             }
         
         # Identify severity patterns
-        if stats.get("severity_levels"):
-            critical_count = stats["severity_levels"].get("critical", 0)
-            major_count = stats["severity_levels"].get("major", 0)
+        severity_levels = stats.get("severity_levels")
+        if severity_levels:
+            critical_count = severity_levels.get("critical", 0)
+            major_count = severity_levels.get("major", 0)
             
             insights["most_severe_issues"] = {
                 "critical": critical_count,
                 "major": major_count,
-                "high_severity_percentage": ((critical_count + major_count) / stats["total_learnt"]) * 100
+                "high_severity_percentage": (critical_count + major_count) * inv_total
             }
         
         # Generate recommendations
@@ -316,7 +434,7 @@ class MetaRuleManager:
             if high_severity_pct > 30:
                 recommendations.append(f"High severity issues account for {high_severity_pct:.1f}% - prioritize prevention strategies")
         
-        if stats["total_learnt"] > 10:
+        if total > 10:
             recommendations.append("Consider implementing proactive error detection based on learned patterns")
         
         insights["recommendations"] = recommendations
@@ -356,12 +474,13 @@ class MetaRuleManager:
             # Import meta-rule
             if import_data.get("meta_rule"):
                 self._meta_rule = Rule.from_dict(import_data["meta_rule"])
-                self.logger.info(f"Imported meta-rule: {self._meta_rule.rule_id}")
+                self._content_signature = None
+                self.logger.info("Imported meta-rule: %s", self._meta_rule.rule_id)
             
             # Import tracked learnt IDs
             if import_data.get("tracked_learnt_ids"):
                 self._tracked_learnt_nodes = set(import_data["tracked_learnt_ids"])
-                self.logger.info(f"Imported {len(self._tracked_learnt_nodes)} tracked learnt IDs")
+                self.logger.info("Imported %s tracked learnt IDs", len(self._tracked_learnt_nodes))
             
             # Import aggregation stats
             if import_data.get("aggregation_stats"):
@@ -420,7 +539,7 @@ class MetaRuleManager:
             # to store individual contributions for more precise removal.
             self._update_meta_rule_content()
             
-            self.logger.info(f"Removed learnt experience {learnt_id} from meta-rule")
+            self.logger.info("Removed learnt experience %s from meta-rule", learnt_id)
             return True
             
         except Exception as e:
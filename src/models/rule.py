@@ -185,16 +185,8 @@ class Rule(BaseModel):
         Returns:
             Dict[str, Any]: Dictionary representation of the rule
         """
-        data = self.dict()
-        
-        # Convert datetime objects to ISO format strings
-        if data.get("created_at"):
-            data["created_at"] = data["created_at"].isoformat()
-        
-        if data.get("last_updated"):
-            data["last_updated"] = data["last_updated"].isoformat()
-        
-        return data
+        # JSON mode emits datetimes as ISO format strings in the same pass
+        return self.model_dump(mode="json")
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Rule":
@@ -207,33 +199,29 @@ class Rule(BaseModel):
         Returns:
             Rule: New Rule instance
         """
-        # Convert ISO strings back to datetime objects
-        if "created_at" in data and isinstance(data["created_at"], str):
-            data["created_at"] = datetime.fromisoformat(data["created_at"])
-        
-        if "last_updated" in data and isinstance(data["last_updated"], str):
-            data["last_updated"] = datetime.fromisoformat(data["last_updated"])
-        
+        # ISO strings for created_at and last_updated are parsed by validation
         return cls(**data)
     
-    def update_content(self, new_content: str) -> None:
+    def update_content(self, new_content: str, now: Optional[datetime] = None) -> None:
         """
         Update the rule content and last_updated timestamp for meta-rules.
         
         Args:
             new_content: New content for the rule
+            now: Timestamp to record instead of the current time
         """
         self.content = new_content
         
         if self.is_meta_rule:
-            self.last_updated = datetime.utcnow()
+            self.last_updated = now or datetime.utcnow()
     
-    def add_source_learnt_id(self, learnt_id: str) -> None:
+    def add_source_learnt_id(self, learnt_id: str, now: Optional[datetime] = None) -> None:
         """
         Add a learnt node ID to the source list (meta-rules only).
         
         Args:
             learnt_id: ID of the learnt node that contributed to this meta-rule
+            now: Timestamp to record instead of the current time
             
         Raises:
             ValueError: If called on a non-meta-rule
@@ -243,7 +231,7 @@ class Rule(BaseModel):
         
         if learnt_id not in self.source_learnt_ids:
             self.source_learnt_ids.append(learnt_id)
-            self.last_updated = datetime.utcnow()
+            self.last_updated = now or datetime.utcnow()
     
     def remove_source_learnt_id(self, learnt_id: str) -> bool:
         """
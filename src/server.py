@@ -39,7 +39,7 @@ from .models.rule import RuleCategory, RuleType
 from .models.learnt import ErrorType, SeverityLevel
 
 # Import centralized configuration
-from .config import config, server_config, get_environment_info
+from .config import config, server_config, get_environment_info, get_database, close_database
 
 # Logging is configured by the config module
 logger = logging.getLogger(__name__)
@@ -176,9 +176,19 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Database validation error: {e}")
     
+    # Schema migration: node_id constraints let node lookups seek an index
+    try:
+        db = await get_database()
+        if db.config.get("ensure_constraints") and hasattr(db, "ensure_constraints"):
+            ensured = await db.ensure_constraints()
+            logger.info(f"Ensured node_id constraints for {ensured} labels")
+    except Exception as e:
+        logger.error(f"Constraint migration error: {e}")
+    
     yield
     
     logger.info("Shutting down Graph Database MCP Server...")
+    await close_database()
 
 
 # Initialize FastAPI app
@@ -845,7 +855,7 @@ if __name__ == "__main__":
     port = int(os.getenv("SERVER_PORT", "8000"))
     debug = os.getenv("DEBUG", "false").lower() == "true"
     
-    logger.info(f"Starting server on {host}:{port} (debug={debug})")
+    logger.info("Starting server on %s:%s (debug=%s)", host, port, debug)
     
     uvicorn.run(
         "src.server:app",
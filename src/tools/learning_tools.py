@@ -10,7 +10,7 @@ solution analysis with support for both Neo4j and NetworkX database backends.
 import os
 import asyncio
 from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Import database components
 from ..database import GraphDatabase, DatabaseConnectionError, NodeNotFoundError, ValidationError
@@ -140,9 +140,6 @@ async def record_validated_solution(
         
     except Exception as e:
         raise DatabaseConnectionError(f"Failed to record validated solution in database: {str(e)}")
-    
-    finally:
-        await db.disconnect()
 
 
 async def get_learnt_solutions(
@@ -242,9 +239,6 @@ async def get_learnt_solutions(
         
     except Exception as e:
         raise DatabaseConnectionError(f"Failed to retrieve learnt solutions: {str(e)}")
-    
-    finally:
-        await db.disconnect()
 
 
 async def get_solution_details(learnt_id: str) -> Dict[str, Any]:
@@ -294,7 +288,10 @@ async def get_solution_details(learnt_id: str) -> Dict[str, Any]:
                     timestamp_recorded = None
             
             if timestamp_recorded:
-                enhanced_data["days_since_recorded"] = (datetime.utcnow() - timestamp_recorded).days
+                # Older records stored naive UTC timestamps
+                if timestamp_recorded.tzinfo is None:
+                    timestamp_recorded = timestamp_recorded.replace(tzinfo=timezone.utc)
+                enhanced_data["days_since_recorded"] = (datetime.now(timezone.utc) - timestamp_recorded).days
         
         # Add analysis of related rules
         related_rule_ids = learnt_data.get("related_rule_ids", [])
@@ -327,9 +324,6 @@ async def get_solution_details(learnt_id: str) -> Dict[str, Any]:
         raise
     except Exception as e:
         raise DatabaseConnectionError(f"Failed to retrieve solution details: {str(e)}")
-    
-    finally:
-        await db.disconnect()
 
 
 # ================================
@@ -449,7 +443,7 @@ async def get_recent_solutions(days: int = 7, limit: Optional[int] = None) -> Li
     # Get all solutions and filter by date
     all_solutions = await get_learnt_solutions(limit=None)
     
-    cutoff_date = datetime.utcnow().timestamp() - (days * 24 * 60 * 60)
+    cutoff_date = datetime.now(timezone.utc).timestamp() - (days * 24 * 60 * 60)
     recent_solutions = []
     
     for solution in all_solutions:
@@ -457,6 +451,9 @@ async def get_recent_solutions(days: int = 7, limit: Optional[int] = None) -> Li
         if isinstance(timestamp, str):
             try:
                 timestamp = datetime.fromisoformat(timestamp)
+                # Older records stored naive UTC timestamps
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(tzinfo=timezone.utc)
                 if timestamp.timestamp() >= cutoff_date:
                     recent_solutions.append(solution)
             except:
@@ -491,8 +488,9 @@ async def get_solutions_statistics() -> Dict[str, Any]:
         "recent_solutions_30_days": 0
     }
     
-    cutoff_7_days = datetime.utcnow().timestamp() - (7 * 24 * 60 * 60)
-    cutoff_30_days = datetime.utcnow().timestamp() - (30 * 24 * 60 * 60)
+    now = datetime.now(timezone.utc).timestamp()
+    cutoff_7_days = now - (7 * 24 * 60 * 60)
+    cutoff_30_days = now - (30 * 24 * 60 * 60)
     
     for solution in all_solutions:
         # Count by error type
@@ -516,6 +514,9 @@ async def get_solutions_statistics() -> Dict[str, Any]:
         if isinstance(timestamp, str):
             try:
                 timestamp = datetime.fromisoformat(timestamp)
+                # Older records stored naive UTC timestamps
+                if timestamp.tzinfo is None:
+                    timestamp = timestamp.replace(tzinfo=timezone.utc)
                 timestamp_val = timestamp.timestamp()
                 
                 if timestamp_val >= cutoff_7_days:
@@ -581,9 +582,6 @@ async def update_solution_verification_status(
         raise
     except Exception as e:
         raise DatabaseConnectionError(f"Failed to update verification status: {str(e)}")
-    
-    finally:
-        await db.disconnect()
 
 
 async def validate_database_connection() -> bool:
@@ -599,7 +597,6 @@ async def validate_database_connection() -> bool:
     try:
         db = await get_database()
         health_check = await db.health_check()
-        await db.disconnect()
         return health_check
     except Exception as e:
         raise DatabaseConnectionError(f"Database connection validation failed: {str(e)}")
@@ -111,9 +111,6 @@ async def create_rule(
         
     except Exception as e:
         raise DatabaseConnectionError(f"Failed to create rule in database: {str(e)}")
-    
-    finally:
-        await db.disconnect()
 
 
 async def update_rule(rule_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -187,9 +184,6 @@ async def update_rule(rule_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         raise
     except Exception as e:
         raise DatabaseConnectionError(f"Failed to update rule: {str(e)}")
-    
-    finally:
-        await db.disconnect()
 
 
 async def delete_rule(rule_id: str) -> bool:
@@ -224,9 +218,6 @@ async def delete_rule(rule_id: str) -> bool:
         
     except Exception as e:
         raise DatabaseConnectionError(f"Failed to delete rule: {str(e)}")
-    
-    finally:
-        await db.disconnect()
 
 
 async def get_all_rules(
@@ -300,9 +291,6 @@ async def get_all_rules(
         
     except Exception as e:
         raise DatabaseConnectionError(f"Failed to retrieve rules: {str(e)}")
-    
-    finally:
-        await db.disconnect()
 
 
 async def get_rule_details(rule_id: str) -> Dict[str, Any]:
@@ -365,9 +353,6 @@ async def get_rule_details(rule_id: str) -> Dict[str, Any]:
         raise
     except Exception as e:
         raise DatabaseConnectionError(f"Failed to retrieve rule details: {str(e)}")
-    
-    finally:
-        await db.disconnect()
 
 
 # ================================
@@ -494,7 +479,6 @@ async def validate_database_connection() -> bool:
     try:
         db = await get_database()
         health_check = await db.health_check()
-        await db.disconnect()
         return health_check
     except Exception as e:
         raise DatabaseConnectionError(f"Database connection validation failed: {str(e)}")
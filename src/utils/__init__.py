@@ -0,0 +1,7 @@
+"""
+Shared utilities for the graph database MCP server.
+"""
+
+from .aio_fs import async_rmtree
+
+__all__ = ["async_rmtree"] 
\ No newline at end of file
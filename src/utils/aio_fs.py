@@ -0,0 +1,26 @@
+"""
+Async Filesystem Helpers
+
+This module provides non-blocking wrappers around filesystem operations
+so they can be awaited from async code without stalling the event loop.
+"""
+
+import asyncio
+import functools
+import shutil
+from pathlib import Path
+from typing import Union
+
+
+async def async_rmtree(path: Union[str, Path]) -> None:
+    """
+    Recursively delete a directory tree without blocking the event loop.
+    
+    The removal runs in the default executor; errors (including a missing
+    path) are ignored, matching ``shutil.rmtree(path, ignore_errors=True)``.
+    
+    Args:
+        path: Directory to remove
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, functools.partial(shutil.rmtree, path, ignore_errors=True))
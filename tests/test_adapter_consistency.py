@@ -6,6 +6,7 @@ consistent APIs and implement all required abstract methods.
 """
 
 import asyncio
+import copy
 import inspect
 import os
 import tempfile
@@ -13,8 +14,9 @@ from pathlib import Path
 from typing import Dict, Any
 
 import pytest
+from unittest.mock import patch
 
-from src.database import create_database, GraphDatabase
+from src.database import create_database, resolve_adapter_class, CachedGraphDatabase, GraphDatabase
 from src.database.base import GraphDatabase as BaseGraphDatabase
 from src.database.neo4j_adapter import Neo4jAdapter
 from src.database.networkx_adapter import NetworkXAdapter
@@ -45,6 +47,30 @@ class TestAdapterConsistency:
         with pytest.raises(ValueError, match="Unsupported database type"):
             create_database("invalid", {})
     
+    def test_adapter_class_resolution_cached(self):
+        """Test adapter class dispatch is memoized per db_type."""
+        resolve_adapter_class.cache_clear()
+        
+        assert resolve_adapter_class(" NetworkX ") is NetworkXAdapter
+        assert resolve_adapter_class(" NetworkX ") is NetworkXAdapter
+        assert resolve_adapter_class("neo4j") is Neo4jAdapter
+        
+        info = resolve_adapter_class.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+    
+    def test_public_methods_listing(self):
+        """Test public method listing matches instance introspection."""
+        db = NetworkXAdapter({"data_file": "test.json"})
+        expected = [
+            m for m in dir(db) if not m.startswith('_') and callable(getattr(db, m))
+        ]
+        
+        assert list(db.public_methods()) == expected
+        assert "is_connected" not in Neo4jAdapter.public_methods()
+        assert "get_graph_stats" in NetworkXAdapter.public_methods()
+        assert "get_graph_stats" not in Neo4jAdapter.public_methods()
+    
     def test_method_signatures_consistency(self):
         """Test that both adapters have identical method signatures."""
         # Get methods from base class
@@ -128,6 +154,435 @@ class TestAdapterConsistency:
             finally:
                 await db.disconnect()
     
+    @pytest.mark.asyncio
+    async def test_cached_adapter_invalidates_on_writes(self):
+        """Test the read-through cache serves repeat reads and sees writes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = {
+                "data_file": os.path.join(temp_dir, "test_graph.json"),
+                "cache_ttl": 60
+            }
+            
+            db = create_database("networkx", config)
+            assert isinstance(db, CachedGraphDatabase)
+            assert isinstance(db.adapter, NetworkXAdapter)
+            
+            await db.connect()
+            try:
+                node_id = await db.create_node("Rule", {"name": "cached", "tags": ["a"]})
+                assert len(await db.get_nodes_by_label("Rule")) == 1
+                
+                with patch.object(db.adapter, 'get_node', wraps=db.adapter.get_node) as mock_get:
+                    first = await db.get_node(node_id)
+                    first["name"] = "mutated by caller"
+                    first["tags"].append("b")
+                    second = await db.get_node(node_id)
+                    assert second["name"] == "cached"
+                    assert second["tags"] == ["a"]
+                    assert mock_get.call_count == 1
+                
+                listed = await db.get_nodes_by_label("Rule")
+                listed[0]["tags"].append("c")
+                assert (await db.get_nodes_by_label("Rule"))[0]["tags"] == ["a"]
+                
+                await db.create_node("Rule", {"name": "second"})
+                assert len(await db.get_nodes_by_label("Rule")) == 2
+                
+                await db.update_node(node_id, {"name": "updated"})
+                assert (await db.get_node(node_id))["name"] == "updated"
+                
+                # Adapter-specific methods are delegated
+                assert db.get_graph_stats()["node_count"] == 2
+            finally:
+                await db.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_cached_adapter_targeted_invalidation(self):
+        """Test node writes only drop the cached reads they affect."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = {
+                "data_file": os.path.join(temp_dir, "test_graph.json"),
+                "cache_ttl": 60,
+                "cache_maxsize": 100
+            }
+            
+            db = create_database("networkx", config)
+            await db.connect()
+            try:
+                first_id, second_id, third_id = await db.create_nodes_bulk("Rule", [
+                    {"name": "first"}, {"name": "second"}, {"name": "third"}
+                ])
+                for node_id in (first_id, second_id, third_id):
+                    await db.get_node(node_id)
+                
+                with patch.object(db.adapter, 'get_node', wraps=db.adapter.get_node) as mock_get:
+                    await db.update_node(first_id, {"name": "updated"})
+                    assert (await db.get_node(first_id))["name"] == "updated"
+                    await db.get_node(second_id)
+                    assert mock_get.call_count == 1
+                    
+                    await db.create_relationship(second_id, third_id, "RELATES_TO")
+                    assert (await db.get_node(second_id))["degree"] == 1
+                    await db.get_node(first_id)
+                    assert mock_get.call_count == 2
+                
+                info = db.cache_info()
+                assert info["maxsize"] == 100
+                assert info["hits"] == 2
+                
+                db.cache_clear()
+                assert db.cache_info()["size"] == 0
+            finally:
+                await db.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_cached_adapter_update_during_read(self):
+        """Test a read racing an update does not cache the pre-update node."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = {
+                "data_file": os.path.join(temp_dir, "test_graph.json"),
+                "cache_ttl": 60
+            }
+            
+            db = create_database("networkx", config)
+            await db.connect()
+            try:
+                node_id = await db.create_node("Rule", {"name": "before"})
+                read_started = asyncio.Event()
+                release_read = asyncio.Event()
+                original_get_node = db.adapter.get_node
+                
+                async def slow_get_node(requested_id):
+                    result = await original_get_node(requested_id)
+                    read_started.set()
+                    await release_read.wait()
+                    return result
+                
+                with patch.object(db.adapter, 'get_node', side_effect=slow_get_node):
+                    reader = asyncio.ensure_future(db.get_node(node_id))
+                    await read_started.wait()
+                    await db.update_node(node_id, {"name": "after"})
+                    release_read.set()
+                    assert (await reader)["name"] == "before"
+                
+                assert (await db.get_node(node_id))["name"] == "after"
+            finally:
+                await db.disconnect()
+    
+    def test_neo4j_query_texts_memoized_and_validated(self):
+        """Test Neo4j query strings are reused per label and labels are checked."""
+        from src.database.base import ValidationError
+        from src.database.neo4j_adapter import _create_node_query, _nodes_by_label_query
+        
+        assert _create_node_query("Rule") is _create_node_query("Rule")
+        assert _nodes_by_label_query("Rule", True) is _nodes_by_label_query("Rule", True)
+        
+        with pytest.raises(ValidationError):
+            _create_node_query("Rule) DETACH DELETE (m")
+        with pytest.raises(ValidationError):
+            _nodes_by_label_query("Rule) DETACH DELETE (m", False)
+        with pytest.raises(ValidationError):
+            _create_node_query("KNOWS\n")
+    
+    def test_relationship_type_validation(self):
+        """Test relationship types must be plain identifiers, with no trailing newline."""
+        from src.database.base import ValidationError
+        
+        db = NetworkXAdapter({"data_file": "test.json"})
+        db.validate_relationship_type("KNOWS")
+        
+        for relationship_type in ("KNOWS\n", "", "KNOWS-ABOUT", None):
+            with pytest.raises(ValidationError):
+                db.validate_relationship_type(relationship_type)
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_concurrent_get_node_shares_one_read(self):
+        """Test concurrent get_node calls for one ID issue a single query."""
+        db = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password"
+        })
+        db._connected = True
+        
+        async def fetch(node_id):
+            await asyncio.sleep(0.01)
+            return {"node_id": node_id, "name": "shared"}
+        
+        with patch.object(db, '_fetch_node', side_effect=fetch) as mock_fetch:
+            results = await asyncio.gather(*(db.get_node("n1") for _ in range(5)))
+        
+        assert mock_fetch.call_count == 1
+        assert all(result == {"node_id": "n1", "name": "shared"} for result in results)
+        assert len({id(result) for result in results}) == 5
+        assert db._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_get_node_after_write_skips_older_read(self):
+        """Test get_node after a completed write doesn't join a read started before it."""
+        from unittest.mock import AsyncMock, MagicMock
+        
+        db = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password"
+        })
+        db.driver = MagicMock()
+        db.driver.execute_query = AsyncMock(return_value=([{"updated_id": "n1"}], None, None))
+        db._connected = True
+        
+        stored = {"node_id": "n1", "name": "before", "tags": ["a"]}
+        read_started = asyncio.Event()
+        release_read = asyncio.Event()
+        
+        async def fetch(node_id):
+            snapshot = copy.deepcopy(stored)
+            read_started.set()
+            await release_read.wait()
+            return snapshot
+        
+        with patch.object(db, '_fetch_node', side_effect=fetch) as mock_fetch:
+            stale_reader = asyncio.ensure_future(db.get_node("n1"))
+            await read_started.wait()
+            
+            assert await db.update_node("n1", {"name": "after"})
+            stored["name"] = "after"
+            
+            fresh_reader = asyncio.ensure_future(db.get_node("n1"))
+            await asyncio.sleep(0)
+            release_read.set()
+            
+            assert (await stale_reader)["name"] == "before"
+            fresh = await fresh_reader
+            assert fresh["name"] == "after"
+        
+        assert mock_fetch.call_count == 2
+        
+        # Callers sharing a read don't share nested property values
+        async def shared_fetch(node_id):
+            await asyncio.sleep(0.01)
+            return {"node_id": node_id, "tags": ["a"]}
+        
+        with patch.object(db, '_fetch_node', side_effect=shared_fetch):
+            first, second = await asyncio.gather(db.get_node("n2"), db.get_node("n2"))
+        first["tags"].append("b")
+        assert second["tags"] == ["a"]
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_shared_read_survives_caller_cancellation(self):
+        """Test cancelling the caller that started a shared read doesn't cancel it for others."""
+        db = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password"
+        })
+        db._connected = True
+        
+        async def fetch(node_id):
+            await asyncio.sleep(0.01)
+            return {"node_id": node_id, "name": "shared"}
+        
+        with patch.object(db, '_fetch_node', side_effect=fetch) as mock_fetch:
+            leader = asyncio.ensure_future(db.get_node("n1"))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(db.get_node("n1"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            
+            assert await follower == {"node_id": "n1", "name": "shared"}
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+        
+        assert mock_fetch.call_count == 1
+        assert db._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_health_check_is_memoized(self):
+        """Test health probes are reused while fresh and backed off after failures."""
+        from unittest.mock import AsyncMock, MagicMock
+        
+        db = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password"
+        })
+        db.driver = MagicMock()
+        db.driver.execute_query = AsyncMock()
+        db._connected = True
+        
+        assert await db.health_check()
+        assert await db.health_check()
+        assert db.driver.execute_query.await_count == 1
+        
+        db._last_health_ok = float("-inf")
+        db.driver.execute_query.side_effect = RuntimeError("down")
+        assert not await db.health_check()
+        assert not await db.health_check()
+        assert db.driver.execute_query.await_count == 2
+        assert db._health_cooldown == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_clear_all_data_deletes_in_batches(self):
+        """Test clearing feeds each node into a batched delete of clear_chunk rows."""
+        from unittest.mock import AsyncMock, MagicMock
+        
+        db = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password",
+            "clear_chunk": 500
+        })
+        session = MagicMock()
+        session.run = AsyncMock(return_value=MagicMock(consume=AsyncMock()))
+        db.driver = MagicMock()
+        db.driver.session.return_value.__aenter__ = AsyncMock(return_value=session)
+        db.driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
+        db._connected = True
+        
+        await db.clear_all_data()
+        
+        query = " ".join(session.run.await_args.args[0].split())
+        assert query == "MATCH (n) CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF $chunk ROWS"
+        assert session.run.await_args.kwargs["chunk"] == 500
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_node_lookups_are_label_scoped(self):
+        """Test node_id lookups name the configured labels so they can seek an index."""
+        from unittest.mock import AsyncMock, MagicMock
+        from src.database.base import ValidationError
+        
+        db = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password"
+        })
+        db.driver = MagicMock()
+        db.driver.execute_query = AsyncMock(return_value=None)
+        db._connected = True
+        
+        assert await db.get_node("n1") is None
+        query = " ".join(db.driver.execute_query.await_args.args[0].split())
+        assert query.startswith("MATCH (n) WHERE (n:Rule OR n:Learnt) AND n.node_id = $node_id")
+        
+        unscoped = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password",
+            "labels": []
+        })
+        assert unscoped._node_id_match == "MATCH (n) WHERE n.node_id = $node_id"
+        
+        with pytest.raises(ValidationError):
+            Neo4jAdapter({
+                "uri": "neo4j://localhost:7687",
+                "username": "neo4j",
+                "password": "password",
+                "labels": ["Rule) DETACH DELETE (m"]
+            })
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_write_batch_wraps_driver_errors(self):
+        """Test driver errors from a write batch surface as DatabaseConnectionError."""
+        from unittest.mock import AsyncMock, MagicMock
+        from neo4j.exceptions import ServiceUnavailable
+        from src.database.base import DatabaseConnectionError
+        
+        db = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password"
+        })
+        session = MagicMock()
+        session.execute_write = AsyncMock(side_effect=ServiceUnavailable("down"))
+        db.driver = MagicMock()
+        db.driver.session.return_value.__aenter__ = AsyncMock(return_value=session)
+        db.driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
+        db._connected = True
+        
+        with pytest.raises(DatabaseConnectionError, match="Write batch failed"):
+            await db.write_batch(AsyncMock())
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_ensure_constraints_is_explicit(self):
+        """Test constraints are created on request only, skipping labels that fail."""
+        from unittest.mock import AsyncMock, MagicMock
+        from neo4j.exceptions import ClientError
+        
+        db = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password",
+            "labels": ["Rule", "Learnt"]
+        })
+        db.driver = MagicMock()
+        db.driver.execute_query = AsyncMock(side_effect=[ClientError("duplicate node_id"), None])
+        db._connected = True
+        
+        assert await db.ensure_constraints() == 1
+        assert db.driver.execute_query.await_count == 2
+        assert "Learnt" in db.driver.execute_query.await_args.args[0]
+    
+    @pytest.mark.asyncio
+    async def test_neo4j_http_bulk_read_backend(self):
+        """Test large label scans can be served by the HTTP backend."""
+        import httpx
+        import json
+        
+        db = Neo4jAdapter({
+            "uri": "neo4j://localhost:7687",
+            "username": "neo4j",
+            "password": "password",
+            "bulk_read_backend": "http",
+            "http_uri": "http://localhost:7474"
+        })
+        db._connected = True
+        
+        requests = []
+        
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, json={
+                "results": [{
+                    "columns": ["n", "labels", "internal_id"],
+                    "data": [{"row": [{"node_id": "r1", "title": "Rule"}, ["Rule"], 7]}]
+                }],
+                "errors": []
+            })
+        
+        db._http = httpx.AsyncClient(
+            base_url="http://localhost:7474",
+            transport=httpx.MockTransport(handler)
+        )
+        
+        nodes = await db.get_nodes_by_label("Rule", filters={"title": "Rule"})
+        assert nodes == [{"node_id": "r1", "title": "Rule", "labels": ["Rule"], "internal_id": 7}]
+        assert requests[0]["statements"][0]["parameters"] == {"filters": {"title": "Rule"}}
+        
+        await db._http.aclose()
+        
+        from src.database.base import ValidationError
+        with pytest.raises(ValidationError, match="http_uri"):
+            Neo4jAdapter({
+                "uri": "neo4j://localhost:7687",
+                "username": "neo4j",
+                "password": "password",
+                "bulk_read_backend": "http"
+            })
+    
+    def test_generated_ids_are_time_ordered_uuids(self):
+        """Test generated IDs are valid version 7 UUIDs that sort by time."""
+        import uuid
+        import time
+        
+        db = NetworkXAdapter({"data_file": "test.json"})
+        first = db.generate_node_id()
+        time.sleep(0.002)
+        second = db.generate_relationship_id()
+        
+        assert uuid.UUID(first).version == 7
+        assert len(second) == 36
+        assert first < second
+    
     def _get_abstract_methods(self, cls) -> Dict[str, inspect.Signature]:
         """Get abstract methods and their signatures from a class."""
         methods = {}
@@ -9,6 +9,7 @@ This module tests centralized configuration management including:
 - Factory functions
 """
 
+import asyncio
 import os
 import pytest
 import tempfile
@@ -17,7 +18,7 @@ from unittest.mock import patch, MagicMock, AsyncMock
 from src.config import (
     Config, DatabaseConfig, ServerConfig, LoggingConfig, PerformanceConfig,
     config, db_config, server_config, logging_config, performance_config,
-    get_database, get_db_type, get_db_adapter,
+    get_database, close_database, use_database, get_db_type, get_db_adapter,
     validate_enum_values, is_valid_rule_category, is_valid_rule_type,
     is_valid_error_type, is_valid_severity_level,
     get_environment_info, load_env_file
@@ -55,6 +56,7 @@ class TestDatabaseConfig:
             assert "data_file" in config.config
             assert config.config["data_file"] == "data/graph_data.json"
             assert config.config["enable_backup"] is True
+            assert config.config["cache_ttl"] is None
     
     def test_networkx_custom_config(self):
         """Test NetworkX custom configuration."""
@@ -113,6 +115,7 @@ class TestDatabaseConfig:
             assert config.config["password"] == "custom_password"
             assert config.config["timeout"] == 60
             assert config.config["max_pool_size"] == 20
+            assert config.config["pool_warmup"] == 20
     
     @patch('src.config.create_database')  # Patch in the config module where it's imported
     def test_get_db_adapter_networkx(self, mock_create):
@@ -194,6 +197,16 @@ class TestServerConfig:
         with patch.dict(os.environ, {"CORS_ORIGINS": " http://a.com , http://b.com "}):
             config = ServerConfig()
             assert config.cors_origins == ["http://a.com", "http://b.com"]
+    
+    def test_boolean_values_parsing(self):
+        """Test accepted truthy and falsy boolean values."""
+        for value in ["true", "TRUE", "1", "yes", "on"]:
+            with patch.dict(os.environ, {"DEBUG": value}):
+                assert ServerConfig().debug is True
+        
+        for value in ["false", "0", "no", "off", ""]:
+            with patch.dict(os.environ, {"DEBUG": value}):
+                assert ServerConfig().debug is False
 
 
 class TestLoggingConfig:
@@ -223,6 +236,15 @@ class TestLoggingConfig:
         with patch.dict(os.environ, {"LOG_FILE": "custom/logs/app.log"}):
             LoggingConfig()
             mock_makedirs.assert_called_once_with("custom/logs", exist_ok=True)
+    
+    @patch('os.makedirs')
+    def test_log_directory_created_once(self, mock_makedirs):
+        """Test the log directory is only created once per process."""
+        with patch('src.config._created_dirs', set()), \
+             patch.dict(os.environ, {"LOG_FILE": "once/logs/app.log"}):
+            LoggingConfig()
+            LoggingConfig()
+            mock_makedirs.assert_called_once_with("once/logs", exist_ok=True)
 
 
 class TestPerformanceConfig:
@@ -232,10 +254,11 @@ class TestPerformanceConfig:
         """Test default performance configuration."""
         with patch.dict(os.environ, {}, clear=True):
             config = PerformanceConfig()
-            assert config.enable_caching is True
+            assert config.enable_caching is False
             assert config.cache_ttl == 3600
             assert config.max_workers == 4
             assert config.request_timeout == 30
+            assert config.use_uvloop is False
     
     def test_custom_config(self):
         """Test custom performance configuration."""
@@ -243,13 +266,23 @@ class TestPerformanceConfig:
             "ENABLE_CACHING": "false",
             "CACHE_TTL": "7200",
             "MAX_WORKERS": "8",
-            "REQUEST_TIMEOUT": "60"
+            "REQUEST_TIMEOUT": "60",
+            "USE_UVLOOP": "true"
         }):
             config = PerformanceConfig()
             assert config.enable_caching is False
             assert config.cache_ttl == 7200
             assert config.max_workers == 8
             assert config.request_timeout == 60
+            assert config.use_uvloop is True
+    
+    def test_configure_event_loop_disabled(self):
+        """Test event loop is left untouched when uvloop is disabled."""
+        with patch.dict(os.environ, {"USE_UVLOOP": "false"}):
+            config = PerformanceConfig()
+            with patch('src.config.asyncio.set_event_loop_policy') as mock_set_policy:
+                assert config.configure_event_loop() is False
+                mock_set_policy.assert_not_called()
 
 
 class TestMainConfig:
@@ -289,12 +322,25 @@ class TestMainConfig:
         
         with patch.dict(os.environ, {"GRAPH_DB_TYPE": "networkx"}):
             config = Config()
-            result = config.validate_configuration()
+            result = config.validate_configuration(deep=True)
             
             assert result["valid"] is False
             assert len(result["errors"]) > 0
             assert "Configuration error" in result["errors"][0]
     
+    @patch('src.config.DatabaseConfig.get_db_adapter')
+    def test_validate_configuration_skips_adapter(self, mock_get_adapter):
+        """Test shallow validation checks settings without building an adapter."""
+        with patch.dict(os.environ, {"GRAPH_DB_TYPE": "networkx"}):
+            config = Config()
+            assert config.validate_configuration()["valid"] is True
+            mock_get_adapter.assert_not_called()
+            
+            config.database.config["backup_count"] = "5"
+            result = config.validate_configuration()
+            assert result["valid"] is False
+            assert "backup_count" in result["errors"][0]
+    
     def test_validate_configuration_warnings(self):
         """Test configuration validation warnings."""
         with patch.dict(os.environ, {
@@ -316,6 +362,12 @@ class TestMainConfig:
 class TestFactoryFunctions:
     """Test factory functions."""
     
+    @pytest.fixture(autouse=True)
+    def reset_database_singleton(self):
+        """Ensure each test starts without a cached database instance."""
+        with patch('src.config._db_singleton', None):
+            yield
+    
     @pytest.mark.asyncio
     @patch('src.config.db_config.get_db_adapter')
     async def test_get_database_connected(self, mock_get_adapter):
@@ -340,6 +392,64 @@ class TestFactoryFunctions:
         assert result == mock_adapter
         mock_adapter.connect.assert_called_once()
     
+    @pytest.mark.asyncio
+    @patch('src.config.db_config.get_db_adapter')
+    async def test_get_database_reuses_instance(self, mock_get_adapter):
+        """Test get_database creates the adapter once and reuses it."""
+        mock_adapter = AsyncMock()
+        mock_adapter.is_connected = False
+        
+        async def connect():
+            mock_adapter.is_connected = True
+        
+        mock_adapter.connect.side_effect = connect
+        mock_get_adapter.return_value = mock_adapter
+        
+        first = await get_database()
+        second = await get_database()
+        
+        assert first is second
+        mock_get_adapter.assert_called_once()
+        mock_adapter.connect.assert_called_once()
+    
+    @pytest.mark.asyncio
+    @patch('src.config.db_config.get_db_adapter')
+    async def test_close_database(self, mock_get_adapter):
+        """Test close_database disconnects and drops the shared instance."""
+        first_adapter = AsyncMock()
+        first_adapter.is_connected = True
+        second_adapter = AsyncMock()
+        second_adapter.is_connected = True
+        mock_get_adapter.side_effect = [first_adapter, second_adapter]
+        
+        assert await get_database() is first_adapter
+        await close_database()
+        first_adapter.disconnect.assert_called_once()
+        
+        assert await get_database() is second_adapter
+    
+    @pytest.mark.asyncio
+    @patch('src.config.db_config.get_db_adapter')
+    async def test_use_database_scopes_per_task(self, mock_get_adapter):
+        """Test use_database overrides the shared adapter only within its task."""
+        shared_adapter = AsyncMock()
+        shared_adapter.is_connected = True
+        mock_get_adapter.return_value = shared_adapter
+        
+        async def run_with(adapter):
+            with use_database(adapter):
+                await asyncio.sleep(0)
+                return await get_database()
+        
+        first, second = AsyncMock(), AsyncMock()
+        first.is_connected = second.is_connected = False
+        results = await asyncio.gather(run_with(first), run_with(second))
+        
+        assert results == [first, second]
+        first.connect.assert_called_once()
+        second.connect.assert_called_once()
+        assert await get_database() is shared_adapter
+    
     def test_get_db_type(self):
         """Test get_db_type function."""
         with patch.dict(os.environ, {"GRAPH_DB_TYPE": "neo4j"}):
@@ -11,7 +11,7 @@ import asyncio
 import os
 import tempfile
 import shutil
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -123,7 +123,7 @@ class TestRecordValidatedSolution:
         
         assert result == "test-learnt-123"
         mock_database.create_node.assert_called_once()
-        mock_database.disconnect.assert_called_once()
+        mock_database.disconnect.assert_not_called()
     
     @pytest.mark.asyncio
     @patch('src.tools.learning_tools.get_database')
@@ -462,6 +462,22 @@ class TestGetSolutionsStatistics:
         assert "by_verification_status" in result
         assert result["by_error_type"]["IncorrectAction"] == 1
         assert result["by_severity"]["major"] == 1
+    
+    @patch('src.tools.learning_tools.get_learnt_solutions')
+    @pytest.mark.asyncio
+    async def test_get_solutions_statistics_mixed_timestamps(self, mock_get_solutions):
+        """Test aware and legacy naive UTC timestamps are both counted as recent."""
+        now = datetime.now(timezone.utc)
+        mock_get_solutions.return_value = [
+            {"timestamp_recorded": (now - timedelta(days=1)).isoformat()},
+            {"timestamp_recorded": (now - timedelta(days=10)).replace(tzinfo=None).isoformat()},
+            {"timestamp_recorded": (now - timedelta(days=40)).isoformat()}
+        ]
+        
+        result = await get_solutions_statistics()
+        
+        assert result["recent_solutions_7_days"] == 1
+        assert result["recent_solutions_30_days"] == 2
 
 
 class TestUpdateSolutionVerificationStatus:
@@ -511,7 +527,7 @@ class TestValidateDatabaseConnection:
         
         assert result is True
         mock_database.health_check.assert_called_once()
-        mock_database.disconnect.assert_called_once()
+        mock_database.disconnect.assert_not_called()
     
     @patch('src.tools.learning_tools.get_database')
     @pytest.mark.asyncio
@@ -5,6 +5,7 @@ This test suite validates the complete self-improving AI system functionality,
 including model interactions, data validation, and meta-rule aggregation.
 """
 
+import json
 import pytest
 import tempfile
 import uuid
@@ -143,6 +144,49 @@ class TestLearntModel:
         assert not learnt.contributed_to_meta_rule
         assert learnt.meta_rule_contribution is None
     
+    def test_learnt_timestamp_is_utc_aware(self):
+        """Test that the recorded timestamp is timezone-aware and serialized with its offset."""
+        learnt = Learnt.create_from_error(
+            error_type="Other",
+            problem_summary="Timestamp problem",
+            problematic_input="Input",
+            problematic_output="Output",
+            root_cause="Cause",
+            severity="low",
+            solution="Solution"
+        )
+        
+        assert learnt.timestamp_recorded.utcoffset() == timedelta(0)
+        iso = learnt.to_dict()["timestamp_recorded"]
+        assert iso.endswith("+00:00")
+        assert learnt.get_learning_summary()["timestamp"] == iso
+        
+        # Reassigning the timestamp must not reuse the cached string
+        learnt.timestamp_recorded = datetime(2024, 1, 2, 3, 4, 5)
+        assert learnt.to_dict()["timestamp_recorded"] == "2024-01-02T03:04:05"
+    
+    def test_learnt_ids_are_unique_v4_uuids(self):
+        """Test that pooled learnt IDs are distinct, well-formed version 4 UUIDs."""
+        ids = [
+            Learnt.create_from_error(
+                error_type="Other",
+                problem_summary=f"Problem {i}",
+                problematic_input="Input",
+                problematic_output="Output",
+                root_cause="Cause",
+                severity="low",
+                solution="Solution"
+            ).learnt_id
+            for i in range(300)
+        ]
+        
+        assert len(set(ids)) == len(ids)
+        for learnt_id in ids:
+            parsed = uuid.UUID(learnt_id)
+            assert str(parsed) == learnt_id
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+    
     def test_learnt_validation(self):
         """Test learnt experience validation."""
         # Test empty problem summary
@@ -156,6 +200,54 @@ class TestLearntModel:
                 severity="major",
                 solution="Solution"
             )
+        
+        # Test whitespace-only segment
+        with pytest.raises(ValueError):
+            Learnt.create_from_error(
+                error_type="IncorrectAction",
+                problem_summary="Summary",
+                problematic_input="   ",
+                problematic_output="Output",
+                root_cause="Cause",
+                severity="major",
+                solution="Solution"
+            )
+        
+        # Test surrounding whitespace is stripped
+        learnt = Learnt.create_from_error(
+            error_type="IncorrectAction",
+            problem_summary="  Summary  ",
+            problematic_input="Input",
+            problematic_output="Output",
+            root_cause="Cause",
+            severity="major",
+            solution=" Solution\n"
+        )
+        assert learnt.problem_summary == "Summary"
+        assert learnt.validated_solution_description == "Solution"
+        
+        # Test unknown error type and severity
+        with pytest.raises(ValueError, match="is not a valid ErrorType"):
+            Learnt.create_from_error(
+                error_type="NotAnError",
+                problem_summary="Summary",
+                problematic_input="Input",
+                problematic_output="Output",
+                root_cause="Cause",
+                severity="major",
+                solution="Solution"
+            )
+        
+        with pytest.raises(ValueError, match="is not a valid SeverityLevel"):
+            Learnt.create_from_error(
+                error_type=ErrorType.OTHER,
+                problem_summary="Summary",
+                problematic_input="Input",
+                problematic_output="Output",
+                root_cause="Cause",
+                severity="extreme",
+                solution="Solution"
+            )
     
     def test_learnt_meta_rule_trigger(self):
         """Test meta-rule update triggering."""
@@ -195,6 +287,15 @@ class TestLearntModel:
         assert learnt_dict["problem_summary"] == "Serialization test"
         assert learnt_dict["type_of_error"] == "Misunderstanding"
         assert "timestamp_recorded" in learnt_dict
+        assert "meta_rule_update_callback" not in learnt_dict
+        schema = Learnt.model_json_schema()
+        assert "meta_rule_update_callback" not in schema["properties"]
+        assert schema["example"]["type_of_error"] == "IncorrectAction"
+        json.dumps(schema)
+        
+        # The returned containers are copies
+        learnt_dict["related_rule_ids"].append("rule-x")
+        assert original_learnt.related_rule_ids == []
         
         # Test from_dict
         restored_learnt = Learnt.from_dict(learnt_dict)
@@ -202,6 +303,137 @@ class TestLearntModel:
         assert restored_learnt.problem_summary == original_learnt.problem_summary
         assert restored_learnt.learnt_id == original_learnt.learnt_id
         assert restored_learnt.type_of_error == original_learnt.type_of_error
+        
+        # Test trusted from_dict skips validation but restores the same fields
+        trusted_learnt = Learnt.from_dict(original_learnt.to_dict(), trusted=True)
+        
+        assert trusted_learnt.to_dict() == original_learnt.to_dict()
+        assert trusted_learnt.timestamp_recorded == original_learnt.timestamp_recorded
+    
+    def test_learnt_to_json(self):
+        """Test that to_json encodes the same values as to_dict."""
+        learnt = Learnt.create_from_error(
+            error_type="UnmetUserGoal",
+            problem_summary="JSON test",
+            problematic_input="Input",
+            problematic_output="Output",
+            root_cause="Cause",
+            severity="minor",
+            solution="Solution",
+            tags=["json"]
+        )
+        
+        payload = learnt.to_json()
+        
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == learnt.to_dict()
+        
+        learnt.timestamp_recorded = datetime(2024, 1, 2, 3, 4, 5)
+        assert json.loads(learnt.to_json())["timestamp_recorded"] == "2024-01-02T03:04:05+00:00"
+    
+    def test_learnt_to_dict_covers_schema(self):
+        """Test that to_dict emits every field and copies every container field."""
+        learnt = Learnt.create_from_error(
+            error_type="Other",
+            problem_summary="Schema coverage",
+            problematic_input="Input",
+            problematic_output="Output",
+            root_cause="Cause",
+            severity="low",
+            solution="Solution"
+        )
+        
+        data = learnt.to_dict()
+        
+        assert list(data) == list(Learnt.model_fields)
+        for name, value in learnt.__dict__.items():
+            if isinstance(value, (list, dict)):
+                assert data[name] == value
+                assert data[name] is not value, name
+    
+    def test_learnt_related_rule_ids(self):
+        """Test adding and removing related rule IDs."""
+        learnt = Learnt.create_from_error(
+            error_type="IncorrectAction",
+            problem_summary="Related rules test",
+            problematic_input="Input",
+            problematic_output="Output",
+            root_cause="Cause",
+            severity="minor",
+            solution="Solution",
+            related_rule_ids=["rule-1", "rule-1"]
+        )
+        
+        learnt.add_related_rule_id("rule-2")
+        learnt.add_related_rule_id("rule-2")
+        assert learnt.related_rule_ids == ["rule-1", "rule-1", "rule-2"]
+        
+        # Duplicates from the input are removed one at a time
+        assert learnt.remove_related_rule_id("rule-1")
+        assert learnt.remove_related_rule_id("rule-1")
+        assert not learnt.remove_related_rule_id("rule-1")
+        
+        # Direct list changes are picked up
+        learnt.related_rule_ids.append("rule-3")
+        assert learnt.remove_related_rule_id("rule-3")
+        learnt.related_rule_ids = ["rule-4"]
+        learnt.add_related_rule_id("rule-2")
+        assert learnt.related_rule_ids == ["rule-4", "rule-2"]
+        assert not learnt.remove_related_rule_id("missing")
+        
+        # In-place item assignments are seen too
+        learnt.related_rule_ids = []
+        learnt.add_related_rule_id("x")
+        learnt.related_rule_ids[0] = "y"
+        learnt.add_related_rule_id("x")
+        assert learnt.related_rule_ids == ["y", "x"]
+        learnt.related_rule_ids[1] = "z"
+        assert not learnt.remove_related_rule_id("x")
+        learnt.add_related_rule_id("z")
+        assert learnt.related_rule_ids == ["y", "z"]
+        assert learnt.remove_related_rule_id("z")
+    
+    def test_learnt_string_representations(self):
+        """Test that str and repr follow changes to the displayed fields."""
+        learnt = Learnt.create_from_error(
+            error_type="IncorrectAction",
+            problem_summary="Repr test",
+            problematic_input="Input",
+            problematic_output="Output",
+            root_cause="Cause",
+            severity="minor",
+            solution="Solution"
+        )
+        
+        assert str(learnt) == "Learning: IncorrectAction - Repr test..."
+        assert repr(learnt).endswith("severity=minor, contributed=False)")
+        
+        learnt.trigger_meta_rule_update()
+        learnt.problem_summary = "Changed summary"
+        
+        assert str(learnt) == "Learning: IncorrectAction - Changed summary..."
+        assert repr(learnt).endswith("severity=minor, contributed=True)")
+        
+        copied = learnt.model_copy(update={"problem_summary": "Copied summary", "original_severity": "major"})
+        assert str(copied) == "Learning: IncorrectAction - Copied summary..."
+        assert repr(copied).endswith("severity=major, contributed=True)")
+        assert str(learnt) == "Learning: IncorrectAction - Changed summary..."
+    
+    def test_learnt_supports_weak_references(self):
+        """Test Learnt instances can be weakly referenced."""
+        import weakref
+        
+        learnt = Learnt.create_from_error(
+            error_type="IncorrectAction",
+            problem_summary="Weakref test",
+            problematic_input="Input",
+            problematic_output="Output",
+            root_cause="Cause",
+            severity="minor",
+            solution="Solution"
+        )
+        
+        assert weakref.ref(learnt)() is learnt
     
     def test_learnt_callback_system(self):
         """Test callback system for meta-rule updates."""
@@ -225,6 +457,26 @@ class TestLearntModel:
         assert result
         callback_mock.assert_called_once_with(learnt)
     
+    def test_learnt_callback_failure_is_logged(self, caplog):
+        """Test that a failing callback is logged and reported as False."""
+        learnt = Learnt.create_from_error(
+            error_type="IncorrectAction",
+            problem_summary="Callback failure test",
+            problematic_input="Input",
+            problematic_output="Output",
+            root_cause="Cause",
+            severity="major",
+            solution="Solution"
+        )
+        learnt.set_meta_rule_update_callback(Mock(side_effect=RuntimeError("boom")))
+        
+        with caplog.at_level("ERROR", logger="src.models.learnt"):
+            result = learnt.trigger_meta_rule_update()
+        
+        assert not result
+        assert "Error triggering meta-rule update" in caplog.text
+        assert "boom" in caplog.text
+    
     def test_learnt_verification_status_updates(self):
         """Test verification status update functionality."""
         learnt = Learnt.create_from_error(
@@ -244,6 +496,41 @@ class TestLearntModel:
         # Test invalid status
         with pytest.raises(ValueError, match="Status must be one of"):
             learnt.update_verification_status("invalid_status")
+    
+    def test_learnt_batch_mark_validated(self):
+        """Test batch validation defers meta-rule callbacks to a single call."""
+        learnts = [
+            Learnt.create_from_error(
+                error_type="IncorrectAction",
+                problem_summary=f"Batch problem {i}",
+                problematic_input="Input",
+                problematic_output="Output",
+                root_cause="Cause",
+                severity="minor",
+                solution="Solution",
+                verification_status="pending"
+            )
+            for i in range(3)
+        ]
+        learnts[0].trigger_meta_rule_update()
+        per_instance = Mock()
+        for learnt in learnts:
+            learnt.set_meta_rule_update_callback(per_instance)
+        
+        # Skipping the trigger leaves the learning uncontributed
+        learnts[1].update_verification_status("validated", skip_meta_trigger=True)
+        assert not learnts[1].contributed_to_meta_rule
+        
+        batch_callback = Mock()
+        ready = Learnt.batch_mark_validated(learnts, callback=batch_callback)
+        
+        assert ready == learnts[1:]
+        batch_callback.assert_called_once_with(learnts[1:])
+        per_instance.assert_not_called()
+        for learnt in learnts:
+            assert learnt.verification_status == "validated"
+            assert learnt.contributed_to_meta_rule
+            assert learnt.meta_rule_contribution.startswith("To avoid incorrectaction")
 
 
 class TestMetaRuleManager:
@@ -418,6 +705,56 @@ class TestMetaRuleManager:
         assert "IncorrectAction: 1 occurrences" in content
         assert "Actionable Guidance:" in content
         assert "Meta-Learning Principles:" in content
+        assert content.endswith("Source learnt experiences: 1*")
+        
+        # Rebuilding with unchanged inputs leaves the content untouched
+        last_updated = meta_rule.last_updated
+        manager._update_meta_rule_content()
+        assert meta_rule.last_updated is last_updated
+        
+        # A new experience changes the rendered counts
+        manager.add_learnt_experience(Learnt.create_from_error(
+            error_type="Other",
+            problem_summary="Second content test",
+            problematic_input="Input",
+            problematic_output="Output",
+            root_cause="Cause",
+            severity="low",
+            solution="Solution"
+        ))
+        content = meta_rule.content
+        assert "Total learnt experiences processed: 2" in content
+        assert "- Other: 1 occurrences (50.0%)" in content
+        assert content.endswith("Source learnt experiences: 2*")
+    
+    def test_add_learnt_experiences_batched(self):
+        """Test batch addition rebuilds the meta-rule content once."""
+        manager = MetaRuleManager()
+        learnts = [
+            Learnt.create_from_error(
+                error_type="IncorrectAction" if i % 2 else "Other",
+                problem_summary=f"Batch content test {i}",
+                problematic_input="Input",
+                problematic_output="Output",
+                root_cause="Cause",
+                severity="major",
+                solution="Solution"
+            )
+            for i in range(4)
+        ]
+        
+        with patch.object(manager, "_update_meta_rule_content", wraps=manager._update_meta_rule_content) as rebuild:
+            added = manager.add_learnt_experiences(learnts + learnts[:1])
+        
+        assert added == 4
+        assert rebuild.call_count == 1
+        assert manager.tracked_learnt_count == 4
+        assert "Total learnt experiences processed: 4" in manager.meta_rule.content
+        assert "- Other: 2 occurrences (50.0%)" in manager.meta_rule.content
+        
+        # The whole batch shares one clock reading
+        assert manager._aggregation_stats["last_updated"] == manager.meta_rule.last_updated.isoformat()
+        assert manager._batch_now is None
     
     def test_export_import_knowledge(self):
         """Test knowledge export and import functionality."""
@@ -480,6 +817,25 @@ class TestMetaRuleManager:
         # Try removing non-existent
         result = manager.remove_learnt_experience("non-existent")
         assert not result
+    
+    def test_remove_learnt_experience_reuses_rendered_sections(self):
+        """Test that a removal only rewrites the counts in the meta-rule content."""
+        manager = MetaRuleManager()
+        learnts = [
+            Learnt.create_from_error("IncorrectAction", f"Reuse test {i}", "I", "O", "C", "major", "S")
+            for i in range(2)
+        ]
+        manager.add_learnt_experiences(learnts)
+        before = manager.meta_rule.content
+        
+        with patch.object(manager, "_render_content_body", wraps=manager._render_content_body) as render:
+            assert manager.remove_learnt_experience(learnts[0].learnt_id)
+        
+        render.assert_not_called()
+        content = manager.meta_rule.content
+        assert "Total learnt experiences processed: 1" in content
+        assert content.endswith("Source learnt experiences: 1*")
+        assert content.split("## Key Learning Patterns:")[1][:-2] == before.split("## Key Learning Patterns:")[1][:-2]
 
 
 class TestModelIntegration:
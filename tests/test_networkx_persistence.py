@@ -10,7 +10,7 @@ from pathlib import Path
 from unittest.mock import patch, mock_open
 
 from src.database.networkx_adapter import NetworkXAdapter
-from src.database.base import DatabaseConnectionError
+from src.database.base import DatabaseConnectionError, ValidationError
 
 
 class TestNetworkXPersistence:
@@ -31,6 +31,9 @@ class TestNetworkXPersistence:
             backup_files = list(temp_file.parent.glob(f"{temp_file.stem}.bak*"))
             for backup in backup_files:
                 backup.unlink()
+            journal_file = temp_file.with_suffix('.jsonl')
+            if journal_file.exists():
+                journal_file.unlink()
         except:
             pass
     
@@ -124,14 +127,14 @@ class TestNetworkXPersistence:
         assert data_file.exists()
         
         # Add a node - should trigger auto-save
-        await adapter.create_node("Rule", {"title": "Auto-save test"})
+        node_id = await adapter.create_node("Rule", {"title": "Auto-save test"})
         
         # Verify file was updated
         with open(data_file, 'r') as f:
             data = json.load(f)
         
         assert data["metadata"]["node_count"] == 1
-        assert len(data["graph"]["nodes"]) == 1
+        assert data["labels"]["Rule"]["ids"] == [node_id]
         
         await adapter.disconnect()
     
@@ -285,6 +288,30 @@ class TestNetworkXPersistence:
         assert bak1.exists()
         assert bak2.exists()
     
+    @pytest.mark.asyncio
+    async def test_backup_interval(self, adapter_config):
+        """Test that backups are rate-limited when a backup interval is set."""
+        adapter_config["backup_interval_seconds"] = 3600
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        with patch.object(adapter, '_create_backup', wraps=adapter._create_backup) as mock_backup:
+            for i in range(5):
+                await adapter.create_node("Rule", {"title": f"Rule {i}"})
+            assert mock_backup.call_count == 1
+            
+            adapter._last_backup -= 3600
+            await adapter.create_node("Rule", {"title": "Later"})
+            assert mock_backup.call_count == 2
+        
+        await adapter.disconnect()
+        
+        adapter2 = NetworkXAdapter(adapter_config)
+        await adapter2.connect()
+        assert adapter2.get_graph_stats()["node_count"] == 6
+        await adapter2.disconnect()
+    
     @pytest.mark.asyncio 
     async def test_no_auto_save_mode(self, adapter_config):
         """Test adapter with auto-save disabled."""
@@ -313,4 +340,513 @@ class TestNetworkXPersistence:
             data = json.load(f)
         assert data["metadata"]["node_count"] == 1
         
-        await adapter.disconnect() 
\ No newline at end of file
+        await adapter.disconnect() 
+    
+    @pytest.mark.asyncio
+    async def test_bulk_create_saves_once(self, adapter_config):
+        """Test that bulk creation performs a single auto-save per batch."""
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        with patch.object(adapter, '_save_graph', wraps=adapter._save_graph) as mock_save:
+            node_ids = await adapter.create_nodes([
+                ("Rule", {"title": "Bulk Rule"}),
+                ("Learnt", {"solution": "Bulk solution"}),
+                ("Rule", {"title": "Another Rule"})
+            ])
+            assert mock_save.call_count == 1
+            
+            rel_ids = await adapter.create_relationships([
+                (node_ids[0], node_ids[1], "LEARNED_FROM", {"confidence": 0.9}),
+                (node_ids[2], node_ids[1], "LEARNED_FROM", None)
+            ])
+            assert mock_save.call_count == 2
+        
+        assert len(node_ids) == 3
+        assert len(rel_ids) == 2
+        assert len(adapter._nodes_by_label["Rule"]) == 2
+        
+        relationships = await adapter.get_relationships(node_ids[1])
+        assert {r["rel_id"] for r in relationships} == set(rel_ids)
+        
+        await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_create_validates_before_writing(self, adapter_config):
+        """Test that an invalid batch leaves the graph untouched."""
+        from src.database.base import NodeNotFoundError, ValidationError
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        with pytest.raises(ValidationError):
+            await adapter.create_nodes([
+                ("Rule", {"title": "Valid"}),
+                ("Rule", {"node_id": "reserved"})
+            ])
+        assert adapter.get_graph_stats()["node_count"] == 0
+        
+        node_id = await adapter.create_node("Rule", {"title": "Existing"})
+        with pytest.raises(NodeNotFoundError):
+            await adapter.create_relationships([
+                (node_id, "missing", "RELATES_TO", None)
+            ])
+        with pytest.raises(ValidationError):
+            await adapter.create_relationships([
+                (node_id, node_id, "RELATES TO", None)
+            ])
+        assert adapter.get_graph_stats()["edge_count"] == 0
+        
+        await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_create_single_label(self, adapter_config):
+        """Test creating many nodes under one label in a single batch."""
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        with patch.object(adapter, '_save_graph', wraps=adapter._save_graph) as mock_save:
+            node_ids = await adapter.create_nodes_bulk("Rule", [
+                {"title": f"Rule {i}"} for i in range(5)
+            ])
+            assert mock_save.call_count == 1
+        
+        assert len(node_ids) == 5
+        assert list(adapter._nodes_by_label["Rule"]) == node_ids
+        assert (await adapter.get_node(node_ids[3]))["title"] == "Rule 3"
+        
+        streamed = [node async for node in adapter.iter_nodes_by_label("Rule", limit=2)]
+        assert streamed == await adapter.get_nodes_by_label("Rule", limit=2)
+        
+        await adapter.update_node(node_ids[1], {"priority": 3})
+        columns = await adapter.get_nodes_by_label_columns("Rule")
+        assert columns["node_id"] == sorted(node_ids)
+        assert columns["title"] == [f"Rule {i}" for i in sorted(range(5), key=lambda i: node_ids[i])]
+        assert columns["priority"].count(None) == 4
+        
+        await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_upsert_nodes(self, adapter_config):
+        """Test upserts create missing nodes and merge into existing ones."""
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        assert await adapter.upsert_node("Rule", "r1", {"title": "First", "priority": 1}) == "r1"
+        
+        with patch.object(adapter, '_save_graph', wraps=adapter._save_graph) as mock_save:
+            node_ids = await adapter.upsert_nodes_bulk("Rule", [
+                ("r1", {"priority": 2}),
+                ("r2", {"title": "Second", "priority": 2})
+            ])
+            assert mock_save.call_count == 1
+        
+        assert node_ids == ["r1", "r2"]
+        first = await adapter.get_node("r1")
+        assert first["title"] == "First"
+        assert first["priority"] == 2
+        
+        matches = await adapter.get_nodes_by_label("Rule", filters={"priority": 2})
+        assert [node["node_id"] for node in matches] == ["r1", "r2"]
+        
+        await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_keyset_pagination(self, adapter_config):
+        """Test paging through a label with cursors visits every node once."""
+        import functools
+        from src.database.base import GraphDatabase
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        node_ids = await adapter.create_nodes_bulk("Rule", [
+            {"title": f"Rule {i}", "even": i % 2 == 0} for i in range(7)
+        ])
+        
+        # Both the adapter's override and the base class default
+        for get_page in (adapter.get_nodes_page, functools.partial(GraphDatabase.get_nodes_page, adapter)):
+            seen = []
+            cursor = None
+            while True:
+                page, cursor = await get_page("Rule", cursor=cursor, page_size=3)
+                seen.extend(node["node_id"] for node in page)
+                if cursor is None:
+                    break
+            assert seen == sorted(node_ids)
+        
+        page, cursor = await adapter.get_nodes_page("Rule", filters={"even": True}, page_size=10)
+        assert len(page) == 4
+        assert cursor is None
+        
+        for get_page in (adapter.get_nodes_page, functools.partial(GraphDatabase.get_nodes_page, adapter)):
+            with pytest.raises(ValidationError):
+                await get_page("Rule", page_size=0)
+        
+        await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_traverse_diamond(self, adapter_config):
+        """Test traversal reports each reachable node once at its shortest distance."""
+        from src.database.base import GraphDatabase
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        top, left, right, bottom, tail = await adapter.create_nodes_bulk("Rule", [
+            {"title": name} for name in ("top", "left", "right", "bottom", "tail")
+        ])
+        await adapter.create_relationships([
+            (top, left, "NEXT", None),
+            (top, right, "NEXT", None),
+            (left, bottom, "NEXT", None),
+            (right, bottom, "NEXT", None),
+            (bottom, tail, "RELATES_TO", None)
+        ])
+        
+        expected = {left: 1, right: 1, bottom: 2, tail: 3}
+        assert await adapter.traverse(top) == expected
+        assert await GraphDatabase.traverse(adapter, top) == expected
+        assert await adapter.traverse(top, max_depth=1) == {left: 1, right: 1}
+        assert await adapter.traverse(top, relationship_type="NEXT") == {left: 1, right: 1, bottom: 2}
+        assert await adapter.traverse("missing") == {}
+        
+        await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_relationship_index(self, adapter_config):
+        """Test that relationships stay indexed by ID across deletes and reloads."""
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        a, b, c = await adapter.create_nodes_bulk("Rule", [{"title": name} for name in "abc"])
+        ab, bc = await adapter.create_relationships([
+            (a, b, "NEXT", None),
+            (b, c, "NEXT", None)
+        ])
+        
+        # Re-linking a node pair replaces the previous edge
+        ca = await adapter.create_relationship(c, a, "NEXT")
+        ac = await adapter.create_relationship(a, c, "RELATES_TO")
+        assert adapter._rel_index.keys() == {ab, bc, ac}
+        assert await adapter.delete_relationship(ca) is False
+        assert (await adapter.execute_query("count edges"))["count"] == adapter.graph.number_of_edges() == 3
+        
+        assert all(adapter._edge_rel[idx] == rel_id for rel_id, idx in adapter._rel_index.items())
+        
+        await adapter.delete_node(c)
+        assert adapter._rel_index.keys() == {ab}
+        assert (await adapter.execute_query("list edges"))["edges"] == [(a, b)]
+        assert adapter.get_graph_stats()["edge_count"] == adapter.graph.number_of_edges() == 1
+        await adapter.disconnect()
+        
+        adapter2 = NetworkXAdapter(adapter_config)
+        await adapter2.connect()
+        assert adapter2._rel_index.keys() == {ab}
+        assert adapter2.get_graph_stats()["is_connected"] is True
+        assert await adapter2.delete_relationship(ab) is True
+        assert adapter2.get_graph_stats()["edge_count"] == 0
+        assert adapter2.get_graph_stats()["is_connected"] is False
+        assert await adapter2.delete_relationship(ab) is False
+        
+        await adapter2.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_read_optimized_relationships(self, adapter_config):
+        """Test that the CSR snapshot answers like the adjacency and tracks writes."""
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        a, b, c = await adapter.create_nodes_bulk("Rule", [{"title": name} for name in "abc"])
+        await adapter.create_relationships([
+            (a, b, "NEXT", None),
+            (c, a, "RELATES_TO", {"weight": 0.5})
+        ])
+        expected = {
+            direction: await adapter.get_relationships(a, direction=direction)
+            for direction in ("incoming", "outgoing", "both")
+        }
+        await adapter.disconnect()
+        
+        adapter_config["read_optimized"] = True
+        adapter2 = NetworkXAdapter(adapter_config)
+        await adapter2.connect()
+        assert adapter2._csr is not None
+        
+        for direction, relationships in expected.items():
+            assert await adapter2.get_relationships(a, direction=direction) == relationships
+        assert await adapter2.get_relationships(a, relationship_type="NEXT") == expected["outgoing"]
+        
+        await adapter2.create_relationship(b, c, "NEXT")
+        assert adapter2._csr is None
+        assert [rel["end_node_id"] for rel in await adapter2.get_relationships(c)] == [a, c]
+        
+        await adapter2.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_debounced_auto_save(self, adapter_config):
+        """Test that debounced auto-save coalesces writes into one save."""
+        adapter_config["auto_save_debounce_ms"] = 20
+        data_file = Path(adapter_config["data_file"])
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        with patch.object(adapter, '_save_graph', wraps=adapter._save_graph) as mock_save:
+            rule_id = await adapter.create_node("Rule", {"title": "Debounced"})
+            await adapter.update_node(rule_id, {"title": "Debounced update"})
+            await adapter.create_node("Learnt", {"solution": "Debounced solution"})
+            assert mock_save.call_count == 0
+            
+            await asyncio.sleep(0.1)
+            assert mock_save.call_count == 1
+        
+        with open(data_file, 'r') as f:
+            data = json.load(f)
+        assert data["metadata"]["node_count"] == 2
+        
+        await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_save_runs_off_the_event_loop(self, adapter_config):
+        """Test that mutations made while a save is writing stay journaled."""
+        import threading
+        
+        adapter_config["journal"] = True
+        journal_file = Path(adapter_config["data_file"]).with_suffix('.jsonl')
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        early_id = await adapter.create_node("Rule", {"title": "Early"})
+        
+        release = threading.Event()
+        write_data_file = adapter._write_data_file
+        
+        def blocked_write(*args):
+            release.wait(5)
+            write_data_file(*args)
+        
+        with patch.object(adapter, '_write_data_file', side_effect=blocked_write):
+            save = asyncio.ensure_future(adapter._save_graph())
+            await asyncio.sleep(0.05)
+            late_id = await adapter.create_node("Rule", {"title": "Late"})
+            release.set()
+            await save
+        
+        with open(adapter_config["data_file"], 'r') as f:
+            data = json.load(f)
+        assert data["labels"]["Rule"]["ids"] == [early_id]
+        assert len(journal_file.read_bytes().splitlines()) == 1
+        
+        # Simulate a crash: the late node is only in the journal
+        adapter2 = NetworkXAdapter(adapter_config)
+        await adapter2.connect()
+        assert (await adapter2.get_node(late_id))["title"] == "Late"
+        await adapter2.disconnect()
+        
+        await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_debounced_auto_save_max_pending(self, adapter_config):
+        """Test that debounced auto-save saves early once enough mutations are pending."""
+        adapter_config["auto_save_debounce_ms"] = 10_000
+        adapter_config["auto_save_max_pending"] = 3
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        with patch.object(adapter, '_save_graph', wraps=adapter._save_graph) as mock_save:
+            for i in range(7):
+                await adapter.create_node("Rule", {"title": f"Rule {i}"})
+            assert mock_save.call_count == 2
+            assert adapter._pending_mutations == 1
+        
+        await adapter.disconnect()
+        assert adapter._pending_mutations == 0
+    
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending_changes(self, adapter_config):
+        """Test that flush() persists pending debounced changes immediately."""
+        adapter_config["auto_save_debounce_ms"] = 10_000
+        data_file = Path(adapter_config["data_file"])
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        await adapter.create_node("Rule", {"title": "Pending"})
+        
+        await adapter.flush()
+        
+        with open(data_file, 'r') as f:
+            data = json.load(f)
+        assert data["metadata"]["node_count"] == 1
+        assert adapter._flush_handle is None
+        
+        await adapter.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_journal_replay_and_compaction(self, adapter_config):
+        """Test that journaled mutations survive a crash and are compacted on disconnect."""
+        adapter_config["journal"] = True
+        journal_file = Path(adapter_config["data_file"]).with_suffix('.jsonl')
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        with patch.object(adapter, '_save_graph', wraps=adapter._save_graph) as mock_save:
+            rule_id = await adapter.create_node("Rule", {"title": "Journaled"})
+            learnt_id, doomed_id = await adapter.create_nodes([
+                ("Learnt", {"solution": "Journaled solution"}),
+                ("Learnt", {"solution": "Doomed"})
+            ])
+            await adapter.update_node(rule_id, {"priority": 4})
+            rel_id = await adapter.create_relationship(rule_id, learnt_id, "RELATES_TO")
+            doomed_rel_id = await adapter.create_relationship(rule_id, doomed_id, "RELATES_TO")
+            await adapter.delete_relationship(doomed_rel_id)
+            await adapter.delete_node(doomed_id)
+            assert mock_save.call_count == 0
+        
+        assert len(journal_file.read_bytes().splitlines()) == 8
+        
+        # Simulate a crash mid-write, then reload without disconnecting
+        with open(journal_file, 'ab') as f:
+            f.write(b'{"op": "add_no')
+        
+        adapter2 = NetworkXAdapter(adapter_config)
+        await adapter2.connect()
+        
+        rule = await adapter2.get_node(rule_id)
+        assert rule["title"] == "Journaled"
+        assert rule["priority"] == 4
+        assert await adapter2.get_node(doomed_id) is None
+        assert [rel["rel_id"] for rel in await adapter2.get_relationships(rule_id)] == [rel_id]
+        assert [node["node_id"] for node in await adapter2.get_nodes_by_label("Rule", filters={"priority": 4})] == [rule_id]
+        
+        await adapter2.disconnect()
+        assert not journal_file.exists()
+        
+        adapter3 = NetworkXAdapter(adapter_config)
+        await adapter3.connect()
+        assert adapter3.get_graph_stats()["node_count"] == 2
+        
+        # A tiny size limit compacts after every mutation
+        adapter3.journal_max_bytes = 1
+        with patch.object(adapter3, '_save_graph', wraps=adapter3._save_graph) as mock_save:
+            await adapter3.create_node("Rule", {"title": "Compacted"})
+            assert mock_save.call_count == 1
+        assert journal_file.read_bytes() == b""
+        
+        await adapter3.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_filtered_lookup_uses_attribute_index(self, adapter_config):
+        """Test that filtered label lookups stay correct across updates, deletes and reloads."""
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        frontend_id = await adapter.create_node("Rule", {"category": "frontend", "priority": 1})
+        backend_id = await adapter.create_node("Rule", {"category": "backend", "priority": 1})
+        await adapter.create_node("Learnt", {"category": "frontend"})
+        
+        results = await adapter.get_nodes_by_label("Rule", filters={"category": "frontend"})
+        assert [node["node_id"] for node in results] == [frontend_id]
+        
+        await adapter.update_node(backend_id, {"category": "frontend"})
+        results = await adapter.get_nodes_by_label("Rule", filters={"category": "frontend", "priority": 1})
+        assert {node["node_id"] for node in results} == {frontend_id, backend_id}
+        assert await adapter.get_nodes_by_label("Rule", filters={"category": "backend"}) == []
+        
+        await adapter.delete_node(frontend_id)
+        await adapter.disconnect()
+        
+        adapter2 = NetworkXAdapter(adapter_config)
+        await adapter2.connect()
+        results = await adapter2.get_nodes_by_label("Rule", filters={"category": "frontend"})
+        assert [node["node_id"] for node in results] == [backend_id]
+        
+        await adapter2.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_columnar_layout_round_trip(self, adapter_config):
+        """Test that sparse properties and edges survive the columnar layout."""
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        first = await adapter.create_node("Rule", {"title": "First", "priority": None})
+        second = await adapter.create_node("Rule", {"title": "Second", "tags": ["a", "b"]})
+        rel_id = await adapter.create_relationship(first, second, "RELATES_TO", {"weight": 0.5})
+        await adapter.disconnect()
+        
+        with open(adapter_config["data_file"], 'r') as f:
+            data = json.load(f)
+        assert set(data["labels"]["Rule"]["props"]) == {"title", "priority", "tags"}
+        
+        adapter2 = NetworkXAdapter(adapter_config)
+        await adapter2.connect()
+        
+        first_node = await adapter2.get_node(first)
+        assert first_node["priority"] is None
+        assert "tags" not in first_node
+        second_node = await adapter2.get_node(second)
+        assert second_node["tags"] == ["a", "b"]
+        assert "priority" not in second_node
+        
+        relationships = await adapter2.get_relationships(first)
+        assert relationships[0]["rel_id"] == rel_id
+        assert relationships[0]["weight"] == 0.5
+        
+        await adapter2.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_columnar_layout_dictionary_encodes_repeated_strings(self, adapter_config):
+        """Test that low-cardinality string columns are stored once per distinct value."""
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        hub = await adapter.create_node("Rule", {"title": "Hub"})
+        node_ids = await adapter.create_nodes([
+            ("Learnt", {"category": "frontend" if i % 3 else None, "title": f"Learnt {i}"})
+            for i in range(6)
+        ])
+        await adapter.create_relationships([(hub, node_id, "RELATES_TO", None) for node_id in node_ids])
+        await adapter.disconnect()
+        
+        with open(adapter_config["data_file"], 'r') as f:
+            data = json.load(f)
+        assert data["edges"]["coded"]["type"]["values"] == ["RELATES_TO"]
+        assert data["labels"]["Learnt"]["coded"]["category"]["values"] == [None, "frontend"]
+        assert "title" in data["labels"]["Learnt"]["props"]
+        
+        adapter2 = NetworkXAdapter(adapter_config)
+        await adapter2.connect()
+        
+        assert (await adapter2.get_node(node_ids[0]))["category"] is None
+        assert (await adapter2.get_node(node_ids[1]))["category"] == "frontend"
+        relationships = await adapter2.get_relationships(hub)
+        assert len(relationships) == 6
+        assert {rel["type"] for rel in relationships} == {"RELATES_TO"}
+        
+        await adapter2.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_legacy_node_link_file_loads(self, adapter_config):
+        """Test that data files in the older node-link layout still load."""
+        legacy = {
+            "graph": {
+                "directed": False,
+                "multigraph": False,
+                "graph": {},
+                "nodes": [{"id": "r1", "node_id": "r1", "label": "Rule", "title": "Legacy"}],
+                "links": []
+            },
+            "metadata": {"relationship_counter": 0}
+        }
+        with open(adapter_config["data_file"], 'w') as f:
+            json.dump(legacy, f)
+        
+        adapter = NetworkXAdapter(adapter_config)
+        await adapter.connect()
+        
+        node = await adapter.get_node("r1")
+        assert node["title"] == "Legacy"
+        assert adapter._nodes_by_label == {"Rule": {"r1": None}}
+        
+        await adapter.disconnect()
@@ -69,7 +69,7 @@ class TestCreateRule:
             
             assert result == "test-rule-id"
             mock_database.create_node.assert_called_once()
-            mock_database.disconnect.assert_called_once()
+            mock_database.disconnect.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_create_rule_empty_name(self):
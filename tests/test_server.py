@@ -631,6 +631,33 @@ class TestIntegration:
 # Performance Tests
 # ================================
 
+class TestLifespan:
+    """Test application startup and shutdown."""
+    
+    @patch('src.server.close_database', new_callable=AsyncMock)
+    @patch('src.server.get_database', new_callable=AsyncMock)
+    @patch('src.server.validate_learning_db_connection', new_callable=AsyncMock, return_value=True)
+    @patch('src.server.validate_rule_db_connection', new_callable=AsyncMock, return_value=True)
+    def test_startup_ensures_constraints(self, mock_rule_db, mock_learning_db, mock_get_db, mock_close):
+        """Test node_id constraints are created at startup when configured."""
+        db = MagicMock()
+        db.config = {"ensure_constraints": True}
+        db.ensure_constraints = AsyncMock(return_value=2)
+        mock_get_db.return_value = db
+        
+        with TestClient(app):
+            pass
+        
+        db.ensure_constraints.assert_awaited_once()
+        
+        db.config = {"ensure_constraints": False}
+        db.ensure_constraints.reset_mock()
+        with TestClient(app):
+            pass
+        
+        db.ensure_constraints.assert_not_awaited()
+
+
 class TestPerformance:
     """Test performance scenarios."""
 